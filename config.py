@@ -63,4 +63,221 @@ class Config:
         
         # Post quality thresholds
         self.quality_threshold = 6  # Minimum quality score to accept a post
-        self.max_generation_attempts = 3  # Maximum attempts to generate a quality post
\ No newline at end of file
+        self.max_generation_attempts = 3  # Maximum attempts to generate a quality post
+        
+        # News fetching settings
+        self.fetch_settings = {
+            'concurrent': True,  # Fetch all sources in parallel instead of one after another
+            'max_workers': 8,  # Upper bound on simultaneous source downloads
+            'source_timeout': 10,  # Seconds allowed per source (connect + read)
+            'overall_deadline': 30,  # Seconds before we stop waiting and use whatever finished
+            'cache_file': 'news_cache.json'  # ETag/Last-Modified cache; set to None to disable
+        }
+        
+        # Shared HTTP client settings (one pooled keep-alive session per host)
+        self.http_settings = {
+            'pool_connections': 4,  # Number of host pools to keep per session
+            'pool_maxsize': 10,  # Connections kept alive per host
+            'connect_timeout': 5,  # Seconds to establish a connection
+            'read_timeout': 60,  # Seconds to wait for a response (LLM calls can be slow)
+            'max_retries': 3,  # Retries for connection errors and 5xx on idempotent requests
+            'backoff_factor': 0.5,  # Exponential backoff between retries
+            'retry_statuses': [502, 503, 504]  # Statuses retried for idempotent requests
+        }
+        
+        # Posting history settings
+        self.history_settings = {
+            'history_file': 'posted_articles_history.json',
+            'posted_index_file': 'posted_urls.db',  # On-disk index of posted URLs
+            'bloom_capacity': 100000,  # Expected number of posted URLs (sizes the Bloom filter)
+            'bloom_error_rate': 0.001  # Bloom filter false-positive rate
+        }
+        
+        # Article ranking settings
+        self.ranking_settings = {
+            'mode': 'keyword',  # 'keyword' (default) or 'bm25' (needs numpy and scipy)
+            'bm25_scale': 10,  # Best BM25 score in a batch is scaled to this many points
+            'bm25_shortlist_margin': 50,  # Articles beyond k kept for dedup after BM25 scoring
+            'bm25_k1': 1.5,
+            'bm25_b': 0.75,
+            # Topic profile for BM25: term or phrase -> weight
+            'topic_profile': {
+                'new model': 3, 'release': 2, 'launch': 2, 'breakthrough': 2,
+                'state-of-the-art': 2, 'benchmark': 1.5, 'outperforms': 1.5,
+                'open source': 1.5, 'llm': 1.5, 'large language model': 2,
+                'reasoning': 1, 'agents': 1, 'multimodal': 1, 'fine-tuning': 1,
+                'openai': 1, 'anthropic': 1, 'claude': 1, 'gpt': 1, 'llama': 1,
+                'mistral': 1, 'gemini': 1, 'deepmind': 1, 'groq': 0.5
+            }
+        }
+        
+        # LLM response cache (set 'enabled' to False to always call the API)
+        self.llm_cache = {
+            'enabled': True,
+            'cache_file': 'llm_cache.db',
+            'max_entries': 500,  # Least recently used entries are evicted beyond this
+            'max_size_mb': 20,
+            'ttl_hours': 72  # Cached responses older than this are not reused
+        }
+        
+        # Best-of-N generation: candidates are generated in parallel and scored by ContentEvaluator
+        self.generation_settings = {
+            'best_of_n': 3,  # Candidates per round (1 = generate one post at a time)
+            'max_workers': 3,  # Maximum concurrent LLM requests
+            'good_enough_score': 8  # Stop waiting for other candidates once one scores this high (max 9)
+        }
+        
+        # Streaming generation: posts are checked as they arrive and stopped early if doomed
+        self.streaming_settings = {
+            'enabled': True,
+            'min_post_chars': 300,  # Shorter finished posts are rejected
+            'max_post_chars': 2000,  # Abort once a post grows past this
+            'paragraph_break_within': 700,  # Abort if no blank line has appeared by this length
+            'max_regenerations': 1,  # Extra attempts after a post is rejected
+            'forbidden_phrases': [
+                'as an ai language model', 'as a large language model', 'as an ai assistant',
+                'i found this interesting article',
+                'in conclusion', 'here is the post', "here's the post"
+            ]
+        }
+        
+        # LLM API rate limits and retries (defaults match Groq's free tier for llama3-70b)
+        self.llm_rate_limits = {
+            'groq': {
+                'requests_per_minute': 30,
+                'tokens_per_minute': 6000,
+                'max_attempts': 4,  # Total attempts per call, including the first
+                'backoff_base': 1.0,  # Seconds; doubled on every retry, with full jitter
+                'backoff_max': 30,
+                'call_deadline': 90,  # A call (including waits and retries) never takes longer
+                'retry_statuses': [429, 500, 502, 503, 504]
+            },
+            'local': {
+                # A local server has no quota; these only keep bursts from queueing up
+                'requests_per_minute': 600,
+                'tokens_per_minute': 1000000,
+                'max_attempts': 2,
+                'backoff_base': 0.2,
+                'backoff_max': 2,
+                'call_deadline': 60,
+                'retry_statuses': [502, 503, 504]
+            }
+        }
+        
+        # LLM providers (selected with the LLM_PROVIDER environment variable);
+        # any OpenAI-compatible server works, e.g. llama.cpp, vLLM or Ollama
+        self.llm_providers = {
+            'groq': {
+                'label': 'Groq API',
+                'base_url': 'https://api.groq.com/openai/v1',
+                'model': 'llama3-70b-8192',
+                'requires_api_key': True
+            },
+            'local': {
+                'label': 'local LLM server',
+                'base_url': 'http://localhost:8080/v1',
+                'model': 'llama-3.1-8b-instruct',
+                'max_concurrency': 2,  # Parallel requests the server is allowed to handle
+                'cpu_only': False,  # Use the small model below on machines without a GPU
+                'cpu_model': 'qwen2.5-1.5b-instruct',
+                'cpu_max_tokens': 400  # Caps completions so CPU generation stays fast
+            }
+        }
+        
+        # Prompt budgets: article text is stripped of HTML and cut to these token estimates
+        self.prompt_settings = {
+            'title_token_budget': 40,
+            'summary_token_budget': 200,
+            'comment_token_budget': 150
+        }
+        
+        # Comment replies: new comments on a post are answered in batched LLM requests
+        self.reply_settings = {
+            'batch_size': 10,  # Comments per request
+            'tokens_per_reply': 150  # Completion budget per comment in a batch
+        }
+        
+        # Background pre-generation: the next post is prepared while the scheduler waits
+        self.pregeneration_settings = {
+            'enabled': True,
+            'refresh_minutes': 60,  # Re-rank the news and check the prepared post this often
+            'top_picks': 3,  # The post's article is picked from the top N; a prepared post is kept while its article stays there
+            'backup_candidates': 2,  # Extra posts prepared in case the main one can't be used
+            'max_age_hours': 12  # Prepared posts older than this are discarded
+        }
+        
+        # Hedged LLM requests: if the primary provider is slower than usual, the same
+        # request also goes to the secondary provider and the first answer wins
+        self.hedging_settings = {
+            'enabled': False,  # Needs a reachable secondary, e.g. a local server for Groq
+            'secondary_provider': 'local',
+            'percentile': 95,  # Hedge once the primary is slower than this share of its recent calls
+            'min_samples': 10,  # Recent calls needed before the percentile is trusted
+            'default_delay': 10,  # Seconds to wait before hedging until then
+            'min_delay': 2,
+            'max_delay': 30
+        }
+        
+        # Learned engagement scorer: a logistic regression trained offline on past
+        # posts and their engagement replaces the rule-based quality score
+        self.engagement_model = {
+            'enabled': False,  # Train first with: python main.py --train-engagement posts.jsonl
+            'model_file': 'engagement_model.json',
+            'quantile': 0.5  # Posts with engagement above this quantile count as engaging when training
+        }
+        
+        # LinkedIn authentication settings
+        self.auth_settings = {
+            'identity_file': 'linkedin_identity.json',  # Cached person ID and profile
+            'identity_ttl_hours': 168,  # Re-fetch the profile after this long (it rarely changes)
+            'token_file': 'linkedin_token.json',  # Access and refresh tokens, kept between runs (0600)
+            'refresh_margin_minutes': 1440,  # Refresh the access token this long before it expires
+            'login_timeout_seconds': 300,  # How long to wait for the browser login
+            'scope': 'openid profile email w_member_social'  # OAuth scopes requested at login
+        }
+        
+        # Post outbox: drafts are persisted before publishing and delivered in the background
+        self.outbox_settings = {
+            'outbox_file': 'post_outbox.db',
+            'max_attempts': 5,  # Sends per post before giving up
+            'backoff_base': 30,  # Seconds; doubles after each failed attempt (with jitter)
+            'backoff_max': 1800,
+            'retry_unverified': False,  # Resend a post whose outcome is unknown even if recent posts can't be checked
+            'wait_seconds': 120  # How long a posting cycle waits for delivery before leaving it to the background
+        }
+        
+        # Multi-account mode: one process posts for several profiles and company pages,
+        # sharing one news fetch per cycle
+        self.multi_account_settings = {
+            'enabled': False,
+            'max_concurrent_accounts': 3,  # Accounts generating and publishing at the same time
+            'ranked_articles': 10,  # Articles ranked per cycle, shared by all accounts
+            'accounts': {
+                # 'alice': {
+                #     'label': 'Alice Smith',
+                #     'client_id_env': 'ALICE_LINKEDIN_CLIENT_ID',  # Environment variables with the app credentials
+                #     'client_secret_env': 'ALICE_LINKEDIN_CLIENT_SECRET',
+                #     'styles': ['thought_leader', 'data_driven'],  # Post styles to use (all if omitted)
+                #     'min_hours_between_posts': 20,
+                #     'post_window_hours': (8, 18)  # Only post between these hours (local time)
+                # },
+                # 'acme': {
+                #     'label': 'Acme Corp',
+                #     'client_id_env': 'ACME_LINKEDIN_CLIENT_ID',
+                #     'client_secret_env': 'ACME_LINKEDIN_CLIENT_SECRET',
+                #     'author': 'urn:li:organization:12345',  # Post as a company page the member administers
+                #     'scope': 'openid profile email w_member_social w_organization_social'  # Defaults to this for pages
+                # }
+            }
+        }
+        
+        # Media posts: images and documents uploaded with LinkedIn's register-upload flow
+        self.media_settings = {
+            'api_url': None,  # Assets API base URL; the LinkedIn API if None (point at a local server for testing)
+            'recipes': {
+                'image': 'urn:li:digitalmediaRecipe:feedshare-image',
+                'document': 'urn:li:digitalmediaRecipe:feedshare-document'
+            },
+            'part_concurrency': 4,  # Parts of a multipart upload sent at the same time
+            'upload_timeout': 300  # Seconds to wait for one upload request to finish
+        }
\ No newline at end of file
@@ -0,0 +1,105 @@
+"""
+LLM response cache module for the LinkedIn AI News Bot
+"""
+
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+
+class ResponseCache:
+    """Disk-backed, content-addressed cache of LLM completions
+    
+    Entries are keyed by a hash of the full request (model, messages and
+    sampling parameters), so a retry or restart that sends exactly the same
+    request gets the earlier completion back without calling the API. Old
+    entries expire after a TTL, and the least recently used entries are
+    evicted once the cache grows past its entry or size limit.
+    """
+    
+    def __init__(self, cache_file="llm_cache.db", max_entries=500, max_size_mb=20, ttl_hours=72):
+        """Open (or create) the cache
+        
+        Args:
+            cache_file (str): Path to the SQLite database
+            max_entries (int): Maximum number of cached completions
+            max_size_mb (float): Maximum total size of cached completions
+            ttl_hours (float): Age after which an entry is no longer used
+        """
+        self.cache_file = cache_file
+        self.max_entries = max_entries
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self.ttl_seconds = ttl_hours * 3600
+        self._lock = threading.Lock()
+        
+        self.conn = sqlite3.connect(cache_file, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " content TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " last_used REAL NOT NULL"
+            ")"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)")
+        self.conn.commit()
+    
+    @staticmethod
+    def make_key(payload):
+        """Hash a request payload into a cache key"""
+        canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+    
+    def get(self, key):
+        """Return the cached completion for a key, or None"""
+        now = time.time()
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT content, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            
+            content, created_at = row
+            if now - created_at > self.ttl_seconds:
+                self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.conn.commit()
+                return None
+            
+            self.conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+            self.conn.commit()
+            return content
+    
+    def set(self, key, content):
+        """Store a completion and evict old entries if over the limits"""
+        now = time.time()
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses (key, content, size, created_at, last_used) VALUES (?, ?, ?, ?, ?)",
+                (key, content, len(content.encode('utf-8')), now, now)
+            )
+            self._evict(now)
+            self.conn.commit()
+    
+    def _evict(self, now):
+        """Drop expired entries, then least recently used ones over the limits"""
+        self.conn.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl_seconds,))
+        
+        count, total_size = self.conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if count <= self.max_entries and total_size <= self.max_bytes:
+            return
+        
+        for key, size in self.conn.execute("SELECT key, size FROM responses ORDER BY last_used").fetchall():
+            if count <= self.max_entries and total_size <= self.max_bytes:
+                break
+            self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            count -= 1
+            total_size -= size
+    
+    def clear(self):
+        """Remove every cached completion"""
+        with self._lock:
+            self.conn.execute("DELETE FROM responses")
+            self.conn.commit()
\ No newline at end of file
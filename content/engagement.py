@@ -0,0 +1,176 @@
+"""
+Learned engagement prediction module for the LinkedIn AI News Bot
+"""
+
+import os
+import json
+from config import Config
+from utils.console import Console
+from content.evaluator import FEATURE_NAMES, extract_features
+
+try:
+    import numpy as np # type: ignore
+except ImportError:  # NumPy is optional; without it the evaluator keeps its rules
+    np = None
+
+_COLUMNS = {name: i for i, name in enumerate(FEATURE_NAMES)}
+
+def engagement_available():
+    """Whether the optional NumPy dependency is installed"""
+    return np is not None
+
+def design_matrix(features):
+    """Turn raw evaluator features into model inputs
+    
+    Besides the raw counts, adds the shapes the hand-written rules encode
+    (length and hashtag/emoji bands, keyword coverage) so a linear model can
+    learn how much each of them actually matters.
+    """
+    X = np.asarray(features, dtype=np.float64).reshape(-1, len(FEATURE_NAMES))
+    column = lambda name: X[:, _COLUMNS[name]]
+    
+    length = column('length')
+    hashtags = column('hashtags')
+    emoji_runs = column('emoji_runs')
+    title_keywords = column('title_keywords')
+    
+    return np.column_stack([
+        np.log1p(length),
+        (length >= 700) & (length <= 1300),
+        (length >= 500) & (length <= 1500),
+        np.minimum(column('paragraphs'), 10),
+        np.minimum(hashtags, 10),
+        (hashtags >= 3) & (hashtags <= 5),
+        column('has_question'),
+        column('has_link'),
+        np.minimum(emoji_runs, 10),
+        (emoji_runs >= 1) & (emoji_runs <= 3),
+        np.where(title_keywords > 0, column('keyword_matches') / np.maximum(title_keywords, 1), 1.0)
+    ]).astype(np.float64)
+
+class EngagementModel:
+    """Logistic regression predicting whether a post will engage well
+    
+    Trained offline on the features of past posts and their engagement, then
+    used by ContentEvaluator in place of the fixed rules. Inference is one
+    standardization and one dot product per post.
+    """
+    
+    def __init__(self, weights=None, bias=0.0, mean=None, std=None):
+        """Initialize with learned parameters (or untrained)"""
+        self.weights = None if weights is None else np.asarray(weights, dtype=np.float64)
+        self.bias = float(bias)
+        self.mean = None if mean is None else np.asarray(mean, dtype=np.float64)
+        self.std = None if std is None else np.asarray(std, dtype=np.float64)
+    
+    def fit(self, features, labels, l2=0.01, learning_rate=0.5, iterations=2000):
+        """Fit the model with batch gradient descent
+        
+        Args:
+            features: Evaluator feature rows (see FEATURE_NAMES)
+            labels: 1 for posts that engaged well, 0 otherwise
+            l2 (float): L2 regularization strength
+            learning_rate (float): Gradient descent step size
+            iterations (int): Number of full-batch steps
+        
+        Returns:
+            EngagementModel: self
+        """
+        X = design_matrix(features)
+        y = np.asarray(labels, dtype=np.float64)
+        
+        self.mean = X.mean(axis=0)
+        self.std = X.std(axis=0)
+        self.std[self.std == 0] = 1.0
+        X = (X - self.mean) / self.std
+        
+        self.weights = np.zeros(X.shape[1])
+        self.bias = 0.0
+        n = len(y)
+        
+        for _ in range(iterations):
+            p = 1.0 / (1.0 + np.exp(-(X @ self.weights + self.bias)))
+            error = p - y
+            self.weights -= learning_rate * (X.T @ error / n + l2 * self.weights)
+            self.bias -= learning_rate * error.mean()
+        
+        return self
+    
+    def predict_proba(self, features):
+        """Probability of good engagement for each feature row"""
+        X = (design_matrix(features) - self.mean) / self.std
+        return 1.0 / (1.0 + np.exp(-(X @ self.weights + self.bias)))
+    
+    def save(self, path):
+        """Save the learned parameters as JSON"""
+        with open(path, 'w') as f:
+            json.dump({
+                'feature_names': list(FEATURE_NAMES),
+                'weights': self.weights.tolist(),
+                'bias': self.bias,
+                'mean': self.mean.tolist(),
+                'std': self.std.tolist()
+            }, f, indent=2)
+    
+    @classmethod
+    def load(cls, path):
+        """Load a model saved with save()
+        
+        Raises:
+            ValueError: If the model was trained on different features
+        """
+        with open(path, 'r') as f:
+            data = json.load(f)
+        
+        if data.get('feature_names') != list(FEATURE_NAMES):
+            raise ValueError("Engagement model was trained on a different feature set")
+        
+        return cls(data['weights'], data['bias'], data['mean'], data['std'])
+
+def train_from_records(records, quantile=0.5, **fit_options):
+    """Train a model from past posts and their engagement
+    
+    Args:
+        records (list): Dicts with the post 'content', its article 'title' and
+            'link', and an 'engagement' number (e.g. reactions + comments)
+        quantile (float): Posts above this engagement quantile count as engaging
+        **fit_options: Passed on to EngagementModel.fit
+    
+    Returns:
+        EngagementModel: The trained model
+    """
+    features = [
+        extract_features(record['content'], {'title': record.get('title', ''), 'link': record.get('link', '')})
+        for record in records
+    ]
+    engagement = np.array([float(record['engagement']) for record in records])
+    labels = engagement > np.quantile(engagement, quantile)
+    
+    return EngagementModel().fit(features, labels, **fit_options)
+
+def load_engagement_model():
+    """Load the configured engagement model, if enabled
+    
+    Returns:
+        EngagementModel: The model, or None to keep the rule-based scores
+    """
+    settings = Config().engagement_model
+    if not settings['enabled']:
+        return None
+    
+    if not engagement_available():
+        Console.warning("NumPy is not installed; using rule-based post scores")
+        return None
+    
+    if not os.path.exists(settings['model_file']):
+        Console.warning(f"Engagement model {settings['model_file']} not found; using rule-based post scores")
+        return None
+    
+    try:
+        model = EngagementModel.load(settings['model_file'])
+    except (OSError, ValueError, KeyError) as e:
+        Console.error(f"Error loading engagement model: {str(e)}")
+        return None
+    
+    Console.info("Scoring posts with the learned engagement model")
+    return model
\ No newline at end of file
@@ -3,64 +3,151 @@ Content evaluation module for the LinkedIn AI News Bot
 """
 
 import re
+import functools
+
+try:
+    import numpy as np # type: ignore
+except ImportError:  # NumPy is optional; batch scoring falls back to pure Python
+    np = None
+
+_WORD_PATTERN = re.compile(r'\w+')
+_EMOJI_PATTERN = re.compile("["
+                            u"\U0001F600-\U0001F64F"  # emoticons
+                            u"\U0001F300-\U0001F5FF"  # symbols & pictographs
+                            u"\U0001F680-\U0001F6FF"  # transport & map symbols
+                            u"\U0001F700-\U0001F77F"  # alchemical symbols
+                            u"\U0001F780-\U0001F7FF"  # Geometric Shapes
+                            u"\U0001F800-\U0001F8FF"  # Supplemental Arrows-C
+                            u"\U0001F900-\U0001F9FF"  # Supplemental Symbols and Pictographs
+                            u"\U0001FA00-\U0001FA6F"  # Chess Symbols
+                            u"\U0001FA70-\U0001FAFF"  # Symbols and Pictographs Extended-A
+                            u"\U00002702-\U000027B0"  # Dingbats
+                            "]+")
+
+# Columns of the feature matrix returned by evaluate_batch
+FEATURE_NAMES = (
+    'length',            # Characters in the post
+    'paragraphs',        # Blocks separated by blank lines
+    'hashtags',          # '#' characters
+    'has_question',      # 1 if the post asks anything
+    'has_link',          # 1 if the article link is included
+    'emoji_runs',        # Runs of consecutive emoji
+    'title_keywords',    # Meaningful (5+ letter) words in the article title
+    'keyword_matches'    # How many of those appear in the post
+)
+
+@functools.lru_cache(maxsize=1024)
+def _title_keywords(title):
+    """Meaningful words of an article title (cached, titles repeat across candidates)"""
+    return frozenset(word for word in _WORD_PATTERN.findall(title.lower()) if len(word) > 4)
+
+def extract_features(content, article):
+    """Extract the scoring features of one post
+    
+    Returns:
+        tuple: Feature values in FEATURE_NAMES order
+    """
+    title_keywords = _title_keywords(article['title'])
+    content_words = set(_WORD_PATTERN.findall(content.lower()))
+    
+    return (
+        len(content),
+        content.count('\n\n') + 1,
+        content.count('#'),
+        int('?' in content),
+        int(article['link'] in content),
+        len(_EMOJI_PATTERN.findall(content)),
+        len(title_keywords),
+        len(title_keywords & content_words)
+    )
+
+def _score_row(features):
+    """Score one feature row (pure Python)"""
+    length, paragraphs, hashtags, has_question, has_link, emoji_runs, title_keywords, keyword_matches = features
+    score = 0
+    
+    # Posts between 700-1300 chars tend to perform best
+    if 700 <= length <= 1300:
+        score += 2
+    elif 500 <= length <= 1500:
+        score += 1
+    
+    score += paragraphs >= 3
+    score += 3 <= hashtags <= 5
+    score += has_question
+    score += 2 * has_link
+    score += 1 <= emoji_runs <= 3
+    score += keyword_matches >= title_keywords // 2
+    return int(score)
+
+def score_features(features):
+    """Score a feature matrix, one row per post
+    
+    Returns:
+        list: Integer score per row
+    """
+    if np is None or not len(features):
+        return [_score_row(row) for row in features]
+    
+    matrix = np.asarray(features, dtype=np.int64)
+    length, paragraphs, hashtags, has_question, has_link, emoji_runs, title_keywords, keyword_matches = matrix.T
+    
+    scores = (
+        np.where((length >= 700) & (length <= 1300), 2, ((length >= 500) & (length <= 1500)).astype(np.int64))
+        + (paragraphs >= 3)
+        + ((hashtags >= 3) & (hashtags <= 5))
+        + has_question
+        + 2 * has_link
+        + ((emoji_runs >= 1) & (emoji_runs <= 3))
+        + (keyword_matches >= title_keywords // 2)
+    )
+    return scores.tolist()
+
+# Highest score the rules can give; learned probabilities are mapped onto the same scale
+MAX_SCORE = 9
 
 class ContentEvaluator:
     """Class for evaluating the quality of generated content"""
     
+    def __init__(self, model=None):
+        """Initialize the evaluator
+        
+        Args:
+            model (EngagementModel, optional): Learned engagement model used in
+                place of the rules; its probability is scaled to 0-MAX_SCORE so
+                quality thresholds keep their meaning
+        """
+        self.model = model
+    
+    def _model_scores(self, features):
+        """Scale the model's engagement probabilities to the rule score range"""
+        return [round(MAX_SCORE * p, 2) for p in self.model.predict_proba(features).tolist()]
+    
     def evaluate(self, content, article):
         """Rate the quality of the generated post to ensure high standards"""
-        score = 0
-        
-        # Check length - posts between 700-1300 chars tend to perform best
-        length = len(content)
-        if 700 <= length <= 1300:
-            score += 2
-        elif 500 <= length <= 1500:
-            score += 1
-        
-        # Check for paragraph breaks
-        paragraphs = content.split('\n\n')
-        if len(paragraphs) >= 3:
-            score += 1
-        
-        # Check for hashtags
-        hashtag_count = content.count('#')
-        if 3 <= hashtag_count <= 5:
-            score += 1
-        
-        # Check for questions (engagement)
-        if '?' in content:
-            score += 1
-        
-        # Check for link inclusion
-        if article['link'] in content:
-            score += 2
-        
-        # Check for emoji usage (but not excessive)
-        emoji_pattern = re.compile("["
-                               u"\U0001F600-\U0001F64F"  # emoticons
-                               u"\U0001F300-\U0001F5FF"  # symbols & pictographs
-                               u"\U0001F680-\U0001F6FF"  # transport & map symbols
-                               u"\U0001F700-\U0001F77F"  # alchemical symbols
-                               u"\U0001F780-\U0001F7FF"  # Geometric Shapes
-                               u"\U0001F800-\U0001F8FF"  # Supplemental Arrows-C
-                               u"\U0001F900-\U0001F9FF"  # Supplemental Symbols and Pictographs
-                               u"\U0001FA00-\U0001FA6F"  # Chess Symbols
-                               u"\U0001FA70-\U0001FAFF"  # Symbols and Pictographs Extended-A
-                               u"\U00002702-\U000027B0"  # Dingbats
-                               "]+")
-        
-        emoji_count = len(emoji_pattern.findall(content))
-        if 1 <= emoji_count <= 3:
-            score += 1
+        features = extract_features(content, article)
+        if self.model is not None:
+            return self._model_scores([features])[0]
+        return _score_row(features)
+    
+    def evaluate_batch(self, contents, articles):
+        """Rate many posts at once
         
-        # Check that title keywords are included
-        title_words = set(re.findall(r'\w+', article['title'].lower()))
-        content_words = set(re.findall(r'\w+', content.lower()))
-        title_keywords = [word for word in title_words if len(word) > 4]  # Only meaningful words
-        keyword_matches = sum(1 for word in title_keywords if word in content_words)
+        Args:
+            contents (list): Post texts
+            articles (list or dict): The article of each post, or one article shared by all
         
-        if keyword_matches >= len(title_keywords) // 2:
-            score += 1
+        Returns:
+            tuple: (scores, features) - a list of scores and the feature
+                matrix (a NumPy array if available, else a list of tuples) with
+                columns in FEATURE_NAMES order
+        """
+        if isinstance(articles, dict):
+            features = [extract_features(content, articles) for content in contents]
+        else:
+            features = [extract_features(content, article) for content, article in zip(contents, articles)]
         
-        return score
\ No newline at end of file
+        scores = self._model_scores(features) if self.model is not None else score_features(features)
+        if np is not None:
+            features = np.array(features, dtype=np.int64).reshape(len(features), len(FEATURE_NAMES))
+        return scores, features
\ No newline at end of file
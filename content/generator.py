@@ -2,173 +2,448 @@
 Content generation module for the LinkedIn AI News Bot
 """
 
+import time
+import json
 import random
-import requests # type: ignore
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
 from config import Config
 from utils.console import Console, Colors
+from content.cache import ResponseCache
+from content.evaluator import ContentEvaluator
+from content import streaming, prompting
+from content.providers import create_provider, LinkedEvent
 
 class ContentGenerator:
     """Class for generating content using LLMs"""
     
-    def __init__(self, api_key, provider='groq'):
+    def __init__(self, api_key, provider='groq', evaluator=None):
         """Initialize with API key and provider selection"""
         self.api_key = api_key
         self.provider = provider
         self.config = Config()
         
+        # Only backends that need a key get it, so a local server never sees the Groq key
+        provider_settings = self.config.llm_providers.get(provider, {})
+        self.llm = create_provider(provider, api_key if provider_settings.get('requires_api_key') else None)
+        
+        # Secondary provider for hedged requests; only backends that need a key get ours
+        self.hedging_settings = self.config.hedging_settings
+        self.hedge_llm = None
+        secondary = self.hedging_settings['secondary_provider']
+        if self.hedging_settings['enabled'] and self.llm is not None and secondary != provider:
+            secondary_settings = self.config.llm_providers.get(secondary, {})
+            self.hedge_llm = create_provider(secondary, api_key if secondary_settings.get('requires_api_key') else None)
+        self.evaluator = evaluator or ContentEvaluator()
+        self.generation_settings = self.config.generation_settings
+        self.streaming_settings = self.config.streaming_settings
+        self.prompt_settings = self.config.prompt_settings
+        self.reply_settings = self.config.reply_settings
+        self.last_stream_result = None
+        
         # Load post styles from config
         self.post_styles = self.config.post_styles
     
-    def generate_post(self, article):
-        """Generate a high-quality LinkedIn post for the given article"""
-        # Try multiple times to get a high-quality post
+        # Cache of LLM responses, so retries and restarts don't repeat API calls
+        cache_settings = self.config.llm_cache
+        self.response_cache = None
+        if cache_settings.get('enabled'):
+            self.response_cache = ResponseCache(
+                cache_settings['cache_file'],
+                max_entries=cache_settings['max_entries'],
+                max_size_mb=cache_settings['max_size_mb'],
+                ttl_hours=cache_settings['ttl_hours']
+            )
+    
+    def generate_post(self, article, use_cache=True, styles=None):
+        """Generate a high-quality LinkedIn post for the given article
+        
+        Args:
+            article (dict): The article to write about
+            use_cache (bool): Reuse a cached completion for an identical request;
+                pass False when a fresh variation is wanted
+            styles (list, optional): Names of the post styles to choose from; all if not given
+        """
+        if self._llm_available() and self.generation_settings['best_of_n'] > 1:
+            return self._generate_best_of_n(article, use_cache, styles)
+        
+        best_content, best_score = None, -1
+        
+        # Try multiple times to get a post that meets the quality threshold
         for attempt in range(self.config.max_generation_attempts):
             Console.info(f"Generation attempt {attempt+1}/{self.config.max_generation_attempts}")
             
-            if self.provider == 'groq':
-                content = self._generate_with_groq(article)
-            else:
-                content = self._generate_with_local_llm(article)
+            # Later attempts need a fresh completion, not the cached one
+            content = self._generate_with_llm(
+                article,
+                style_name=random.choice(styles) if styles else None,
+                use_cache=use_cache and attempt == 0
+            )
             
             if not content:
-                Console.warning("Generation failed, using fallback template")
-                content = self._generate_better_fallback_post(article)
-                return content
+                break
+            
+            # Make sure it contains the link
+            if article['link'] not in content:
+                Console.info("Adding article link to content")
+                content += f"\n\nRead more: {article['link']}"
             
-            # Accept if content exists
-            if content:
-                # Make sure it contains the link
-                if article['link'] not in content:
-                    Console.info("Adding article link to content")
-                    content += f"\n\nRead more: {article['link']}"
+            score = self.evaluator.evaluate(content, article)
+            if score >= self.config.quality_threshold:
                 return content
+            
+            Console.warning(f"Post scored {score}, below the quality threshold of {self.config.quality_threshold}")
+            if score > best_score:
+                best_content, best_score = content, score
         
-        # After multiple attempts, use a fallback template
-        Console.warning("Max attempts reached, using fallback template")
-        return self._generate_better_fallback_post(article)
+        return self._best_or_fallback(article, best_content, best_score)
     
-    def _generate_with_groq(self, article):
-        """Generate LinkedIn posts using Groq API with enhanced prompting"""
-        if not self.api_key:
-            Console.warning("Groq API key not found. Using fallback post template.")
+    def _generate_best_of_n(self, article, use_cache=True, styles=None):
+        """Generate several candidates in parallel and keep the best one
+        
+        Each round fires best_of_n generations concurrently, spread across the
+        post styles, and scores every candidate with the ContentEvaluator as it
+        arrives. A candidate at or above good_enough_score ends the round
+        immediately: queued generations are cancelled and ones already in
+        flight are told not to retry. Otherwise the highest scorer is used if
+        it meets the quality threshold, and a new round is started if not.
+        
+        Args:
+            article (dict): The article to write about
+            use_cache (bool): Whether the first round may reuse cached completions
+            styles (list, optional): Names of the post styles to spread candidates across
+        
+        Returns:
+            str: The best post content
+        """
+        settings = self.generation_settings
+        num_candidates = settings['best_of_n']
+        good_enough = settings['good_enough_score']
+        style_names = list(styles or self.post_styles.keys())
+        
+        best_content, best_score = None, -1
+        
+        for attempt in range(self.config.max_generation_attempts):
+            Console.info(f"Generation round {attempt+1}/{self.config.max_generation_attempts}: "
+                         f"{num_candidates} candidates in parallel")
+            
+            random.shuffle(style_names)
+            cancel_event = threading.Event()
+            executor = ThreadPoolExecutor(max_workers=min(num_candidates, settings['max_workers']))
+            
+            try:
+                futures = [
+                    executor.submit(
+                        self._generate_with_llm,
+                        article,
+                        style_name=style_names[i % len(style_names)],
+                        # A repeated style or a later round would only get the cached candidate back
+                        use_cache=use_cache and attempt == 0 and i < len(style_names),
+                        cancel_event=cancel_event
+                    )
+                    for i in range(num_candidates)
+                ]
+                
+                for future in as_completed(futures):
+                    try:
+                        content = future.result()
+                    except Exception as e:
+                        Console.error(f"Candidate generation failed: {str(e)}")
+                        continue
+                    
+                    if not content:
+                        continue
+                    
+                    score = self.evaluator.evaluate(content, article)
+                    Console.info(f"Candidate scored {score}")
+                    if score > best_score:
+                        best_content, best_score = content, score
+                    
+                    if score >= good_enough:
+                        Console.success(f"Candidate reached {score}, cancelling the remaining generations")
+                        break
+            finally:
+                cancel_event.set()
+                executor.shutdown(wait=False, cancel_futures=True)
+            
+            if best_score >= self.config.quality_threshold:
+                Console.success(f"Selected best candidate with score {best_score}")
+                return best_content
+            
+            if best_content:
+                Console.warning(f"Best candidate scored {best_score}, below the quality threshold of {self.config.quality_threshold}")
+        
+        return self._best_or_fallback(article, best_content, best_score)
+    
+    def _best_or_fallback(self, article, best_content, best_score):
+        """Return the best generated post, or the fallback template if none was generated
+        
+        The template is never scored against a real post: it always scores
+        well, whatever the article is about.
+        """
+        if best_content is None:
+            Console.warning("Generation failed, using fallback template")
+            return self._generate_better_fallback_post(article)
+        
+        Console.warning(f"Max attempts reached, using best post (score {best_score})")
+        return best_content
+    
+    def _llm_available(self):
+        """Whether the configured LLM provider can be used"""
+        return self.llm is not None and self.llm.available()
+    
+    def _generate_with_llm(self, article, style_name=None, use_cache=True, cancel_event=None, retries_left=None):
+        """Generate LinkedIn posts using the configured LLM with enhanced prompting
+        
+        Args:
+            article (dict): The article to write about
+            style_name (str, optional): Post style to use; random if not given
+            use_cache (bool): Whether a cached completion may be reused
+            cancel_event (threading.Event, optional): Set when the result is no longer needed
+            retries_left (int, optional): Regenerations allowed for a rejected post
+        """
+        if retries_left is None:
+            retries_left = self.streaming_settings['max_regenerations']
+        
+        if not self._llm_available():
+            Console.warning("LLM provider not configured. Using fallback post template.")
+            return None
+        
+        if cancel_event is not None and cancel_event.is_set():
             return None
         
         # Choose style - can be fixed or randomized
-        chosen_style = random.choice(list(self.post_styles.keys()))
+        chosen_style = style_name or random.choice(list(self.post_styles.keys()))
         style = self.post_styles[chosen_style]
         
         Console.info(f"Using '{chosen_style}' post style")
         
-        # Create enhanced prompt with detailed instructions for more human-like content
-        prompt = f"""
-        You're a professional AI specialist creating an ENGAGING, AUTHENTIC LinkedIn post about this AI news. 
-        Your post should sound completely human-written, conversational, and insightful.
-        
-        ARTICLE INFORMATION:
-        Title: {article['title']}
-        Summary: {article.get('summary', 'No summary available')}
-        Source: {article.get('source', 'Unknown source')}
-        Link: {article['link']}
-        
-        POST STYLE:
-        - Write in a {style['tone']} tone that sounds like a real person
-        - {style['approach']}
-        - {style['unique']}
-        
-        CONTENT STRUCTURE:
-        1. OPENER: Begin with a thought-provoking question, surprising fact, or personal observation related to the news (NOT just "Here's an update")
-        2. YOUR TAKE: Share what YOU find interesting about this development (as if you're a real AI professional)
-        3. BROADER IMPACT: Connect this to industry trends or how it might change things
-        4. PERSONAL ANGLE: Add a brief reflection on how this relates to your experience or perspective
-        5. ENGAGEMENT: End with a SPECIFIC, THOUGHT-PROVOKING question (not generic "what do you think?")
-        6. LINK: Include the article link organically within the text
-        7. HASHTAGS: Add 3-4 relevant, specific hashtags
-        
-        WRITING GUIDELINES:
-        - Use a natural, conversational voice like you're talking to a colleague
-        - Include occasional "I" statements to make it personal
-        - Use short paragraphs with line breaks between them
-        - Include 1-2 relevant emojis placed naturally, not at the beginning of sentences
-        - Use varied sentence structures (mix of short and medium sentences)
-        - Sound like a thoughtful professional with genuine curiosity
-        - Avoid jargon unless you briefly explain it
-        - Use 1-2 rhetorical devices like metaphors or analogies where appropriate
-        
-        WHAT MAKES IT SOUND HUMAN:
-        - Express genuine excitement, concern, or curiosity
-        - Mention a personal connection to the topic if relevant
-        - Add light personality through word choice and phrasing
-        - Include a small detail or example that shows thought
-        - Avoid perfectly structured paragraphs - add some natural variation
-        - Occasionally use casual transitions like "And yet..." or "But here's the thing..."
-        
-        WHAT TO AVOID:
-        - Generic openings like "I found this interesting article"
-        - Any hint of marketing language or corporate speak
-        - Perfect parallelism in structure that sounds robotic
-        - Excessive formality or academic tone
-        - Overly complex or dense sentences
-        - Any mention of algorithms, AI generation, or non-human aspects
-        
-        Return ONLY the finished post text without any additional explanations or formatting.
+        prompt = prompting.post_prompt(article, style, self.prompt_settings)
+        
+        Console.info(f"Using model: {self.llm.model}")
+        
+        Console.info(f"Sending request to {self.llm.label}...")
+        post_content = self._chat_completion(
+            prompt,
+            temperature=0.75,  # Slightly increased for more creative variation
+            max_tokens=1200,
+            use_cache=use_cache,
+            validators=self._post_validators(),
+            cancel_event=cancel_event
+        )
+        
+        # Quality check (a streamed post that failed its validators comes back as None)
+        if post_content is None or len(post_content) < self.streaming_settings['min_post_chars']:
+            if retries_left <= 0 or (cancel_event is not None and cancel_event.is_set()):
+                return None
+            Console.warning("Generated content was rejected, regenerating...")
+            return self._generate_with_llm(article, chosen_style, use_cache=False,
+                                            cancel_event=cancel_event, retries_left=retries_left - 1)
+        
+        Console.success(f"Successfully generated content ({len(post_content)} characters)")
+        
+        # Check that it contains the link
+        if article['link'] not in post_content:
+            post_content += f"\n\nRead more: {article['link']}"
+        
+        # Only return the clean post content
+        return post_content
+    
+    def _post_validators(self):
+        """Incremental checks that abort a streamed post as soon as it is doomed"""
+        settings = self.streaming_settings
+        return [
+            streaming.forbidden_phrases(settings['forbidden_phrases']),
+            streaming.max_length(settings['max_post_chars']),
+            streaming.paragraph_break_within(settings['paragraph_break_within']),
+            streaming.min_length(settings['min_post_chars'])
+        ]
+    
+    def _chat_completion(self, prompt, temperature, max_tokens, use_cache=True,
+                         validators=None, cancel_event=None, json_mode=False):
+        """Send a chat completion request to the LLM provider, going through the response cache
+        
+        When streaming is enabled the completion is read incrementally and
+        checked by the validators as it arrives; a stream they abort returns
+        None and is not cached. JSON-mode requests are never streamed.
+        
+        Args:
+            prompt (str): The user prompt
+            temperature (float): Sampling temperature
+            max_tokens (int): Completion token limit
+            use_cache (bool): Whether to read from the cache (results are always stored)
+            validators (list, optional): Streaming validators, see content.streaming
+            cancel_event (threading.Event, optional): Set to abandon a streamed request
+            json_mode (bool): Ask the model for a single JSON object
+        
+        Returns:
+            str: The completion text, or None if the request failed
         """
+        data = self._request_data(self.llm, prompt, temperature, max_tokens, json_mode)
         
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
+        cache_key = ResponseCache.make_key(data) if self.response_cache else None
+        if cache_key and use_cache:
+            cached_content = self.response_cache.get(cache_key)
+            if cached_content is not None:
+                Console.info("Using cached LLM response")
+                return cached_content
         
-        # Use only llama3-70b-8192 which is excellent for professional LinkedIn posts
-        model = "llama3-70b-8192"
-        Console.info(f"Using model: {model}")
-        
-        data = {
-            "model": model,
-            "messages": [
-                {"role": "user", "content": prompt}
-            ],
-            "temperature": 0.75,  # Slightly increased for more creative variation
-            "max_tokens": 1200
-        }
+        stream = self.streaming_settings['enabled'] and not json_mode
+        
+        if self.hedge_llm is not None and self.hedge_llm.available():
+            content = self._hedged_completion(prompt, temperature, max_tokens, json_mode,
+                                              stream, validators, cancel_event)
+        else:
+            content = self._provider_completion(self.llm, data, prompt, stream, validators, cancel_event)
+        
+        if content is not None and cache_key:
+            self.response_cache.set(cache_key, content)
+        
+        return content
+    
+    def _request_data(self, provider, prompt, temperature, max_tokens, json_mode=False):
+        """Build a provider's request body"""
+        data = provider.payload(prompt, temperature, max_tokens)
+        if json_mode:
+            data["response_format"] = {"type": "json_object"}
+        return data
+    
+    def _provider_completion(self, provider, data, prompt, stream=False, validators=None, cancel_event=None):
+        """Send one chat completion request to a provider
+        
+        Returns:
+            str: The completion text, or None if the request failed or was aborted
+        """
+        if stream:
+            data = dict(data, stream=True)
+        
+        prompt_tokens = prompting.estimate_tokens(prompt)
         
         try:
-            Console.info("Sending request to Groq API...")
-            response = requests.post(
-                "https://api.groq.com/openai/v1/chat/completions",
-                headers=headers,
-                json=data
-            )
+            with provider.slot():
+                started_at = time.monotonic()
+                response = provider.post(
+                    data,
+                    estimated_tokens=prompt_tokens + data["max_tokens"],
+                    stream=stream
+                )
             
-            if response.status_code == 200:
-                result = response.json()
-                post_content = result['choices'][0]['message']['content'].strip()
-                
-                # Quality check
-                if len(post_content) < 300:
-                    Console.warning("Generated content is too short, regenerating...")
-                    return self._generate_with_groq(article)
-                    
-                Console.success(f"Successfully generated content ({len(post_content)} characters)")
-                
-                # Check that it contains the link
-                if article['link'] not in post_content:
-                    post_content += f"\n\nRead more: {article['link']}"
+                if response.status_code != 200:
+                    Console.error(f"Error with {provider.label}: {response.status_code}")
+                    Console.error(f"Response: {response.text}")
+                    return None
+            
+                if stream:
+                    stream_result = self._read_stream(response, started_at, validators, cancel_event)
+                    self._log_token_usage(prompt_tokens, stream_result.content, stream_result.usage)
+                    if stream_result.aborted:
+                        return None
+                    content = stream_result.content
+                else:
+                    result = response.json()
+                    content = result['choices'][0]['message']['content'].strip()
+                    self._log_token_usage(prompt_tokens, content, result.get('usage'))
                 
-                # Only return the clean post content
-                return post_content
-            else:
-                Console.error(f"Error with Groq API: {response.status_code}")
-                Console.error(f"Response: {response.text}")
-                return None
+            provider.latency.record(time.monotonic() - started_at)
+            return content
         except Exception as e:
-            Console.error(f"Exception with Groq API: {str(e)}")
+            Console.error(f"Exception with {provider.label}: {str(e)}")
             return None
     
-    def _generate_with_local_llm(self, article):
-        """Alternative method to generate with a local LLM or other providers"""
-        # This is a placeholder for integration with other LLMs
-        Console.warning("Local LLM generation not implemented yet")
-        return None
+    def _hedge_delay(self):
+        """How long to wait for the primary provider before hedging"""
+        settings = self.hedging_settings
+        delay = None
+        if len(self.llm.latency) >= settings['min_samples']:
+            delay = self.llm.latency.percentile(settings['percentile'])
+        if delay is None:
+            delay = settings['default_delay']
+        return min(max(delay, settings['min_delay']), settings['max_delay'])
+    
+    def _hedged_completion(self, prompt, temperature, max_tokens, json_mode=False,
+                           stream=False, validators=None, cancel_event=None):
+        """Send a request to the primary provider and hedge with the secondary if it is slow
+        
+        If the primary hasn't answered within its recent latency percentile,
+        the same request goes to the secondary provider and whichever returns
+        a usable completion first wins. The loser is cancelled: a streamed
+        response is closed at its next chunk, a non-streamed one is left to
+        finish in the background and ignored.
+        
+        Returns:
+            str: The first usable completion, or None if both failed
+        """
+        delay = self._hedge_delay()
+        attempts = {}
+        executor = ThreadPoolExecutor(max_workers=2)
+        
+        def submit(provider):
+            attempt_cancel = LinkedEvent(cancel_event)
+            data = self._request_data(provider, prompt, temperature, max_tokens, json_mode)
+            future = executor.submit(self._provider_completion, provider, data, prompt,
+                                     stream, validators, attempt_cancel)
+            attempts[future] = (provider, attempt_cancel)
+        
+        try:
+            submit(self.llm)
+            done, pending = wait(list(attempts), timeout=delay)
+            if pending and not (cancel_event is not None and cancel_event.is_set()):
+                Console.warning(f"{self.llm.label} has not answered within {delay:.1f}s, "
+                                f"hedging with {self.hedge_llm.label}")
+                submit(self.hedge_llm)
+            
+            pending = set(attempts)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    content = future.result()
+                    if content is None:
+                        continue
+                    
+                    provider, _ = attempts[future]
+                    for other in pending:
+                        attempts[other][1].set()
+                    if len(attempts) > 1:
+                        Console.info(f"Using the completion from {provider.label}")
+                    return content
+            
+            return None
+        finally:
+            executor.shutdown(wait=False)
+    
+    def _read_stream(self, response, started_at, validators=None, cancel_event=None):
+        """Read a streamed completion and report its timing
+        
+        Returns:
+            StreamResult: The streamed text, timing and abort reason
+        """
+        result = streaming.read_stream(
+            response,
+            validators=validators,
+            cancel_event=cancel_event,
+            started_at=started_at
+        )
+        self.last_stream_result = result
+        
+        if result.aborted:
+            Console.warning(f"Stopped generation early: {result.abort_reason} ({result.summary()})")
+        else:
+            Console.info(f"Streamed {result.summary()}")
+        return result
+        
+    def _log_token_usage(self, estimated_prompt_tokens, content, usage=None):
+        """Log prompt and completion token counts, preferring the server's own"""
+        usage = usage or {}
+        prompt_tokens = usage.get('prompt_tokens')
+        completion_tokens = usage.get('completion_tokens')
+        
+        prompt_text = f"{prompt_tokens}" if prompt_tokens is not None else f"~{estimated_prompt_tokens}"
+        if completion_tokens is not None:
+            completion_text = f"{completion_tokens}"
+        else:
+            completion_text = f"~{prompting.estimate_tokens(content)}"
+        
+        Console.info(f"Tokens: {prompt_text} prompt, {completion_text} completion")
     
     def _generate_fallback_post(self, article):
         """Generate a simple fallback post if LLM generation fails"""
@@ -233,10 +508,10 @@ Check out the details: {link}
         # Return only the clean post content
         return random.choice(templates)
     
-    def create_post_variation(self, article, variation_type="weekend"):
+    def create_post_variation(self, article, variation_type="weekend", use_cache=True):
         """Create variations of posts for different contexts"""
-        if not self.api_key:
-            Console.warning("LLM API key not found. Using fallback post.")
+        if not self._llm_available():
+            Console.warning("LLM provider not configured. Using fallback post.")
             return self._generate_better_fallback_post(article)
             
         variations = {
@@ -261,182 +536,147 @@ Check out the details: {link}
         variation = variations.get(variation_type, variations["weekend"])
         Console.info(f"Creating {variation_type} variation with temp={variation['temp']}")
         
-        # Updated prompt for more engaging, human content
-        prompt = f"""
-        You're a professional AI specialist creating an AUTHENTIC, ENGAGING LinkedIn weekend post about this AI news.
-        Make it sound completely human-written, as if a real person wrote it during their weekend.
-        
-        ARTICLE INFORMATION:
-        Title: {article['title']}
-        Summary: {article.get('summary', 'No summary available')}
-        Source: {article.get('source', 'Unknown source')}
-        Link: {article['link']}
-        
-        WEEKEND POST STYLE:
-        - Write in a relaxed, thoughtful weekend tone
-        - {variation['instruction']}
-        - Include a personal reflection element that feels authentic
-        
-        MAKE IT HUMAN AND ENGAGING:
-        - Begin with a weekend context (e.g., "Taking some time this Sunday to think about...")
-        - Share a genuine-sounding personal reaction to the news
-        - Use casual language with occasional "thinking out loud" elements
-        - Add a touch of weekend mindset (more reflective, big-picture thinking)
-        - Include one specific detail or example that shows thoughtful engagement
-        - End with a question that invites genuine conversation
-        
-        AVOID ANYTHING THAT SOUNDS:
-        - Corporate or overly polished
-        - Generic or templated
-        - Too formal or structured
-        - Like it was written by AI
-        
-        Return ONLY the finished post text without any additional explanations or formatting.
-        """
+        prompt = prompting.variation_prompt(article, variation['instruction'], self.prompt_settings)
         
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
+        Console.info(f"Using model: {self.llm.model}")
         
-        # Use llama3-70b-8192 for consistent high-quality output
-        model = "llama3-70b-8192"
-        Console.info(f"Using model: {model}")
-        
-        data = {
-            "model": model,
-            "messages": [
-                {"role": "user", "content": prompt}
-            ],
-            "temperature": variation['temp'],
-            "max_tokens": 1200
-        }
+        Console.info(f"Sending request to {self.llm.label}...")
+        post_content = self._chat_completion(
+            prompt,
+            temperature=variation['temp'],
+            max_tokens=1200,
+            use_cache=use_cache
+        )
         
-        try:
-            Console.info("Sending request to Groq API...")
-            response = requests.post(
-                "https://api.groq.com/openai/v1/chat/completions",
-                headers=headers,
-                json=data
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                post_content = result['choices'][0]['message']['content'].strip()
-                
-                Console.success(f"Successfully generated {variation_type} post variant")
-                
-                # Make sure it contains the link
-                if article['link'] not in post_content:
-                    post_content += f"\n\nRead more: {article['link']}"
-                
-                # Return only the clean post content
-                return post_content
-            else:
-                Console.error(f"Error with Groq API: {response.status_code}")
-                Console.error(f"Response: {response.text}")
-                return None
-        except Exception as e:
-            Console.error(f"Exception with Groq API: {str(e)}")
+        if post_content is None:
             return None
 
-    def generate_comment_reply(self, comment, article_title, personal_tone=True):
+        Console.success(f"Successfully generated {variation_type} post variant")
+        
+        # Make sure it contains the link
+        if article['link'] not in post_content:
+            post_content += f"\n\nRead more: {article['link']}"
+        
+        # Return only the clean post content
+        return post_content
+    
+    def generate_comment_reply(self, comment, article_title, personal_tone=True, use_cache=True):
         """Generate a reply to a comment on a LinkedIn post
         
         Args:
             comment (str): The comment to reply to
             article_title (str): Title of the article that was shared
             personal_tone (bool): Whether to use a more personal tone in the reply
+            use_cache (bool): Reuse a cached reply for an identical request
         
         Returns:
             str: The generated reply
         """
-        if not self.api_key:
-            Console.warning("Groq API key not found. Using fallback reply.")
+        if not self._llm_available():
+            Console.warning("LLM provider not configured. Using fallback reply.")
             return self._generate_fallback_reply(comment, article_title)
         
-        # Create prompt for generating comment reply
-        prompt = f"""
-        You are a professional AI specialist responding to a comment on your LinkedIn post about this AI news article: "{article_title}".
-        
-        The comment you're responding to is:
-        "{comment}"
-        
-        Generate a thoughtful, authentic reply that:
-        
-        1. Sounds like a real person wrote it, not AI
-        2. Is appreciative and engaging
-        3. Adds value through personal insight or additional information
-        4. Is concise (50-100 words maximum)
-        5. Potentially asks a follow-up question if appropriate
-        
-        WRITING STYLE:
-        - Conversational and authentic
-        - Use "I" statements occasionally
-        - Sound genuinely interested in the commenter's perspective
-        - Be slightly informal but still professional
-        - Include personality through word choice and phrasing
-        - Use 1-2 simple emojis if appropriate (not at beginning of sentences)
-        
-        AVOID:
-        - Generic, template-style responses
-        - Overly formal language
-        - Anything that sounds AI-generated
-        - Excessive use of emojis or exclamation marks
-        - Being argumentative or condescending
-        - Promoting anything
-        - Using too many emojis
-        - Writing lengthy posts
-        
-        Return ONLY the reply text with no additional explanations or formatting.
-        """
+        prompt = prompting.reply_prompt(comment, article_title, self.prompt_settings)
         
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
+        Console.info(f"Generating comment reply using {self.llm.model}")
         
-        # Use llama3-70b-8192 for consistent high-quality output
-        model = "llama3-70b-8192"
-        Console.info(f"Generating comment reply using {model}")
-        
-        data = {
-            "model": model,
-            "messages": [
-                {"role": "user", "content": prompt}
-            ],
-            "temperature": 0.7,
-            "max_tokens": 300
-        }
+        reply_content = self._chat_completion(
+            prompt,
+            temperature=0.7,
+            max_tokens=300,
+            use_cache=use_cache,
+            validators=[streaming.forbidden_phrases(self.streaming_settings['forbidden_phrases'])]
+        )
         
-        try:
-            response = requests.post(
-                "https://api.groq.com/openai/v1/chat/completions",
-                headers=headers,
-                json=data
-            )
+        if reply_content is None:
+            return self._generate_fallback_reply(comment, article_title)
             
-            if response.status_code == 200:
-                result = response.json()
-                reply_content = result['choices'][0]['message']['content'].strip()
-                
-                # Quality check
-                if len(reply_content) < 10:
-                    Console.warning("Generated reply is too short, regenerating...")
-                    return self.generate_comment_reply(comment, article_title, personal_tone)
+        # Quality check (regenerate once, bypassing the cache, then give up)
+        if len(reply_content) < 10:
+            if not use_cache:
+                return self._generate_fallback_reply(comment, article_title)
+            Console.warning("Generated reply is too short, regenerating...")
+            return self.generate_comment_reply(comment, article_title, personal_tone, use_cache=False)
                 
-                Console.success(f"Generated reply ({len(reply_content)} characters)")
+        Console.success(f"Generated reply ({len(reply_content)} characters)")
                 
-                # Return only the clean reply content
-                return reply_content
-            else:
-                Console.error(f"Error with Groq API: {response.status_code}")
-                Console.error(f"Response: {response.text}")
-                return self._generate_fallback_reply(comment, article_title)
-        except Exception as e:
-            Console.error(f"Exception with Groq API: {str(e)}")
-            return self._generate_fallback_reply(comment, article_title)
+        # Return only the clean reply content
+        return reply_content
 
+    def generate_comment_replies(self, comments, article_title, personal_tone=True):
+        """Generate replies to several comments with as few LLM requests as possible
+        
+        Comments are sent in batches of up to reply_settings['batch_size'] in
+        a single JSON-mode request. Any comment whose reply is missing or
+        unusable in the response (or a whole batch whose response can't be
+        parsed) falls back to one generate_comment_reply call per comment.
+        
+        Args:
+            comments (list): Comment texts
+            article_title (str): Title of the article that was shared
+            personal_tone (bool): Whether to use a more personal tone in the replies
+        
+        Returns:
+            list: One reply per comment, in the same order
+        """
+        if not self._llm_available():
+            Console.warning("LLM provider not configured. Using fallback replies.")
+            return [self._generate_fallback_reply(comment, article_title) for comment in comments]
+        
+        batch_size = self.reply_settings['batch_size']
+        replies = []
+        
+        for start in range(0, len(comments), batch_size):
+            batch = comments[start:start + batch_size]
+            batch_replies = self._generate_reply_batch(batch, article_title) if len(batch) > 1 else [None]
+            
+            for comment, reply in zip(batch, batch_replies):
+                if reply is None:
+                    reply = self.generate_comment_reply(comment, article_title, personal_tone)
+                replies.append(reply)
+        
+        return replies
+    
+    def _generate_reply_batch(self, comments, article_title):
+        """Ask for replies to a batch of comments in one JSON-mode request
+        
+        Returns:
+            list: A reply per comment, or None where no usable reply came back
+        """
+        Console.info(f"Generating {len(comments)} comment replies in one request using {self.llm.model}")
+        prompt = prompting.batch_reply_prompt(comments, article_title, self.prompt_settings)
+        
+        content = self._chat_completion(
+            prompt,
+            temperature=0.7,
+            max_tokens=self.reply_settings['tokens_per_reply'] * len(comments) + 50,
+            json_mode=True
+        )
+        
+        replies = [None] * len(comments)
+        if content is None:
+            return replies
+        
+        try:
+            entries = json.loads(content)['replies']
+        except (ValueError, KeyError, TypeError):
+            Console.warning("Could not parse batched replies, replying one comment at a time")
+            return replies
+        
+        for entry in entries if isinstance(entries, list) else []:
+            if not isinstance(entry, dict):
+                continue
+            reply = entry.get('reply')
+            try:
+                index = int(entry.get('id')) - 1
+            except (TypeError, ValueError):
+                continue
+            if 0 <= index < len(comments) and isinstance(reply, str) and len(reply.strip()) >= 10:
+                replies[index] = reply.strip()
+        
+        Console.success(f"Generated {sum(1 for reply in replies if reply)}/{len(comments)} replies in one request")
+        return replies
+    
     def _generate_fallback_reply(self, comment, article_title):
         """Generate a fallback reply if LLM generation fails"""
         Console.warning("Using fallback comment reply template")
@@ -0,0 +1,110 @@
+"""
+Background post pre-generation module for the LinkedIn AI News Bot
+"""
+
+import time
+import threading
+from utils.console import Console
+
+class PostPregenerator:
+    """Prepare the next post in the background while the scheduler waits
+    
+    Every refresh the worker fetches and ranks the news, and if the prepared
+    post's article has dropped out of the top picks (or nothing is prepared
+    yet, or it has gone stale) it generates and evaluates a new post plus a
+    few backup candidates. At posting time the scheduler takes the prepared
+    candidates, so only the LinkedIn publish call is left to do.
+    """
+    
+    def __init__(self, select_articles, choose_articles, generate_candidate, settings):
+        """Initialize with the bot's pipeline steps
+        
+        Args:
+            select_articles (callable): Returns the ranked articles, or None
+            choose_articles (callable): Picks [main, *backups] from the ranked articles
+            generate_candidate (callable): Generates and scores a post for an article
+            settings (dict): Config.pregeneration_settings
+        """
+        self.select_articles = select_articles
+        self.choose_articles = choose_articles
+        self.generate_candidate = generate_candidate
+        self.refresh_seconds = settings['refresh_minutes'] * 60
+        self.max_age_seconds = settings['max_age_hours'] * 3600
+        self.top_picks = settings['top_picks']
+        
+        self.candidates = None
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+    
+    def start(self):
+        """Start the background worker (no-op if already running)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="post-pregenerator", daemon=True)
+        self._thread.start()
+        Console.info("Started background post preparation")
+    
+    def stop(self):
+        """Stop the background worker"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+    
+    def _run(self):
+        """Refresh the prepared post until stopped"""
+        while not self._stop_event.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                Console.error(f"Error preparing the next post: {str(e)}")
+            self._stop_event.wait(self.refresh_seconds)
+    
+    def _is_fresh(self, candidates, ranked_articles):
+        """Whether prepared candidates are still worth posting"""
+        if not candidates:
+            return False
+        if time.time() - candidates[0]['prepared_at'] > self.max_age_seconds:
+            return False
+        
+        top_links = {article['link'] for article in ranked_articles[:self.top_picks]}
+        return candidates[0]['article']['link'] in top_links
+    
+    def refresh(self):
+        """Re-rank the news and regenerate the prepared post if a better article showed up"""
+        ranked_articles = self.select_articles()
+        if not ranked_articles:
+            return
+        
+        with self._lock:
+            candidates = self.candidates
+        
+        if self._is_fresh(candidates, ranked_articles):
+            Console.info("Prepared post is still current")
+            return
+        
+        Console.info("Preparing the next post in the background...")
+        new_candidates = []
+        for article in self.choose_articles(ranked_articles):
+            if self._stop_event.is_set():
+                return
+            new_candidates.append(self.generate_candidate(article))
+        
+        with self._lock:
+            self.candidates = new_candidates
+        Console.success(f"Prepared next post with {len(new_candidates) - 1} backup candidates")
+    
+    def take(self):
+        """Hand over the prepared candidates (best first) and clear them
+        
+        Returns:
+            list: Candidates that are not stale, possibly empty
+        """
+        with self._lock:
+            candidates, self.candidates = self.candidates or [], None
+        
+        now = time.time()
+        return [c for c in candidates if now - c['prepared_at'] <= self.max_age_seconds]
\ No newline at end of file
@@ -0,0 +1,259 @@
+"""
+Prompt building module for the LinkedIn AI News Bot
+"""
+
+import re
+import html
+
+_TOKEN_PATTERN = re.compile(r'\w+|[^\w\s]')
+_BLOCK_PATTERN = re.compile(r'<(script|style)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+_TAG_PATTERN = re.compile(r'<[^>]+>')
+_SPACE_PATTERN = re.compile(r'\s+')
+_SENTENCE_END_PATTERN = re.compile(r'[.!?]["\')\]]?\s')
+
+# Prompt templates, filled in with str.format(). They are kept flush left so
+# no indentation is sent to the model as prompt tokens.
+POST_PROMPT = """\
+You're a professional AI specialist creating an ENGAGING, AUTHENTIC LinkedIn post about this AI news.
+Your post should sound completely human-written, conversational, and insightful.
+
+ARTICLE INFORMATION:
+Title: {title}
+Summary: {summary}
+Source: {source}
+Link: {link}
+
+POST STYLE:
+- Write in a {tone} tone that sounds like a real person
+- {approach}
+- {unique}
+
+CONTENT STRUCTURE:
+1. OPENER: Begin with a thought-provoking question, surprising fact, or personal observation related to the news (NOT just "Here's an update")
+2. YOUR TAKE: Share what YOU find interesting about this development (as if you're a real AI professional)
+3. BROADER IMPACT: Connect this to industry trends or how it might change things
+4. PERSONAL ANGLE: Add a brief reflection on how this relates to your experience or perspective
+5. ENGAGEMENT: End with a SPECIFIC, THOUGHT-PROVOKING question (not generic "what do you think?")
+6. LINK: Include the article link organically within the text
+7. HASHTAGS: Add 3-4 relevant, specific hashtags
+
+WRITING GUIDELINES:
+- Use a natural, conversational voice like you're talking to a colleague
+- Include occasional "I" statements to make it personal
+- Use short paragraphs with line breaks between them
+- Include 1-2 relevant emojis placed naturally, not at the beginning of sentences
+- Use varied sentence structures (mix of short and medium sentences)
+- Sound like a thoughtful professional with genuine curiosity
+- Avoid jargon unless you briefly explain it
+- Use 1-2 rhetorical devices like metaphors or analogies where appropriate
+
+WHAT MAKES IT SOUND HUMAN:
+- Express genuine excitement, concern, or curiosity
+- Mention a personal connection to the topic if relevant
+- Add light personality through word choice and phrasing
+- Include a small detail or example that shows thought
+- Avoid perfectly structured paragraphs - add some natural variation
+- Occasionally use casual transitions like "And yet..." or "But here's the thing..."
+
+WHAT TO AVOID:
+- Generic openings like "I found this interesting article"
+- Any hint of marketing language or corporate speak
+- Perfect parallelism in structure that sounds robotic
+- Excessive formality or academic tone
+- Overly complex or dense sentences
+- Any mention of algorithms, AI generation, or non-human aspects
+
+Return ONLY the finished post text without any additional explanations or formatting.
+"""
+
+VARIATION_PROMPT = """\
+You're a professional AI specialist creating an AUTHENTIC, ENGAGING LinkedIn weekend post about this AI news.
+Make it sound completely human-written, as if a real person wrote it during their weekend.
+
+ARTICLE INFORMATION:
+Title: {title}
+Summary: {summary}
+Source: {source}
+Link: {link}
+
+WEEKEND POST STYLE:
+- Write in a relaxed, thoughtful weekend tone
+- {instruction}
+- Include a personal reflection element that feels authentic
+
+MAKE IT HUMAN AND ENGAGING:
+- Begin with a weekend context (e.g., "Taking some time this Sunday to think about...")
+- Share a genuine-sounding personal reaction to the news
+- Use casual language with occasional "thinking out loud" elements
+- Add a touch of weekend mindset (more reflective, big-picture thinking)
+- Include one specific detail or example that shows thoughtful engagement
+- End with a question that invites genuine conversation
+
+AVOID ANYTHING THAT SOUNDS:
+- Corporate or overly polished
+- Generic or templated
+- Too formal or structured
+- Like it was written by AI
+
+Return ONLY the finished post text without any additional explanations or formatting.
+"""
+
+REPLY_PROMPT = """\
+You are a professional AI specialist responding to a comment on your LinkedIn post about this AI news article: "{article_title}".
+
+The comment you're responding to is:
+"{comment}"
+
+Generate a thoughtful, authentic reply that:
+
+1. Sounds like a real person wrote it, not AI
+2. Is appreciative and engaging
+3. Adds value through personal insight or additional information
+4. Is concise (50-100 words maximum)
+5. Potentially asks a follow-up question if appropriate
+
+WRITING STYLE:
+- Conversational and authentic
+- Use "I" statements occasionally
+- Sound genuinely interested in the commenter's perspective
+- Be slightly informal but still professional
+- Include personality through word choice and phrasing
+- Use 1-2 simple emojis if appropriate (not at beginning of sentences)
+
+AVOID:
+- Generic, template-style responses
+- Overly formal language
+- Anything that sounds AI-generated
+- Excessive use of emojis or exclamation marks
+- Being argumentative or condescending
+- Promoting anything
+- Using too many emojis
+- Writing lengthy posts
+
+Return ONLY the reply text with no additional explanations or formatting.
+"""
+
+BATCH_REPLY_PROMPT = """\
+You are a professional AI specialist responding to comments on your LinkedIn post about this AI news article: "{article_title}".
+
+The comments you're responding to, each with its id:
+{comments}
+
+Write one separate reply to each comment. Every reply should:
+
+1. Sound like a real person wrote it, not AI
+2. Be appreciative and engaging
+3. Add value through personal insight or additional information
+4. Be concise (50-100 words maximum)
+5. Potentially ask a follow-up question if appropriate
+6. Respond to that comment specifically - don't repeat the same wording across replies
+
+WRITING STYLE:
+- Conversational and authentic
+- Use "I" statements occasionally
+- Sound genuinely interested in the commenter's perspective
+- Be slightly informal but still professional
+- Use 1-2 simple emojis if appropriate (not at beginning of sentences)
+
+AVOID:
+- Generic, template-style responses
+- Overly formal language
+- Anything that sounds AI-generated
+- Being argumentative or condescending
+- Promoting anything
+
+Return ONLY a JSON object of this form, with one entry per comment id:
+{{"replies": [{{"id": 1, "reply": "..."}}, {{"id": 2, "reply": "..."}}]}}
+"""
+
+def estimate_tokens(text):
+    """Estimate how many tokens a text costs, without a model tokenizer
+    
+    Words and punctuation marks each count as one token, and long words as
+    one more per six extra characters, which tracks BPE tokenizers such as
+    Llama 3's closely enough for budgeting English text.
+    """
+    if not text:
+        return 0
+    return sum(1 + (len(piece) - 1) // 6 for piece in _TOKEN_PATTERN.findall(text))
+
+def clean_text(text):
+    """Strip HTML (including scripts and styles), unescape entities and collapse whitespace"""
+    if not text:
+        return ''
+    text = _BLOCK_PATTERN.sub(' ', text)
+    text = _TAG_PATTERN.sub(' ', text)
+    return _SPACE_PATTERN.sub(' ', html.unescape(text)).strip()
+
+def truncate_to_tokens(text, budget):
+    """Cut text to at most budget estimated tokens
+    
+    The cut is moved back to the end of the last whole sentence when that
+    keeps at least half of the allowed text; otherwise it falls between
+    words. An ellipsis marks text that was shortened.
+    """
+    used = 0
+    for match in _TOKEN_PATTERN.finditer(text):
+        used += 1 + (len(match.group()) - 1) // 6
+        if used > budget:
+            cut = match.start()
+            break
+    else:
+        return text
+    
+    head = text[:cut]
+    sentence_ends = [m.end() for m in _SENTENCE_END_PATTERN.finditer(head)]
+    if sentence_ends and sentence_ends[-1] >= cut // 2:
+        return head[:sentence_ends[-1]].rstrip()
+    return head.rstrip() + '…'
+
+def compact(text, budget, default=''):
+    """Clean text and fit it to a token budget"""
+    text = clean_text(text)
+    if not text:
+        return default
+    return truncate_to_tokens(text, budget)
+
+def post_prompt(article, style, settings):
+    """Prompt for a LinkedIn post about an article in one of the post styles"""
+    return POST_PROMPT.format(
+        title=compact(article['title'], settings['title_token_budget']),
+        summary=compact(article.get('summary'), settings['summary_token_budget'], 'No summary available'),
+        source=article.get('source', 'Unknown source'),
+        link=article['link'],
+        tone=style['tone'],
+        approach=style['approach'],
+        unique=style['unique']
+    )
+
+def variation_prompt(article, instruction, settings):
+    """Prompt for a weekend/trending/technical/business post variation"""
+    return VARIATION_PROMPT.format(
+        title=compact(article['title'], settings['title_token_budget']),
+        summary=compact(article.get('summary'), settings['summary_token_budget'], 'No summary available'),
+        source=article.get('source', 'Unknown source'),
+        link=article['link'],
+        instruction=instruction
+    )
+
+def reply_prompt(comment, article_title, settings):
+    """Prompt for a reply to a comment on one of our posts"""
+    return REPLY_PROMPT.format(
+        article_title=compact(article_title, settings['title_token_budget']),
+        comment=compact(comment, settings['comment_token_budget'])
+    )
+
+def batch_reply_prompt(comments, article_title, settings):
+    """Prompt asking for a JSON object with one reply per comment
+    
+    Comments are numbered from 1 in the order given; the ids in the reply
+    refer to those numbers.
+    """
+    numbered = '\n'.join(
+        f"[{i}] \"{compact(comment, settings['comment_token_budget'])}\""
+        for i, comment in enumerate(comments, 1)
+    )
+    return BATCH_REPLY_PROMPT.format(
+        article_title=compact(article_title, settings['title_token_budget']),
+        comments=numbered
+    )
\ No newline at end of file
@@ -0,0 +1,151 @@
+"""
+LLM provider module for the LinkedIn AI News Bot
+"""
+
+import math
+import threading
+import contextlib
+from collections import deque
+from config import Config
+from utils.console import Console
+from utils.http_client import get_http_client
+from utils.rate_limit import get_retry_engine
+
+class LatencyTracker:
+    """Rolling window of a provider's recent response times"""
+    
+    def __init__(self, window=100):
+        """Keep the last window samples"""
+        self.samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+    
+    def record(self, seconds):
+        """Add a response time"""
+        with self._lock:
+            self.samples.append(seconds)
+    
+    def __len__(self):
+        """Number of samples in the window"""
+        return len(self.samples)
+    
+    def percentile(self, p):
+        """The p-th percentile response time (nearest rank), or None without samples"""
+        with self._lock:
+            ordered = sorted(self.samples)
+        if not ordered:
+            return None
+        rank = max(1, math.ceil(p / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+class LinkedEvent(threading.Event):
+    """A cancel event that also counts as set when its parent event is set"""
+    
+    def __init__(self, parent=None):
+        """Initialize, optionally following a parent event"""
+        super().__init__()
+        self.parent = parent
+    
+    def is_set(self):
+        """Set directly or through the parent"""
+        return super().is_set() or (self.parent is not None and self.parent.is_set())
+
+class LLMProvider:
+    """An OpenAI-compatible chat completions backend
+    
+    Groq, llama.cpp's server, vLLM and Ollama all expose the same
+    /chat/completions API, so a provider is just where to send requests,
+    which model to ask for and how hard the backend may be pushed. Requests
+    go through the shared pooled HTTP client, so connections are reused,
+    and through the provider's retry engine.
+    """
+    
+    def __init__(self, name, settings, api_key=None):
+        """Initialize from a Config.llm_providers entry
+        
+        Args:
+            name (str): Provider name (a key of Config.llm_providers)
+            settings (dict): The provider's settings
+            api_key (str, optional): Bearer token, if the backend needs one
+        """
+        self.name = name
+        self.label = settings.get('label', name)
+        self.chat_url = settings['base_url'].rstrip('/') + '/chat/completions'
+        self.api_key = api_key
+        self.requires_api_key = settings.get('requires_api_key', False)
+        self.model = settings['model']
+        self.max_tokens_cap = None
+        
+        # CPU-only mode: a small quantized model and short completions keep
+        # latency low on machines without a GPU
+        if settings.get('cpu_only'):
+            self.model = settings['cpu_model']
+            self.max_tokens_cap = settings.get('cpu_max_tokens')
+        
+        max_concurrency = settings.get('max_concurrency')
+        self.semaphore = threading.BoundedSemaphore(max_concurrency) if max_concurrency else None
+        
+        self.http = get_http_client()
+        self.retry_engine = get_retry_engine(name)
+        self.latency = LatencyTracker()
+    
+    def available(self):
+        """Whether the provider can be used (e.g. has its API key)"""
+        return bool(self.api_key) or not self.requires_api_key
+    
+    def headers(self):
+        """Request headers for the chat completions endpoint"""
+        headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        return headers
+    
+    def payload(self, prompt, temperature, max_tokens):
+        """Build the request body for a single-prompt completion"""
+        if self.max_tokens_cap:
+            max_tokens = min(max_tokens, self.max_tokens_cap)
+        
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": temperature,
+            "max_tokens": max_tokens
+        }
+    
+    @contextlib.contextmanager
+    def slot(self):
+        """Hold one of the backend's concurrency slots for a request and its response"""
+        if self.semaphore is None:
+            yield
+            return
+        
+        with self.semaphore:
+            yield
+    
+    def post(self, data, estimated_tokens=0, stream=False):
+        """Send a chat completion request
+        
+        Returns:
+            requests.Response: The response (open for reading when streaming)
+        """
+        return self.retry_engine.post(
+            self.http,
+            self.chat_url,
+            estimated_tokens=estimated_tokens,
+            headers=self.headers(),
+            json=data,
+            stream=stream
+        )
+
+def create_provider(name, api_key=None):
+    """Create the provider configured under a name in Config.llm_providers
+    
+    Returns:
+        LLMProvider: The provider, or None if the name is not configured
+    """
+    settings = Config().llm_providers.get(name)
+    if settings is None:
+        Console.warning(f"Unknown LLM provider '{name}'")
+        return None
+    return LLMProvider(name, settings, api_key)
\ No newline at end of file
@@ -0,0 +1,173 @@
+"""
+Streaming LLM completion module for the LinkedIn AI News Bot
+"""
+
+import json
+import time
+
+class StreamResult:
+    """Outcome of a streamed completion with its timing statistics"""
+    
+    def __init__(self):
+        self.content = ''
+        self.abort_reason = None
+        self.tokens = 0
+        self.usage = {}
+        self.started_at = time.monotonic()
+        self.first_token_at = None
+        self.finished_at = None
+    
+    @property
+    def aborted(self):
+        """Whether a validator (or the caller) stopped the stream early"""
+        return self.abort_reason is not None
+    
+    @property
+    def time_to_first_token(self):
+        """Seconds from sending the request to the first content token"""
+        if self.first_token_at is None:
+            return None
+        return self.first_token_at - self.started_at
+    
+    @property
+    def tokens_per_second(self):
+        """Generation speed after the first token"""
+        if self.first_token_at is None or self.finished_at is None:
+            return None
+        elapsed = self.finished_at - self.first_token_at
+        return self.tokens / elapsed if elapsed > 0 else None
+    
+    def summary(self):
+        """Short human-readable timing summary"""
+        ttft = self.time_to_first_token
+        speed = self.tokens_per_second
+        ttft_text = f"{ttft:.2f}s" if ttft is not None else "n/a"
+        speed_text = f"{speed:.1f} tokens/s" if speed is not None else "n/a"
+        return f"{self.tokens} tokens, first token after {ttft_text}, {speed_text}"
+
+# Validators are called with (text_so_far, done) after every chunk and at the
+# end of the stream, and return a reason string to abort or None to continue.
+
+def max_length(limit):
+    """Abort once the text grows past limit characters"""
+    def validate(text, done):
+        if len(text) > limit:
+            return f"length budget of {limit} characters exceeded"
+        return None
+    return validate
+
+def min_length(limit):
+    """Reject a finished text shorter than limit characters"""
+    def validate(text, done):
+        if done and len(text.strip()) < limit:
+            return f"shorter than {limit} characters"
+        return None
+    return validate
+
+def forbidden_phrases(phrases):
+    """Abort as soon as any of the phrases appears (case-insensitive)"""
+    lowered = [phrase.lower() for phrase in phrases]
+    def validate(text, done):
+        text = text.lower()
+        for phrase in lowered:
+            if phrase in text:
+                return f"forbidden phrase '{phrase}'"
+        return None
+    return validate
+
+def paragraph_break_within(chars):
+    """Abort if no blank line has appeared after chars characters"""
+    def validate(text, done):
+        if len(text) > chars and '\n\n' not in text:
+            return f"no paragraph break in the first {chars} characters"
+        return None
+    return validate
+
+def _run_validators(validators, text, done):
+    """Return the first abort reason from the validators, if any"""
+    for validator in validators:
+        reason = validator(text, done)
+        if reason:
+            return reason
+    return None
+
+def iter_sse_deltas(response, usage=None):
+    """Yield content deltas from an OpenAI-compatible server-sent event stream
+    
+    Args:
+        response (requests.Response): Open streaming response
+        usage (dict, optional): Filled with the token usage if the server reports it
+    """
+    # SSE is always UTF-8; servers often omit the charset, and requests would
+    # then decode the stream as ISO-8859-1
+    for raw_line in response.iter_lines():
+        line = raw_line.decode('utf-8', errors='replace')
+        if not line or not line.startswith('data:'):
+            continue
+        
+        data = line[5:].strip()
+        if data == '[DONE]':
+            return
+        
+        try:
+            event = json.loads(data)
+        except ValueError:
+            continue
+        
+        # OpenAI-style servers report usage at the top level, Groq under x_groq
+        reported = event.get('usage') or (event.get('x_groq') or {}).get('usage')
+        if reported and usage is not None:
+            usage.update(reported)
+        
+        choices = event.get('choices') or []
+        if choices:
+            delta = (choices[0].get('delta') or {}).get('content')
+            if delta:
+                yield delta
+
+def read_stream(response, validators=None, cancel_event=None, started_at=None):
+    """Read a streamed chat completion, checking the text as it arrives
+    
+    The connection is closed as soon as a validator objects or the cancel
+    event is set, so a generation that is already doomed stops costing time
+    and tokens.
+    
+    Args:
+        response (requests.Response): Open response of a request sent with stream=True
+        validators (list, optional): Validator callables, see above
+        cancel_event (threading.Event, optional): Set to abandon the stream
+        started_at (float, optional): time.monotonic() when the request was sent
+    
+    Returns:
+        StreamResult: The text received and why it stopped, if early
+    """
+    validators = validators or []
+    result = StreamResult()
+    if started_at is not None:
+        result.started_at = started_at
+    parts = []
+    
+    try:
+        for delta in iter_sse_deltas(response, result.usage):
+            if result.first_token_at is None:
+                result.first_token_at = time.monotonic()
+            parts.append(delta)
+            result.tokens += 1
+            
+            if cancel_event is not None and cancel_event.is_set():
+                result.abort_reason = "cancelled"
+                break
+            
+            result.abort_reason = _run_validators(validators, ''.join(parts), False)
+            if result.abort_reason:
+                break
+    finally:
+        response.close()
+    
+    result.finished_at = time.monotonic()
+    result.content = ''.join(parts).strip()
+    
+    if not result.aborted:
+        result.abort_reason = _run_validators(validators, result.content, True)
+    
+    return result
\ No newline at end of file
@@ -0,0 +1,193 @@
+"""
+LinkedIn accounts module for the LinkedIn AI News Bot
+"""
+
+import os
+import time
+import threading
+from datetime import datetime
+from config import Config
+from utils.console import Console
+from utils.history import PostingHistory
+from utils.analytics import Analytics
+from linkedin.auth import LinkedInAuth
+from linkedin.poster import LinkedInPoster
+from linkedin.comment_responder import LinkedInCommentResponder
+from linkedin import outbox
+
+class LinkedInAccount:
+    """One LinkedIn profile or company page the bot posts for
+    
+    Bundles everything that is per account: credentials and tokens, the
+    author to post as, the post styles and schedule, the posted-URL history
+    (a namespace of the shared index) and the outbox with its delivery
+    worker. News, generation and evaluation are shared between accounts.
+    """
+    
+    def __init__(self, name, settings, content_generator, discord):
+        """Initialize from a Config.multi_account_settings['accounts'] entry
+        
+        Args:
+            name (str): Account name, used for its files and history namespace
+            settings (dict): The account's settings
+            content_generator (ContentGenerator): Shared generator, for comment replies
+            discord (DiscordNotifier): Shared notifier
+        """
+        config = Config()
+        self.name = name
+        self.label = settings.get('label', name)
+        self.styles = settings.get('styles')
+        self.min_hours_between_posts = settings.get('min_hours_between_posts', config.min_hours_between_posts)
+        self.post_window_hours = settings.get('post_window_hours')
+        self.content_generator = content_generator
+        self.discord = discord
+        
+        # Posting as a company page needs the organization scope as well
+        author = settings.get('author')
+        scope = settings.get('scope') or config.auth_settings['scope']
+        if 'scope' not in settings and author and author.startswith('urn:li:organization:'):
+            scope += ' w_organization_social'
+        
+        self.auth = LinkedInAuth(
+            client_id=os.environ.get(settings['client_id_env']),
+            client_secret=os.environ.get(settings['client_secret_env']),
+            redirect_uri='http://localhost:8000/callback',
+            token_file=f"linkedin_token_{name}.json",
+            identity_file=f"linkedin_identity_{name}.json",
+            scope=scope
+        )
+        self.poster = LinkedInPoster(self.auth, author=author)
+        
+        history_settings = config.history_settings
+        self.history = PostingHistory(f"posted_articles_history_{name}.json")
+        self.posted_articles = self.history.load_posted_index(
+            history_settings['posted_index_file'],
+            namespace=name,
+            capacity=history_settings['bloom_capacity'],
+            error_rate=history_settings['bloom_error_rate']
+        )
+        self.last_post_time = self.history.get_last_post_time()
+        self.analytics = Analytics()
+        
+        self.outbox_settings = config.outbox_settings
+        self.outbox = outbox.PostOutbox(self.outbox_settings['outbox_file'], namespace=name)
+        self.delivery = outbox.OutboxDelivery(
+            self.outbox,
+            self.poster,
+            self._on_post_published,
+            self._on_post_failed,
+            self.outbox_settings
+        )
+        self._history_lock = threading.Lock()
+    
+    def has_undelivered_post(self):
+        """Whether a post is still waiting in the outbox to be sent or confirmed"""
+        return self.outbox.next_attempt_at() is not None
+    
+    def is_due(self, now=None):
+        """Whether the account's schedule allows a post now
+        
+        An account whose previous post is still being delivered is not due:
+        last_post_time is only set once that post is published.
+        """
+        if self.has_undelivered_post():
+            return False
+        
+        now = now or time.time()
+        if self.last_post_time and now - self.last_post_time < self.min_hours_between_posts * 3600:
+            return False
+        
+        if self.post_window_hours:
+            start_hour, end_hour = self.post_window_hours
+            if not start_hour <= datetime.fromtimestamp(now).hour < end_hour:
+                return False
+        return True
+    
+    def publish(self, candidate):
+        """Publish a prepared post through the account's outbox
+        
+        Returns:
+            bool: True if the post was published within the outbox wait time
+        """
+        article = candidate['article']
+        key = self.outbox.enqueue(article, candidate['content'], candidate['quality_score'])
+        if self.outbox.get(key)['status'] in (outbox.PUBLISHED_STATE, outbox.RECORDED, outbox.UNKNOWN):
+            Console.warning(f"[{self.label}] This article was already posted (or may have been); not posting it again")
+            return False
+        
+        Console.info(f"[{self.label}] Submitting post to LinkedIn API...")
+        self.analytics.track_post_generated()
+        self.delivery.start()
+        self.delivery.notify()
+        
+        status = self.delivery.wait_for(key, self.outbox_settings['wait_seconds'])
+        if status in (outbox.PUBLISHED_STATE, outbox.RECORDED):
+            return True
+        if status not in (outbox.FAILED, outbox.UNKNOWN):
+            Console.warning(f"[{self.label}] Post not delivered yet; it will keep being retried in the background")
+        return False
+    
+    def _on_post_published(self, entry):
+        """Record a post the outbox delivered"""
+        with self._history_lock:
+            self.analytics.track_successful_post()
+            self.posted_articles.add(entry['article_link'])
+            self.last_post_time = entry['updated_at']
+            self.history.save_posting_history(self.posted_articles, self.last_post_time, self.analytics.get_data())
+        
+        Console.success(f"[{self.label}] Post successfully published to LinkedIn!")
+        current_time_str = datetime.fromtimestamp(entry['updated_at']).strftime('%Y-%m-%d %H:%M:%S')
+        self.discord.send_post_success(f"[{self.label}] {entry['article_title']}", entry['quality_score'], current_time_str)
+        
+        # Watch the new post for comments in the background
+        responder = LinkedInCommentResponder(
+            auth=self.auth,
+            content_generator=self.content_generator,
+            discord_notifier=self.discord,
+            author=self.poster.author
+        )
+        monitor_thread = threading.Thread(
+            target=responder.start_monitoring,
+            args=(entry['article_title'], entry['post_id'], 24),
+            daemon=True
+        )
+        monitor_thread.start()
+    
+    def _on_post_failed(self, entry):
+        """Report a post the outbox gave up on"""
+        self.analytics.track_failed_post()
+        Console.error(f"[{self.label}] Failed to post to LinkedIn: {entry['last_error']}")
+        
+        # It may be live, so keep it out of future rankings like a posted article
+        if entry['status'] == outbox.UNKNOWN:
+            with self._history_lock:
+                self.posted_articles.add(entry['article_link'])
+                self.history.save_posting_history(self.posted_articles, self.last_post_time, self.analytics.get_data())
+        current_time_str = datetime.fromtimestamp(entry['updated_at']).strftime('%Y-%m-%d %H:%M:%S')
+        self.discord.send_post_failure(f"[{self.label}] {entry['article_title']}", current_time_str)
+
+class PostedByAllAccounts:
+    """Set-like view of the URLs every given account has already posted
+    
+    Used to rank the shared news once: an article is only left out when no
+    account could still post it.
+    """
+    
+    def __init__(self, accounts):
+        """Initialize with the accounts to check"""
+        self.accounts = accounts
+    
+    def __contains__(self, url):
+        """True if every account has posted the URL"""
+        return all(url in account.posted_articles for account in self.accounts)
+
+def load_accounts(settings, content_generator, discord):
+    """Create the accounts configured in Config.multi_account_settings
+    
+    Returns:
+        list: LinkedInAccount objects
+    """
+    return [
+        LinkedInAccount(name, account_settings, content_generator, discord)
+        for name, account_settings in settings['accounts'].items()
+    ]
\ No newline at end of file
@@ -2,69 +2,231 @@
 LinkedIn authentication module
 """
 
+import os
 import webbrowser
 import time
 import threading
 import urllib.parse
-import requests
+import hashlib
 import json
 
 from http.server import HTTPServer, BaseHTTPRequestHandler
+from config import Config
 from utils.console import Console, Colors
+from utils.http_client import get_http_client
+from linkedin.token_store import TokenStore, write_private_json
 
 class LinkedInAuth:
     """Class for handling LinkedIn authentication"""
     
-    def __init__(self, client_id, client_secret, redirect_uri):
-        """Initialize LinkedIn Auth with credentials"""
+    def __init__(self, client_id, client_secret, redirect_uri, token_file=None, identity_file=None, scope=None):
+        """Initialize LinkedIn Auth with credentials
+        
+        Args:
+            client_id (str): LinkedIn app client ID
+            client_secret (str): LinkedIn app client secret
+            redirect_uri (str): OAuth callback URL
+            token_file (str, optional): Where to keep tokens; Config.auth_settings default if not given
+            identity_file (str, optional): Where to cache the profile; Config.auth_settings default if not given
+            scope (str, optional): OAuth scopes to request; Config.auth_settings default if not given
+        """
         # LinkedIn API credentials
         self.client_id = client_id
         self.client_secret = client_secret
         self.redirect_uri = redirect_uri
+        self.http = get_http_client()
         
         # LinkedIn API endpoints
         self.auth_url = "https://www.linkedin.com/oauth/v2/authorization"
         self.token_url = "https://www.linkedin.com/oauth/v2/accessToken"
         self.api_url = "https://api.linkedin.com/v2"
         
-        # Store access token
+        auth_settings = Config().auth_settings
+        self.scope = scope or auth_settings['scope']
+        
+        # Store access token (persisted so restarts don't need a browser login)
         self.access_token = None
+        self.expires_at = None
+        self.refresh_token = None
+        self.refresh_token_expires_at = None
+        self.token_store = TokenStore(token_file or auth_settings['token_file'])
+        self.refresh_margin = auth_settings['refresh_margin_minutes'] * 60
+        self.login_timeout = auth_settings['login_timeout_seconds']
+        self._token_lock = threading.RLock()
         
-        # Flag for callback completion
+        # Set by the callback server once the browser login has finished
         self.auth_completed = False
+        self._auth_event = threading.Event()
         
         # Your LinkedIn ID
         self.person_id = None  # This will be retrieved during authentication
+        
+        # Cached identity: the person ID and profile never change for a token,
+        # so they are fetched once and kept (on disk too) until they expire
+        self.identity_file = identity_file or auth_settings['identity_file']
+        self.identity_ttl = auth_settings['identity_ttl_hours'] * 3600
+        self.profile = None
+        self._identity_token = None
+        self._identity_fetched_at = 0
+        self._identity_lock = threading.Lock()
+    
+    def _load_token(self):
+        """Load the tokens saved by a previous run"""
+        data = self.token_store.load()
+        if not data:
+            return False
+        
+        self.access_token = data['access_token']
+        self.expires_at = data.get('expires_at')
+        self.refresh_token = data.get('refresh_token')
+        self.refresh_token_expires_at = data.get('refresh_token_expires_at')
+        return True
+    
+    def _store_token(self, token_data):
+        """Keep a token endpoint response in memory and on disk"""
+        now = time.time()
+        expires_in = token_data.get('expires_in')
+        refresh_expires_in = token_data.get('refresh_token_expires_in')
+        
+        self.access_token = token_data['access_token']
+        self.expires_at = now + expires_in if expires_in else None
+        if token_data.get('refresh_token'):
+            # LinkedIn may not return a new refresh token on refresh; keep the old one then
+            self.refresh_token = token_data['refresh_token']
+            self.refresh_token_expires_at = now + refresh_expires_in if refresh_expires_in else None
+        
+        self._save_token()
+    
+    def _save_token(self):
+        """Persist the current tokens"""
+        self.token_store.save({
+            'access_token': self.access_token,
+            'expires_at': self.expires_at,
+            'refresh_token': self.refresh_token,
+            'refresh_token_expires_at': self.refresh_token_expires_at
+        })
+    
+    def _token_valid_for(self, seconds):
+        """Whether the access token will still be valid in the given number of seconds"""
+        if not self.access_token:
+            return False
+        return self.expires_at is None or self.expires_at - time.time() > seconds
+    
+    def _can_refresh(self):
+        """Whether there is an unexpired refresh token"""
+        if not self.refresh_token:
+            return False
+        return self.refresh_token_expires_at is None or self.refresh_token_expires_at > time.time()
+    
+    def refresh_access_token(self):
+        """Get a new access token with the refresh token
+        
+        Returns:
+            bool: True if a new access token was obtained
+        """
+        data = {
+            'grant_type': 'refresh_token',
+            'refresh_token': self.refresh_token,
+            'client_id': self.client_id,
+            'client_secret': self.client_secret
+        }
+        
+        try:
+            response = self.http.post(self.token_url, data=data)
+        except Exception as e:
+            Console.error(f"Error refreshing access token: {str(e)}")
+            return False
+        
+        if response.status_code == 200:
+            self._store_token(response.json())
+            Console.success("Refreshed LinkedIn access token")
+            return True
+        
+        Console.error(f"Failed to refresh access token: {response.status_code}")
+        Console.debug(f"Response: {response.text}")
+        if response.status_code in (400, 401):
+            # The refresh token was revoked or has expired; only a browser login helps now
+            self.refresh_token = None
+            self.refresh_token_expires_at = None
+            self._save_token()
+        return False
+    
+    def ensure_token(self):
+        """Make sure there is a usable access token without user interaction
+        
+        Uses the token in memory, else the one stored by a previous run, and
+        refreshes it if it expires within the refresh margin. Cheap enough to
+        call before every API request.
+        
+        Returns:
+            bool: True if an access token is available
+        """
+        with self._token_lock:
+            if self._token_valid_for(self.refresh_margin):
+                return True
+            
+            if not self.access_token and self._load_token():
+                Console.info("Loaded stored LinkedIn access token")
+                if self._token_valid_for(self.refresh_margin):
+                    return True
+            
+            if self._can_refresh() and self.refresh_access_token():
+                return True
+            
+            # Not refreshable, but still usable until it actually expires
+            return self._token_valid_for(0)
     
-    def authenticate(self):
-        """Start OAuth flow with updated scopes"""
+    def _expire_token(self):
+        """Mark the access token as no longer valid so it gets refreshed or replaced"""
+        with self._token_lock:
+            if self.access_token:
+                self.expires_at = 0
+                self._save_token()
+    
+    def authenticate(self, interactive=True):
+        """Authenticate, with the stored token if possible, else through the browser
+        
+        Args:
+            interactive (bool): Fall back to the browser login if no stored token works
+        
+        Returns:
+            bool: True if an access token is available
+        """
+        if self.ensure_token():
+            return True
+        if not interactive:
+            Console.warning("No usable stored LinkedIn token and interactive login is disabled")
+            return False
+        
         auth_params = {
             'response_type': 'code',
             'client_id': self.client_id,
             'redirect_uri': self.redirect_uri,
-            'scope': 'openid profile email w_member_social',  # Updated scopes
+            'scope': self.scope,
             'state': 'linkedin_state'
         }
         
         auth_url = f"{self.auth_url}?{'&'.join(f'{k}={v}' for k, v in auth_params.items())}"
         
-        Console.section("LinkedIn Authentication")
         Console.info("Opening browser for authentication...")
         Console.info(f"Authorization URL: {Colors.CYAN}{auth_url}{Colors.ENDC}")
         webbrowser.open(auth_url)
         
         # Start local server to receive callback
+        self.auth_completed = False
+        self._auth_event.clear()
         server_thread = threading.Thread(target=self._start_callback_server)
         server_thread.daemon = True
         server_thread.start()
         
         # Wait for authentication to complete
         Console.info("Waiting for authentication to complete...")
-        while not self.auth_completed:
-            time.sleep(1)
+        if not self._auth_event.wait(self.login_timeout):
+            Console.error(f"No LinkedIn login within {self.login_timeout} seconds")
+            return False
         
-        # Give the server thread time to shut down properly
-        time.sleep(2)
+        # The callback server closes right after answering the browser
+        server_thread.join(timeout=5)
         
         return self.access_token is not None
     
@@ -122,6 +284,7 @@ class LinkedInAuth:
                 
                 # Signal that we're done with authentication
                 auth.auth_completed = True
+                auth._auth_event.set()
         
         try:
             server = HTTPServer(('localhost', 8000), CallbackHandler)
@@ -129,6 +292,7 @@ class LinkedInAuth:
             server.handle_request()
         except Exception as e:
             Console.error(f"Error with callback server: {str(e)}")
+            auth._auth_event.set()
         finally:
             if server:
                 server.server_close()
@@ -144,11 +308,12 @@ class LinkedInAuth:
             'client_secret': self.client_secret
         }
         
-        response = requests.post(self.token_url, data=data)
+        response = self.http.post(self.token_url, data=data)
         
         if response.status_code == 200:
             token_data = response.json()
-            self.access_token = token_data['access_token']
+            with self._token_lock:
+                self._store_token(token_data)
             Console.success(f"Successfully obtained access token. Expires in {token_data.get('expires_in')} seconds")
             Console.info(f"Token: {self.access_token[:10]}... (truncated for security)")
             return True
@@ -157,11 +322,106 @@ class LinkedInAuth:
             Console.error(f"Response: {response.text}")
             return False
     
-    def get_user_profile(self):
-        """Get the user profile information using OpenID Connect"""
+    def _token_fingerprint(self):
+        """Short hash identifying the current access token (kept out of the identity cache)"""
+        return hashlib.sha256(self.access_token.encode('utf-8')).hexdigest()[:16]
+    
+    def _identity_is_fresh(self):
+        """Whether the cached identity belongs to the current token and hasn't expired"""
+        return (
+            self.person_id is not None
+            and self._identity_token == self._token_fingerprint()
+            and time.time() - self._identity_fetched_at < self.identity_ttl
+        )
+    
+    def _load_identity(self):
+        """Load the identity cached on disk, if it is still valid for the current token"""
+        try:
+            with open(self.identity_file, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        
+        if data.get('token') != self._token_fingerprint():
+            return False
+        if time.time() - data.get('fetched_at', 0) >= self.identity_ttl:
+            return False
+        
+        self.person_id = data.get('person_id')
+        self.profile = data.get('profile')
+        self._identity_token = data['token']
+        self._identity_fetched_at = data['fetched_at']
+        return self.person_id is not None
+    
+    def _save_identity(self):
+        """Write the identity cache, readable only by the current user"""
+        data = {
+            'token': self._identity_token,
+            'fetched_at': self._identity_fetched_at,
+            'person_id': self.person_id,
+            'profile': self.profile
+        }
+        try:
+            write_private_json(self.identity_file, data)
+        except OSError as e:
+            Console.warning(f"Could not save LinkedIn identity cache: {str(e)}")
+    
+    def invalidate_identity(self):
+        """Forget the cached identity, e.g. after the API answered 401"""
+        with self._identity_lock:
+            self.person_id = None
+            self.profile = None
+            self._identity_token = None
+            self._identity_fetched_at = 0
+            try:
+                os.remove(self.identity_file)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                Console.warning(f"Could not remove LinkedIn identity cache: {str(e)}")
+        Console.info("Cleared cached LinkedIn identity")
+    
+    def check_response(self, response):
+        """Invalidate the cached identity and token if a LinkedIn API response was 401 Unauthorized"""
+        if response.status_code == 401:
+            Console.warning("LinkedIn rejected the access token (401)")
+            self.invalidate_identity()
+            self._expire_token()
+    
+    def get_person_id(self):
+        """Get the LinkedIn person ID, from the cache when possible
+        
+        Returns:
+            str: The person ID, or None if it couldn't be determined
+        """
+        if not self.access_token:
+            return None
+        
+        with self._identity_lock:
+            if self._identity_is_fresh() or self._load_identity():
+                return self.person_id
+        
+        if self.get_user_profile(use_cache=False) is None:
+            return None
+        return self.person_id
+    
+    def get_user_profile(self, use_cache=True):
+        """Get the user profile information using OpenID Connect
+        
+        Args:
+            use_cache (bool): Return the cached profile if it is still valid
+        
+        Returns:
+            dict: The /userinfo response, or None on failure
+        """
         if not self.access_token:
             Console.warning("Not authenticated. Please run authenticate() first.")
             return None
+        
+        if use_cache:
+            with self._identity_lock:
+                if self._identity_is_fresh() or self._load_identity():
+                    return self.profile
             
         url = f"{self.api_url}/userinfo"
         headers = {
@@ -171,7 +431,8 @@ class LinkedInAuth:
         
         try:
             Console.info("Retrieving LinkedIn profile...")
-            response = requests.get(url, headers=headers)
+            response = self.http.get(url, headers=headers)
+            self.check_response(response)
             
             if response.status_code == 200:
                 data = response.json()
@@ -187,7 +448,14 @@ class LinkedInAuth:
                 for key, value in profile_summary.items():
                     Console.info(f"{key}: {value}")
                 
-                self.person_id = data.get('sub')
+                with self._identity_lock:
+                    self.person_id = data.get('sub')
+                    self.profile = data
+                    self._identity_token = self._token_fingerprint()
+                    self._identity_fetched_at = time.time()
+                    if self.person_id:
+                        self._save_identity()
+                
                 if self.person_id:
                     Console.info(f"LinkedIn Person ID: {self.person_id}")
                 
@@ -4,18 +4,28 @@ LinkedIn comment monitoring and response module
 
 import time
 import json
-import requests
 from datetime import datetime, timedelta
 from utils.console import Console, Colors
+from utils.http_client import get_http_client
 
 class LinkedInCommentResponder:
     """Class for monitoring and responding to LinkedIn comments"""
     
-    def __init__(self, auth, content_generator, discord_notifier=None):
-        """Initialize with LinkedIn authentication and content generator"""
+    def __init__(self, auth, content_generator, discord_notifier=None, author=None):
+        """Initialize with LinkedIn authentication and content generator
+        
+        Args:
+            auth (LinkedInAuth): Authentication for the account
+            content_generator (ContentGenerator): Generates the replies
+            discord_notifier (DiscordNotifier, optional): Notifier for replies
+            author (str, optional): URN the posts were published as, e.g. a company
+                page's 'urn:li:organization:12345'; the member's own URN if not given
+        """
         self.auth = auth
+        self.author = author
         self.content_generator = content_generator
         self.discord_notifier = discord_notifier
+        self.http = get_http_client()
         self.processed_comments = set()
         self.check_interval = 60  # Check every minute by default
         self.latest_post_id = None
@@ -39,6 +49,14 @@ class LinkedInCommentResponder:
             json.dump({"comment_ids": list(self.processed_comments)}, f)
             Console.debug(f"Saved {len(self.processed_comments)} processed comments")
     
+    def actor_urn(self):
+        """The URN replies are posted as, or None if it can't be determined"""
+        if self.author:
+            return self.author
+        
+        person_id = self.auth.get_person_id()
+        return f"urn:li:person:{person_id}" if person_id else None
+    
     def get_recent_posts(self, days_back=7, max_posts=10):
         """Get your recent LinkedIn posts (RESTRICTED API ACCESS)
         
@@ -58,13 +76,14 @@ class LinkedInCommentResponder:
         
         # Check authentication status
         Console.debug("Checking auth - Token exists: " + str(bool(self.auth.access_token)))
-        Console.debug("Checking auth - Person ID exists: " + str(bool(self.auth.person_id)))
+        author_urn = self.actor_urn()
+        Console.debug("Checking auth - Author URN exists: " + str(bool(author_urn)))
         
-        if not self.auth.access_token or not self.auth.person_id:
+        if not self.auth.ensure_token() or not author_urn:
             Console.warning("Not authenticated. Cannot fetch recent posts.")
             return []
         
-        Console.debug(f"Person ID being used: {self.auth.person_id}")
+        Console.debug(f"Author URN being used: {author_urn}")
         
         url = f"{self.auth.api_url}/ugcPosts"
         headers = {
@@ -75,12 +94,13 @@ class LinkedInCommentResponder:
         
         params = {
             'q': 'authors',
-            'authors': f"List(urn:li:person:{self.auth.person_id})",
+            'authors': f"List({author_urn})",
             'count': max_posts
         }
         
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = self.http.get(url, headers=headers, params=params)
+            self.auth.check_response(response)
             Console.debug(f"API Response Status: {response.status_code}")
             
             if response.status_code == 200:
@@ -132,7 +152,7 @@ class LinkedInCommentResponder:
         Returns:
             list: List of comment objects with id, actor, comment text
         """
-        if not self.auth.access_token:
+        if not self.auth.ensure_token():
             Console.warning("Not authenticated. Please run authenticate() first.")
             return []
         
@@ -147,21 +167,24 @@ class LinkedInCommentResponder:
         
         try:
             Console.debug(f"Fetching comments for post: {post_id}")
-            response = requests.get(url, headers=headers)
+            response = self.http.get(url, headers=headers)
+            self.auth.check_response(response)
             
             if response.status_code == 200:
                 data = response.json()
                 comments = data.get('elements', [])
+                author_urn = self.actor_urn()
                 
                 processed_comments = []
                 for comment in comments:
                     # Extract the commenter and comment text
                     comment_id = comment.get('id')
-                    actor = comment.get('actor', 'urn:li:person:unknown').split(':')[-1]
+                    actor_urn = comment.get('actor', 'urn:li:person:unknown')
+                    actor = actor_urn.split(':')[-1]
                     comment_text = comment.get('message', {}).get('text', '')
                     
-                    # Skip comments by the post author (yourself)
-                    if actor == self.auth.person_id:
+                    # Skip comments by the post author (yourself, or the company page)
+                    if actor_urn == author_urn:
                         continue
                     
                     processed_comments.append({
@@ -202,23 +225,30 @@ class LinkedInCommentResponder:
             Console.error(f"Error getting comments: {str(e)}")
             return []
     
-    def reply_to_comment(self, comment_obj, article_title):
+    def reply_to_comment(self, comment_obj, article_title, reply_text=None):
         """Reply to a specific comment
         
         Args:
             comment_obj (dict): The comment object with id, actor, text, post_id
             article_title (str): The title of the article from the original post
+            reply_text (str, optional): Already generated reply; generated here if not given
             
         Returns:
             bool: True if reply was successful, False otherwise
         """
-        if not self.auth.access_token:
+        if not self.auth.ensure_token():
             Console.warning("Not authenticated. Please run authenticate() first.")
             return False
         
         # Generate the reply content
-        Console.info(f"Generating reply to comment: \"{comment_obj['text'][:50]}...\"")
-        reply_text = self.content_generator.generate_comment_reply(comment_obj['text'], article_title)
+        if reply_text is None:
+            Console.info(f"Generating reply to comment: \"{comment_obj['text'][:50]}...\"")
+            reply_text = self.content_generator.generate_comment_reply(comment_obj['text'], article_title)
+        
+        author_urn = self.actor_urn()
+        if not author_urn:
+            Console.error("Could not determine the LinkedIn author to reply as")
+            return False
         
         # Post the reply
         url = f"{self.auth.api_url}/socialActions/{comment_obj['post_id']}/comments"
@@ -229,7 +259,7 @@ class LinkedInCommentResponder:
         }
         
         data = {
-            "actor": f"urn:li:person:{self.auth.person_id}",
+            "actor": author_urn,
             "message": {
                 "text": reply_text
             },
@@ -238,7 +268,8 @@ class LinkedInCommentResponder:
         
         try:
             Console.info("Posting reply to LinkedIn...")
-            response = requests.post(url, headers=headers, json=data)
+            response = self.http.post(url, headers=headers, json=data)
+            self.auth.check_response(response)
             
             if response.status_code in (200, 201):
                 Console.success(f"Successfully replied to comment")
@@ -290,15 +321,23 @@ class LinkedInCommentResponder:
         for post_id in recent_posts:
             comments = self.get_comments_for_post(post_id)
             
-            for comment in comments:
-                # Skip comments we've already processed
-                if comment['id'] in self.processed_comments:
-                    continue
+            # Skip comments we've already processed
+            new_comments = [comment for comment in comments if comment['id'] not in self.processed_comments]
+            if not new_comments:
+                continue
                 
+            for comment in new_comments:
                 Console.info(f"New comment found: \"{comment['text'][:50]}...\"")
                 
+            # Generate all replies for this post together (batched LLM requests)
+            reply_texts = self.content_generator.generate_comment_replies(
+                [comment['text'] for comment in new_comments],
+                article_title
+            )
+            
+            for comment, reply_text in zip(new_comments, reply_texts):
                 # Reply to the comment
-                success = self.reply_to_comment(comment, article_title)
+                success = self.reply_to_comment(comment, article_title, reply_text)
                 
                 if success:
                     reply_count += 1
@@ -0,0 +1,224 @@
+"""
+LinkedIn media upload module
+"""
+
+import io
+import os
+import mmap
+from concurrent.futures import ThreadPoolExecutor
+from config import Config
+from utils.console import Console
+from utils.http_client import get_http_client
+
+_SINGLE_UPLOAD = 'com.linkedin.digitalmedia.uploadMechanism.MediaUploadHttpRequest'
+_MULTIPART_UPLOAD = 'com.linkedin.digitalmedia.uploadMechanism.MultipartUpload'
+
+class MediaUploadError(Exception):
+    """Raised when registering or uploading a media file fails"""
+
+class MappedRange(io.RawIOBase):
+    """Read-only file object over a byte range of a memory-mapped file
+    
+    Lets requests stream an upload body straight from the page cache: each
+    read() copies only the requested chunk, and Content-Length comes from
+    len(). Seekable, so a retried request can rewind it.
+    """
+    
+    def __init__(self, mapped, start, end):
+        """Wrap mapped[start:end]"""
+        super().__init__()
+        self.mapped = mapped
+        self.start = start
+        self.end = end
+        self.position = start
+    
+    def __len__(self):
+        """Size of the range (requests subtracts tell() to get what's left)"""
+        return self.end - self.start
+    
+    def readable(self):
+        return True
+    
+    def seekable(self):
+        return True
+    
+    def tell(self):
+        """Offset from the start of the range"""
+        return self.position - self.start
+    
+    def seek(self, offset, whence=io.SEEK_SET):
+        """Move within the range"""
+        base = {io.SEEK_SET: self.start, io.SEEK_CUR: self.position, io.SEEK_END: self.end}[whence]
+        self.position = min(max(base + offset, self.start), self.end)
+        return self.tell()
+    
+    def read(self, size=-1):
+        """Read up to size bytes (the rest of the range if size < 0)"""
+        end = self.end if size is None or size < 0 else min(self.end, self.position + size)
+        data = self.mapped[self.position:end]
+        self.position = end
+        return data
+    
+    def readinto(self, buffer):
+        """Read into a buffer, returning the number of bytes read"""
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+class MediaUploader:
+    """Uploads images and documents with LinkedIn's register-upload flow
+    
+    A file is registered with the assets API, which answers with either one
+    upload URL or, for large files, a list of byte ranges with their own
+    URLs. The file is memory-mapped rather than read into memory, and each
+    body is streamed from the mapping in chunks; multipart uploads send
+    their parts concurrently and are then completed with the parts' ETags.
+    """
+    
+    def __init__(self, auth, settings=None):
+        """Initialize with LinkedIn authentication
+        
+        Args:
+            auth (LinkedInAuth): Authentication for the account
+            settings (dict, optional): Config.media_settings
+        """
+        settings = settings or Config().media_settings
+        self.auth = auth
+        self.api_url = (settings.get('api_url') or auth.api_url).rstrip('/')
+        self.recipes = settings['recipes']
+        self.part_concurrency = settings['part_concurrency']
+        self.upload_timeout = settings['upload_timeout']
+        self.http = get_http_client()
+    
+    def _headers(self):
+        """Headers for assets API calls"""
+        return {
+            'Authorization': f'Bearer {self.auth.access_token}',
+            'Content-Type': 'application/json',
+            'X-Restli-Protocol-Version': '2.0.0'
+        }
+    
+    def register(self, media_type, owner, file_size):
+        """Register an upload and return LinkedIn's instructions for it
+        
+        Args:
+            media_type (str): A key of the configured recipes ('image' or 'document')
+            owner (str): URN of the account that will own the asset
+            file_size (int): Size of the file in bytes
+        
+        Returns:
+            dict: The registerUpload response 'value'
+        """
+        recipe = self.recipes.get(media_type)
+        if recipe is None:
+            raise MediaUploadError(f"Unsupported media type '{media_type}'")
+        
+        data = {
+            "registerUploadRequest": {
+                "recipes": [recipe],
+                "owner": owner,
+                "fileSize": file_size,
+                "supportedUploadMechanism": ["SYNCHRONOUS_UPLOAD", "MULTIPART_UPLOAD"],
+                "serviceRelationships": [
+                    {
+                        "relationshipType": "OWNER",
+                        "identifier": "urn:li:userGeneratedContent"
+                    }
+                ]
+            }
+        }
+        
+        response = self.http.post(f"{self.api_url}/assets?action=registerUpload", headers=self._headers(), json=data)
+        self.auth.check_response(response)
+        if response.status_code not in (200, 201):
+            raise MediaUploadError(f"Failed to register upload: {response.status_code} {response.text[:200]}")
+        return response.json()['value']
+    
+    def _put_range(self, url, headers, mapped, start, end):
+        """Stream one byte range to an upload URL
+        
+        Returns:
+            requests.Response: The upload response
+        """
+        headers = dict(headers or {})
+        headers.setdefault('Authorization', f'Bearer {self.auth.access_token}')
+        headers.setdefault('Content-Type', 'application/octet-stream')
+        
+        body = MappedRange(mapped, start, end)
+        response = self.http.request(
+            'PUT', url,
+            headers=headers,
+            data=body,
+            timeout=(self.http.timeout[0], self.upload_timeout)
+        )
+        if response.status_code not in (200, 201):
+            raise MediaUploadError(f"Upload of bytes {start}-{end - 1} failed: {response.status_code}")
+        return response
+    
+    def _upload_multipart(self, mechanism, mapped):
+        """Upload all parts concurrently, then complete the upload"""
+        parts = mechanism['partUploadRequests']
+        Console.info(f"Uploading {len(parts)} parts, {self.part_concurrency} at a time")
+        
+        def upload_part(part):
+            byte_range = part['byteRange']
+            response = self._put_range(
+                part['url'], part.get('headers'), mapped,
+                byte_range['firstByte'], byte_range['lastByte'] + 1
+            )
+            return {
+                "httpStatusCode": response.status_code,
+                "headers": {"ETag": response.headers.get('ETag')}
+            }
+        
+        with ThreadPoolExecutor(max_workers=self.part_concurrency, thread_name_prefix="media-part") as executor:
+            part_responses = list(executor.map(upload_part, parts))
+        
+        data = {
+            "completeMultipartUploadRequest": {
+                "mediaArtifact": mechanism['mediaArtifact'],
+                "metadata": mechanism['metadata'],
+                "partUploadResponses": part_responses
+            }
+        }
+        response = self.http.post(
+            f"{self.api_url}/assets?action=completeMultiPartUpload", headers=self._headers(), json=data
+        )
+        self.auth.check_response(response)
+        if response.status_code not in (200, 201):
+            raise MediaUploadError(f"Failed to complete multipart upload: {response.status_code}")
+    
+    def upload(self, file_path, media_type, owner):
+        """Upload a file and return its asset URN
+        
+        Args:
+            file_path (str): Image or PDF to upload
+            media_type (str): 'image' or 'document'
+            owner (str): URN of the account that will own the asset
+        
+        Returns:
+            str: The asset URN to reference in a post
+        
+        Raises:
+            MediaUploadError: If registration or any upload step fails
+        """
+        file_size = os.path.getsize(file_path)
+        if file_size == 0:
+            raise MediaUploadError(f"{file_path} is empty")
+        
+        registration = self.register(media_type, owner, file_size)
+        mechanism = registration['uploadMechanism']
+        asset = registration['asset']
+        Console.info(f"Uploading {os.path.basename(file_path)} ({file_size / 1024:.0f} KB) as {asset}")
+        
+        with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if _MULTIPART_UPLOAD in mechanism:
+                self._upload_multipart(mechanism[_MULTIPART_UPLOAD], mapped)
+            elif _SINGLE_UPLOAD in mechanism:
+                single = mechanism[_SINGLE_UPLOAD]
+                self._put_range(single['uploadUrl'], single.get('headers'), mapped, 0, file_size)
+            else:
+                raise MediaUploadError(f"Unsupported upload mechanism: {', '.join(mechanism)}")
+        
+        Console.success(f"Uploaded {os.path.basename(file_path)}")
+        return asset
\ No newline at end of file
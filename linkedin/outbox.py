@@ -0,0 +1,360 @@
+"""
+Post outbox module for the LinkedIn AI News Bot
+"""
+
+import time
+import random
+import sqlite3
+import hashlib
+import threading
+from utils.console import Console
+from utils.url_index import canonicalize_url
+from linkedin.poster import PUBLISHED, RETRY, UNCERTAIN
+
+# Entry states
+PENDING = 'pending'  # Waiting to be sent (or re-sent)
+SENDING = 'sending'  # Sent, or being sent, without a confirmed answer
+PUBLISHED_STATE = 'published'  # Accepted by LinkedIn, not yet recorded in the history
+RECORDED = 'recorded'  # Accepted and recorded; done
+FAILED = 'failed'  # Given up on
+UNKNOWN = 'unknown'  # May or may not have been published; never sent again
+
+_COLUMNS = (
+    'dedup_key', 'namespace', 'article_link', 'article_title', 'content', 'quality_score',
+    'status', 'attempts', 'next_attempt_at', 'last_error', 'post_id', 'created_at', 'updated_at'
+)
+
+class PostOutbox:
+    """Write-ahead log of posts to publish, kept in SQLite
+    
+    A post is written here, with a dedup key derived from its article,
+    before anything is sent to LinkedIn, and its state is updated around
+    every send. After a crash or an ambiguous failure the entry is still
+    there to be reconciled, and enqueuing the same article again returns the
+    existing entry instead of creating a second post.
+    """
+    
+    def __init__(self, db_file="post_outbox.db", namespace=""):
+        """Open (or create) the outbox
+        
+        Args:
+            db_file (str): Path to the SQLite database
+            namespace (str): Keeps separate outboxes in one file (e.g. per account)
+        """
+        self.db_file = db_file
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        
+        self.conn = sqlite3.connect(db_file, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS outbox ("
+            " dedup_key TEXT PRIMARY KEY,"
+            " namespace TEXT NOT NULL,"
+            " article_link TEXT NOT NULL,"
+            " article_title TEXT NOT NULL,"
+            " content TEXT NOT NULL,"
+            " quality_score REAL,"
+            " status TEXT NOT NULL,"
+            " attempts INTEGER NOT NULL DEFAULT 0,"
+            " next_attempt_at REAL NOT NULL,"
+            " last_error TEXT,"
+            " post_id TEXT,"
+            " created_at REAL NOT NULL,"
+            " updated_at REAL NOT NULL"
+            ")"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS outbox_status ON outbox (namespace, status, next_attempt_at)")
+        self.conn.commit()
+    
+    def make_key(self, article):
+        """Dedup key of a post: one post per article (and namespace)"""
+        canonical = f"{self.namespace}\n{canonicalize_url(article['link'])}"
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+    
+    def enqueue(self, article, content, quality_score=None):
+        """Persist a post before it is published
+        
+        If the article already has an entry, that entry is kept (and its
+        content is what will be posted), unless it had failed, in which case
+        it is replaced with the new draft. An entry whose outcome is unknown
+        is kept too, so the article can't end up posted twice.
+        
+        Returns:
+            str: The entry's dedup key
+        """
+        key = self.make_key(article)
+        now = time.time()
+        with self._lock:
+            self.conn.execute(
+                "DELETE FROM outbox WHERE dedup_key = ? AND status = ?", (key, FAILED)
+            )
+            self.conn.execute(
+                "INSERT OR IGNORE INTO outbox (dedup_key, namespace, article_link, article_title, content,"
+                " quality_score, status, attempts, next_attempt_at, created_at, updated_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, 0, ?, ?, ?)",
+                (key, self.namespace, article['link'], article.get('title', ''), content,
+                 quality_score, PENDING, now, now, now)
+            )
+            self.conn.commit()
+        return key
+    
+    def _rows(self, where, params):
+        """Entries of this namespace matching a condition, oldest first"""
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM outbox WHERE namespace = ? AND {where} ORDER BY created_at",
+                (self.namespace,) + params
+            ).fetchall()
+        return [dict(zip(_COLUMNS, row)) for row in rows]
+    
+    def get(self, key):
+        """Return an entry as a dict, or None"""
+        rows = self._rows("dedup_key = ?", (key,))
+        return rows[0] if rows else None
+    
+    def due(self, now=None):
+        """Entries to send, or to check on, whose time has come"""
+        return self._rows("status IN (?, ?) AND next_attempt_at <= ?", (PENDING, SENDING, now or time.time()))
+    
+    def in_state(self, status):
+        """All entries in a state"""
+        return self._rows("status = ?", (status,))
+    
+    def next_attempt_at(self):
+        """Earliest scheduled send or check, or None"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT MIN(next_attempt_at) FROM outbox WHERE namespace = ? AND status IN (?, ?)",
+                (self.namespace, PENDING, SENDING)
+            ).fetchone()
+        return row[0]
+    
+    def _update(self, key, **fields):
+        """Set fields of an entry"""
+        fields['updated_at'] = time.time()
+        assignments = ', '.join(f"{name} = ?" for name in fields)
+        with self._lock:
+            self.conn.execute(
+                f"UPDATE outbox SET {assignments} WHERE dedup_key = ?", tuple(fields.values()) + (key,)
+            )
+            self.conn.commit()
+    
+    def mark_sending(self, key, attempts):
+        """Record that an attempt is about to be sent"""
+        self._update(key, status=SENDING, attempts=attempts)
+    
+    def mark_uncertain(self, key, delay, error):
+        """Schedule a check of whether an uncertain send went through"""
+        self._update(key, status=SENDING, next_attempt_at=time.time() + delay, last_error=error)
+    
+    def mark_published(self, key, post_id):
+        """Record that LinkedIn accepted the post"""
+        self._update(key, status=PUBLISHED_STATE, post_id=post_id, last_error=None)
+    
+    def mark_recorded(self, key):
+        """Record that the published post is in the posting history"""
+        self._update(key, status=RECORDED)
+    
+    def mark_retry(self, key, delay, error):
+        """Schedule another attempt"""
+        self._update(key, status=PENDING, next_attempt_at=time.time() + delay, last_error=error)
+    
+    def mark_failed(self, key, error):
+        """Give up on an entry"""
+        self._update(key, status=FAILED, last_error=error)
+    
+    def mark_unknown(self, key, error):
+        """Give up on an entry that may already have been published"""
+        self._update(key, status=UNKNOWN, last_error=error)
+    
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self.conn.close()
+
+class OutboxDelivery:
+    """Background worker that publishes the outbox's pending posts
+    
+    Sends due entries, retrying transient failures with jittered exponential
+    backoff, and reports each final outcome through the callbacks. A post
+    LinkedIn may already have accepted (the send timed out, or an earlier
+    run stopped mid-send) is looked up among the account's recent posts
+    before it is ever sent again.
+    """
+    
+    def __init__(self, outbox, poster, on_published, on_failed, settings):
+        """Initialize the worker
+        
+        Args:
+            outbox (PostOutbox): Entries to deliver
+            poster (LinkedInPoster): Sends the posts
+            on_published (callable): Called with an entry once it is published;
+                the entry is marked recorded when it returns
+            on_failed (callable): Called with an entry that was given up on
+                (status FAILED, or UNKNOWN if it may have been published)
+            settings (dict): Config.outbox_settings
+        """
+        self.outbox = outbox
+        self.poster = poster
+        self.on_published = on_published
+        self.on_failed = on_failed
+        self.max_attempts = settings['max_attempts']
+        self.backoff_base = settings['backoff_base']
+        self.backoff_max = settings['backoff_max']
+        self.retry_unverified = settings['retry_unverified']
+        
+        self._wake_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._changed = threading.Condition()
+        self._thread = None
+    
+    def start(self):
+        """Start the worker (no-op if already running)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="post-outbox", daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """Stop the worker; undelivered entries stay in the outbox for the next run"""
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=30)
+            self._thread = None
+    
+    def notify(self):
+        """Wake the worker to deliver a newly enqueued post"""
+        self._wake_event.set()
+    
+    def wait_for(self, key, timeout):
+        """Wait until an entry is published or given up on
+        
+        Returns:
+            str: The entry's status when the wait ended
+        """
+        deadline = time.monotonic() + timeout
+        with self._changed:
+            while True:
+                entry = self.outbox.get(key)
+                status = entry['status'] if entry else FAILED
+                remaining = deadline - time.monotonic()
+                if status in (PUBLISHED_STATE, RECORDED, FAILED, UNKNOWN) or remaining <= 0:
+                    return status
+                self._changed.wait(min(remaining, 1.0))
+    
+    def _notify_changed(self):
+        """Wake threads waiting in wait_for"""
+        with self._changed:
+            self._changed.notify_all()
+    
+    def _backoff(self, attempts):
+        """Full-jitter exponential delay before the next attempt"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempts - 1)))
+    
+    def _run(self):
+        """Reconcile, then deliver until stopped"""
+        try:
+            self.reconcile()
+        except Exception as e:
+            Console.error(f"Error reconciling the post outbox: {str(e)}")
+        
+        while not self._stop_event.is_set():
+            self._wake_event.clear()
+            try:
+                for entry in self.outbox.due():
+                    if self._stop_event.is_set():
+                        return
+                    if entry['status'] == SENDING:
+                        self._resolve_uncertain(entry, entry['last_error'] or "Interrupted while sending")
+                    else:
+                        self.deliver(entry)
+            except Exception as e:
+                Console.error(f"Error delivering posts: {str(e)}")
+            
+            next_attempt_at = self.outbox.next_attempt_at()
+            timeout = None if next_attempt_at is None else max(0.0, next_attempt_at - time.time())
+            self._wake_event.wait(timeout)
+    
+    def reconcile(self):
+        """Record posts an earlier run published but stopped before recording
+        
+        Entries it left mid-send are due immediately, so the delivery loop
+        checks on them before sending anything new.
+        """
+        for entry in self.outbox.in_state(PUBLISHED_STATE):
+            self._record(entry)
+    
+    def _resolve_uncertain(self, entry, error):
+        """Decide what to do with a post that may or may not have been published"""
+        key = entry['dedup_key']
+        post_id = self.poster.find_recent_post(entry['content'], entry['created_at'])
+        
+        if post_id:
+            Console.success(f"Post for '{entry['article_title']}' was published after all (ID: {post_id})")
+            self.outbox.mark_published(key, post_id)
+            self._record(self.outbox.get(key))
+        elif post_id is False or self.retry_unverified:
+            self._schedule_retry(entry, error)
+        else:
+            # Resending could post it twice; leave it for a human to check
+            self.outbox.mark_unknown(key, f"Outcome unknown ({error}); not resent to avoid a duplicate post")
+            Console.warning(f"Could not confirm whether the post for '{entry['article_title']}' was published")
+            self._fail(self.outbox.get(key))
+    
+    def _schedule_retry(self, entry, error):
+        """Retry an entry later, or give up once it is out of attempts"""
+        key = entry['dedup_key']
+        if entry['attempts'] >= self.max_attempts:
+            self.outbox.mark_failed(key, error)
+            self._fail(self.outbox.get(key))
+            return
+        
+        delay = self._backoff(entry['attempts'])
+        self.outbox.mark_retry(key, delay, error)
+        Console.warning(f"Post delivery failed ({error}), retrying in {delay:.0f}s "
+                        f"(attempt {entry['attempts'] + 1}/{self.max_attempts})")
+        self._notify_changed()
+    
+    def deliver(self, entry):
+        """Send one entry and record the outcome"""
+        key = entry['dedup_key']
+        entry['attempts'] += 1
+        self.outbox.mark_sending(key, entry['attempts'])
+        
+        outcome, detail = self.poster.submit_post(entry['content'])
+        
+        if outcome == PUBLISHED:
+            self.outbox.mark_published(key, detail)
+            self._record(self.outbox.get(key))
+        elif outcome == UNCERTAIN:
+            # Give LinkedIn a moment before checking whether the post appeared
+            delay = self._backoff(entry['attempts']) + self.backoff_base
+            self.outbox.mark_uncertain(key, delay, detail)
+            Console.warning(f"Post delivery outcome unknown ({detail}), checking again in {delay:.0f}s")
+        elif outcome == RETRY:
+            self._schedule_retry(entry, detail)
+        else:
+            self.outbox.mark_failed(key, detail)
+            self._fail(self.outbox.get(key))
+    
+    def _record(self, entry):
+        """Hand a published entry to the bot, then mark it recorded"""
+        try:
+            self.on_published(entry)
+        except Exception as e:
+            # Left as published, so the next reconcile records it again
+            Console.error(f"Error recording published post: {str(e)}")
+        else:
+            self.outbox.mark_recorded(entry['dedup_key'])
+        self._notify_changed()
+    
+    def _fail(self, entry):
+        """Report an entry that was given up on"""
+        try:
+            self.on_failed(entry)
+        except Exception as e:
+            Console.error(f"Error reporting failed post: {str(e)}")
+        self._notify_changed()
\ No newline at end of file
@@ -3,28 +3,113 @@ LinkedIn posting module
 """
 
 import json
-import requests
+import requests # type: ignore
 from utils.console import Console, Colors
+from utils.http_client import get_http_client
+from linkedin.media import MediaUploader, MediaUploadError
+
+# Outcomes of a publish attempt
+PUBLISHED = 'published'  # LinkedIn accepted the post
+RETRY = 'retry'  # Not accepted; safe to send again
+UNCERTAIN = 'uncertain'  # May have been accepted (e.g. timed out waiting for the answer)
+FAILED = 'failed'  # Rejected; sending it again won't help
+
+# shareMediaCategory for each uploadable media type
+MEDIA_CATEGORIES = {
+    'image': 'IMAGE',
+    'document': 'NATIVE_DOCUMENT'
+}
 
 class LinkedInPoster:
     """Class for posting content to LinkedIn"""
     
-    def __init__(self, auth):
-        """Initialize with LinkedIn authentication"""
+    def __init__(self, auth, author=None):
+        """Initialize with LinkedIn authentication
+        
+        Args:
+            auth (LinkedInAuth): Authentication for the account
+            author (str, optional): Author URN to post as, e.g. 'urn:li:organization:12345'
+                for a company page the account administers; the member's own profile if not given
+        """
         self.auth = auth
+        self.author = author
         self.last_post_id = None
+        self.http = get_http_client()
+        self.media_uploader = MediaUploader(auth)
+    
+    def author_urn(self):
+        """The URN posts are published as, or None if it can't be determined"""
+        if self.author:
+            return self.author
+        
+        # Get the person ID for the author format (cached after the first post)
+        person_id = self.auth.get_person_id()
+        return f"urn:li:person:{person_id}" if person_id else None
     
     def create_text_post(self, content):
         """Create a text post to LinkedIn"""
-        if not self.auth.access_token:
+        outcome, _ = self.submit_post(content)
+        return outcome == PUBLISHED
+    
+    def create_media_post(self, content, file_path, media_type='image', title=None):
+        """Create a post with an attached image or document (PDF)
+        
+        Args:
+            content (str): Post text
+            file_path (str): File to attach
+            media_type (str): 'image' or 'document'
+            title (str, optional): Title shown with the attachment
+        """
+        outcome, _ = self.submit_post(content, media={'path': file_path, 'type': media_type, 'title': title})
+        return outcome == PUBLISHED
+    
+    def submit_post(self, content, media=None):
+        """Send a post and classify the result for safe retrying
+        
+        Args:
+            content (str): Post text
+            media (dict, optional): Attachment with its 'path', 'type' ('image'
+                or 'document') and optional 'title'; uploaded before posting
+        
+        Returns:
+            tuple: (outcome, detail) - one of PUBLISHED, RETRY, UNCERTAIN or
+                FAILED, with the post ID when published or an error message
+        """
+        if not self.auth.ensure_token():
             Console.warning("Not authenticated. Please run authenticate() first.")
-            return False
+            return RETRY, "Not authenticated"
         
-        # Get user profile information to get the correct author format
-        user_profile = self.auth.get_user_profile()
-        if not user_profile or not self.auth.person_id:
+        author_format = self.author_urn()
+        if not author_format:
             Console.error("Could not determine author format")
-            return False
+            return RETRY, "Could not determine author format"
+        
+        share_content = {
+            "shareCommentary": {
+                "text": content
+            },
+            "shareMediaCategory": "NONE"
+        }
+        
+        if media:
+            if media['type'] not in MEDIA_CATEGORIES:
+                return FAILED, f"Unsupported media type '{media['type']}'"
+            
+            # Nothing is posted until the upload succeeds, so upload failures are safe to retry
+            try:
+                asset = self.media_uploader.upload(media['path'], media['type'], author_format)
+            except (MediaUploadError, requests.RequestException) as e:
+                Console.error(f"Media upload failed: {str(e)}")
+                return RETRY, str(e)
+            except OSError as e:
+                Console.error(f"Could not read media file: {str(e)}")
+                return FAILED, str(e)
+            
+            share_content["shareMediaCategory"] = MEDIA_CATEGORIES[media['type']]
+            media_item = {"status": "READY", "media": asset}
+            if media.get('title'):
+                media_item["title"] = {"text": media['title']}
+            share_content["media"] = [media_item]
         
         url = f"{self.auth.api_url}/ugcPosts"
         headers = {
@@ -33,34 +118,95 @@ class LinkedInPoster:
             'X-Restli-Protocol-Version': '2.0.0'
         }
         
-        author_format = f"urn:li:person:{self.auth.person_id}"
         post_data = {
             "author": author_format,
             "lifecycleState": "PUBLISHED",
             "specificContent": {
-                "com.linkedin.ugc.ShareContent": {
-                    "shareCommentary": {
-                        "text": content
-                    },
-                    "shareMediaCategory": "NONE"
-                }
+                "com.linkedin.ugc.ShareContent": share_content
             },
             "visibility": {
                 "com.linkedin.ugc.MemberNetworkVisibility": "PUBLIC"
             }
         }
         
-        response = requests.post(url, headers=headers, json=post_data)
+        try:
+            response = self.http.post(url, headers=headers, json=post_data)
+        except requests.ConnectTimeout as e:
+            # Never connected, so nothing was sent
+            Console.error(f"Could not connect to LinkedIn: {str(e)}")
+            return RETRY, str(e)
+        except requests.ConnectionError as e:
+            # Covers failures to connect, but also connections dropped after sending
+            Console.error(f"Error posting to LinkedIn: {str(e)}")
+            return UNCERTAIN, str(e)
+        except requests.Timeout as e:
+            Console.error(f"Timed out posting to LinkedIn: {str(e)}")
+            return UNCERTAIN, str(e)
+        self.auth.check_response(response)
         
         if response.status_code in (200, 201):
-            post_id = response.json().get('id')
+            post_id = response.json().get('id') or response.headers.get('x-restli-id')
             self.last_post_id = post_id  # Store the post ID for later use
             Console.success(f"Successfully posted to LinkedIn! Post ID: {post_id}")
-            return True
-        else:
-            Console.error(f"Failed to post: {response.status_code}")
-            Console.error(f"Response: {response.text}")
-            return False
+            return PUBLISHED, post_id
+        
+        Console.error(f"Failed to post: {response.status_code}")
+        Console.error(f"Response: {response.text}")
+        error = f"status {response.status_code}"
+        if response.status_code in (401, 429):
+            return RETRY, error
+        if response.status_code >= 500:
+            return UNCERTAIN, error
+        return FAILED, error
+    
+    def find_recent_post(self, content, since):
+        """Look for a post with this exact text published after a time
+        
+        Used to find out whether a send with an uncertain outcome went through.
+        
+        Args:
+            content (str): Post text
+            since (float): Unix time the post can't be older than
+        
+        Returns:
+            str: The post ID if found, False if it definitely isn't there, or
+                None if LinkedIn couldn't be asked (e.g. missing permissions)
+        """
+        author = self.author_urn() if self.auth.ensure_token() else None
+        if not author:
+            return None
+        
+        url = f"{self.auth.api_url}/ugcPosts"
+        headers = {
+            'Authorization': f'Bearer {self.auth.access_token}',
+            'X-Restli-Protocol-Version': '2.0.0'
+        }
+        params = {
+            'q': 'authors',
+            'authors': f"List({author})",
+            'count': 10
+        }
+        
+        try:
+            response = self.http.get(url, headers=headers, params=params)
+        except requests.RequestException as e:
+            Console.warning(f"Could not check recent LinkedIn posts: {str(e)}")
+            return None
+        self.auth.check_response(response)
+        
+        if response.status_code != 200:
+            Console.debug(f"Could not check recent LinkedIn posts: {response.status_code}")
+            return None
+        
+        for post in response.json().get('elements', []):
+            created = post.get('created', {}).get('time', 0) / 1000
+            text = (post.get('specificContent', {})
+                    .get('com.linkedin.ugc.ShareContent', {})
+                    .get('shareCommentary', {})
+                    .get('text'))
+            if text == content and created >= since - 60:
+                return post.get('id')
+        return False
             
     def get_last_post_id(self):
         """Get the ID of the last created post"""
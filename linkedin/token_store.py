@@ -0,0 +1,70 @@
+"""
+LinkedIn token storage module
+"""
+
+import os
+import json
+import tempfile
+from utils.console import Console
+
+def write_private_json(path, data):
+    """Atomically write JSON to a file only the current user can read
+    
+    The data goes to a 0600 temporary file in the same directory which then
+    replaces the target, so readers never see a partial file and the secret
+    is never briefly world-readable.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-', suffix='.json')
+    try:
+        os.chmod(tmp_path, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+class TokenStore:
+    """OAuth tokens persisted on disk between runs
+    
+    Holds the access token, its expiry and the refresh token, so a restarted
+    bot can post straight away instead of asking for a browser login.
+    """
+    
+    def __init__(self, token_file):
+        """Initialize with the token file path"""
+        self.token_file = token_file
+    
+    def load(self):
+        """Load the stored tokens
+        
+        Returns:
+            dict: Token data, or None if there is none (or it can't be read)
+        """
+        if not os.path.exists(self.token_file):
+            return None
+        
+        try:
+            mode = os.stat(self.token_file).st_mode & 0o777
+            if mode & 0o077:
+                Console.warning(f"{self.token_file} is readable by other users; restricting it to 0600")
+                os.chmod(self.token_file, 0o600)
+            
+            with open(self.token_file, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            Console.warning(f"Could not read stored LinkedIn token: {str(e)}")
+            return None
+        
+        return data if data.get('access_token') else None
+    
+    def save(self, data):
+        """Save token data (access_token, expires_at, refresh_token, ...)"""
+        try:
+            write_private_json(self.token_file, data)
+        except OSError as e:
+            Console.warning(f"Could not save LinkedIn token: {str(e)}")
\ No newline at end of file
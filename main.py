@@ -8,8 +8,10 @@ to LinkedIn using LLM-generated content.
 
 import os
 import sys
+import json
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import random
 import argparse
@@ -20,10 +22,14 @@ from dotenv import load_dotenv # type: ignore
 from linkedin.auth import LinkedInAuth
 from linkedin.poster import LinkedInPoster
 from linkedin.comment_responder import LinkedInCommentResponder
+from linkedin import outbox
+from linkedin.accounts import PostedByAllAccounts, load_accounts
 from news.fetcher import NewsFetcher
 from news.filter import NewsFilter
 from content.generator import ContentGenerator
 from content.evaluator import ContentEvaluator
+from content.engagement import load_engagement_model, train_from_records, engagement_available
+from content.pregenerator import PostPregenerator
 from utils.history import PostingHistory
 from utils.analytics import Analytics
 from utils.discord_notifier import DiscordNotifier
@@ -39,12 +45,16 @@ def parse_arguments():
     parser.add_argument('--update-interval', type=int, default=30, 
                         help='Update interval in minutes (default: 30)')
     parser.add_argument('--verbose', action='store_true', help='Show detailed debug information')
+    parser.add_argument('--headless', action='store_true',
+                        help='Only use the stored LinkedIn token; never open a browser login')
+    parser.add_argument('--train-engagement', metavar='PATH',
+                        help='Train the engagement model from a JSONL file of past posts and exit')
     return parser.parse_args()
 
 class AINewsBot:
     """Main bot class that orchestrates the posting process"""
     
-    def __init__(self, update_interval_minutes=30, verbose=False):
+    def __init__(self, update_interval_minutes=30, verbose=False, headless=False):
         """Initialize the LinkedIn AI News Bot"""
         load_dotenv()
         
@@ -63,6 +73,7 @@ class AINewsBot:
         self.discord = DiscordNotifier()
         
         # Initialize components
+        self.headless = headless
         self.auth = LinkedInAuth(
             client_id=os.environ.get('LINKEDIN_CLIENT_ID'),
             client_secret=os.environ.get('LINKEDIN_CLIENT_SECRET'),
@@ -70,19 +81,35 @@ class AINewsBot:
         )
         
         self.poster = LinkedInPoster(self.auth)
-        self.news_fetcher = NewsFetcher(self.config.news_sources)
-        self.news_filter = NewsFilter()
+        
+        # Posts go through a durable outbox so a crash or timeout can't lose or duplicate them
+        self.outbox_settings = self.config.outbox_settings
+        self.outbox = outbox.PostOutbox(self.outbox_settings['outbox_file'])
+        self.delivery = outbox.OutboxDelivery(
+            self.outbox,
+            self.poster,
+            self._on_post_published,
+            self._on_post_failed,
+            self.outbox_settings
+        )
+        self.news_fetcher = NewsFetcher(self.config.news_sources, self.config.fetch_settings)
+        self.news_filter = NewsFilter(self.config.ranking_settings)
         
         # Setup history tracking
-        self.history = PostingHistory("posted_articles_history.json")
-        self.posted_articles = self.history.load_posted_articles()
+        history_settings = self.config.history_settings
+        self.history = PostingHistory(history_settings['history_file'])
+        self.posted_articles = self.history.load_posted_index(
+            history_settings['posted_index_file'],
+            capacity=history_settings['bloom_capacity'],
+            error_rate=history_settings['bloom_error_rate']
+        )
         self.last_post_time = self.history.get_last_post_time()
         
         # Initialize content generation
         self.llm_api_key = os.environ.get('LLM_API_KEY')
         self.llm_provider = os.environ.get('LLM_PROVIDER', 'groq')
-        self.content_generator = ContentGenerator(self.llm_api_key, self.llm_provider)
-        self.content_evaluator = ContentEvaluator()
+        self.content_evaluator = ContentEvaluator(model=load_engagement_model())
+        self.content_generator = ContentGenerator(self.llm_api_key, self.llm_provider, self.content_evaluator)
         
         # Setup analytics
         self.analytics = Analytics()
@@ -91,11 +118,20 @@ class AINewsBot:
         self.posts_per_day = self.config.posts_per_day
         self.min_hours_between_posts = self.config.min_hours_between_posts
     
+        # Background preparation of the next post while the scheduler waits
+        self.pregeneration_settings = self.config.pregeneration_settings
+        self.pregenerator = PostPregenerator(
+            self.select_articles,
+            self.choose_articles,
+            self.generate_candidate,
+            self.pregeneration_settings
+        )
+        self._prepare_lock = threading.Lock()
+    
     def authenticate(self):
         """Authenticate with LinkedIn"""
         Console.section("LinkedIn Authentication")
-        Console.info("Opening browser for authentication...")
-        return self.auth.authenticate()
+        return self.auth.authenticate(interactive=not self.headless)
     
     def run_once(self, force=False):
         """Run one cycle of the news bot
@@ -111,42 +147,85 @@ class AINewsBot:
             Console.warning(f"Too soon to post again. Waiting {hours_to_wait:.1f} hours until {next_post_time}")
             return False
         
-        # Fetch news from all sources
-        Console.section("Fetching News")
-        Console.info("Retrieving articles from configured sources...")
-        all_articles = self.news_fetcher.fetch_all_news()
+        # last_post_time is only set once a post is published; a second article
+        # must not go out while the previous one is still being retried
+        if self.outbox.next_attempt_at() is not None:
+            Console.warning("The previous post is still being delivered; skipping this cycle")
+            return False
+        
+        candidates = self.pregenerator.take()
+        if candidates:
+            Console.info("Using the post prepared in the background")
+        else:
+            candidates = self.prepare_post()
         
-        if not all_articles:
-            Console.error("No articles found")
+        candidate = self._pick_candidate(candidates)
+        if candidate is None:
             return False
         
-        # Filter to find the most relevant
-        Console.section("Filtering Articles")
-        Console.info("Analyzing and ranking articles by relevance...")
-        best_articles = self.news_filter.filter_news(all_articles, self.posted_articles)
+        return self.publish_post(candidate)
+    
+    def select_articles(self):
+        """Fetch news from all sources and rank it
+        
+        Returns:
+            list: Ranked articles, or None if there is nothing to post about
+        """
+        with self._prepare_lock:
+            # Fetch news from all sources and rank it as each source arrives
+            Console.section("Fetching and Filtering News")
+            Console.info("Retrieving articles and ranking them by relevance as sources respond...")
+            best_articles = self.news_filter.filter_news(self.news_fetcher.iter_all_news(), self.posted_articles)
+            
+            if not self.news_fetcher.last_article_count:
+                Console.error("No articles found")
+                return None
         
         if not best_articles:
             Console.error("No suitable articles found after filtering")
-            return False
+            return None
+        
+        return best_articles
+    
+    def choose_articles(self, best_articles):
+        """Pick the article to post about, followed by backup articles
         
-        # Select one article - either top article or random from top 3
-        selected_article = random.choice(best_articles[:3]) if len(best_articles) >= 3 else best_articles[0]
-        Console.article_info(selected_article)
+        The main article is either the top article or a random one from the
+        top 3; backups are the next best of the rest.
+        """
+        top_picks = self.pregeneration_settings['top_picks']
+        selected_article = random.choice(best_articles[:top_picks]) if len(best_articles) >= top_picks else best_articles[0]
+        backups = [article for article in best_articles if article is not selected_article]
+        return [selected_article] + backups[:self.pregeneration_settings['backup_candidates']]
+    
+    def generate_candidate(self, article, styles=None, use_cache=True):
+        """Generate and evaluate a post for an article
+        
+        Args:
+            article (dict): The article to write about
+            styles (list, optional): Post styles to choose from; all if not given
+            use_cache (bool): Whether cached completions may be reused
+        
+        Returns:
+            dict: The article, post content, quality score and when it was prepared
+        """
+        Console.article_info(article)
         
         # Check if it's a weekend and use weekend variation if so
         is_weekend = datetime.now().weekday() >= 5  # 5 and 6 are Saturday and Sunday
         
         # Generate post with LLM
         Console.section("Generating Content")
+        post_content = None
         if is_weekend:
             Console.info("Detected weekend - using weekend post style")
-            post_content = self.content_generator.create_post_variation(selected_article, "weekend")
-        else:
+            post_content = self.content_generator.create_post_variation(article, "weekend", use_cache=use_cache)
+        if not post_content:
             Console.info("Generating engaging LinkedIn post...")
-            post_content = self.content_generator.generate_post(selected_article)
+            post_content = self.content_generator.generate_post(article, use_cache=use_cache, styles=styles)
         
         # Evaluate post quality
-        quality_score = self.content_evaluator.evaluate(post_content, selected_article)
+        quality_score = self.content_evaluator.evaluate(post_content, article)
         if quality_score >= 7:
             Console.success(f"Post quality score: {quality_score}/9")
         elif quality_score >= 5:
@@ -154,53 +233,136 @@ class AINewsBot:
         else:
             Console.warning(f"Post quality score: {quality_score}/9")
         
-        # Post to LinkedIn
+        return {
+            'article': article,
+            'content': post_content,
+            'quality_score': quality_score,
+            'is_weekend': is_weekend,
+            'prepared_at': time.time()
+        }
+    
+    def prepare_post(self):
+        """Select articles and generate the post right now
+        
+        Returns:
+            list: Candidates, best first; empty if there was nothing to post about
+        """
+        best_articles = self.select_articles()
+        if not best_articles:
+            return []
+        
+        # Posting is waiting on this, so only the main post is generated;
+        # backups are only prepared in the background by the pregenerator
+        articles = self.choose_articles(best_articles)[:1]
+        return [self.generate_candidate(article) for article in articles]
+    
+    def _pick_candidate(self, candidates):
+        """Choose the candidate to publish
+        
+        Skips candidates whose article was posted in the meantime or that
+        were written for a different part of the week, and prefers ones that
+        meet the quality threshold.
+        """
+        is_weekend = datetime.now().weekday() >= 5
+        usable = [
+            candidate for candidate in candidates
+            if candidate['article']['link'] not in self.posted_articles and candidate['is_weekend'] == is_weekend
+        ]
+        
+        if not usable:
+            if candidates:
+                Console.warning("Prepared posts are out of date, preparing a new one")
+                return self._pick_candidate(self.prepare_post())
+            return None
+        
+        for candidate in usable:
+            if candidate['quality_score'] >= self.config.quality_threshold:
+                return candidate
+        return max(usable, key=lambda candidate: candidate['quality_score'])
+    
+    def publish_post(self, candidate):
+        """Publish a prepared post to LinkedIn and record it
+        
+        The post is first written to the outbox, then delivered by the
+        outbox worker; this waits a while for the outcome, after which
+        delivery (and any retries) carries on in the background.
+        
+        Args:
+            candidate (dict): Candidate from generate_candidate
+        
+        Returns:
+            bool: True if the post was published
+        """
+        selected_article = candidate['article']
+        
+        # Persist the draft before anything is sent
         Console.section("Posting to LinkedIn")
+        key = self.outbox.enqueue(selected_article, candidate['content'], candidate['quality_score'])
+        entry = self.outbox.get(key)
+        if entry['status'] in (outbox.PUBLISHED_STATE, outbox.RECORDED, outbox.UNKNOWN):
+            Console.warning("This article was already posted (or may have been); not posting it again")
+            return False
+        if entry['content'] != candidate['content']:
+            Console.info("A post for this article is already queued; delivering that one")
+        
         Console.info("Submitting post to LinkedIn API...")
         self.analytics.track_post_generated()
-        result = self.poster.create_text_post(post_content)
-        
-        current_time_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self.delivery.start()
+        self.delivery.notify()
         
-        if result:
-            # Track that we've posted this article
-            self.analytics.track_successful_post()
-            self.posted_articles.add(selected_article['link'])
-            self.last_post_time = current_time
+        status = self.delivery.wait_for(key, self.outbox_settings['wait_seconds'])
+        if status in (outbox.PUBLISHED_STATE, outbox.RECORDED):
+            return True
+        if status not in (outbox.FAILED, outbox.UNKNOWN):
+            Console.warning("Post not delivered yet; it will keep being retried in the background")
+        return False
+        
+    def _on_post_published(self, entry):
+        """Record a post the outbox delivered"""
+        # Track that we've posted this article
+        self.analytics.track_successful_post()
+        self.posted_articles.add(entry['article_link'])
+        self.last_post_time = entry['updated_at']
             
-            # Save history
-            self.history.save_posting_history(self.posted_articles, self.last_post_time, self.analytics.get_data())
+        # Save history
+        self.history.save_posting_history(self.posted_articles, self.last_post_time, self.analytics.get_data())
             
-            Console.success("Post successfully published to LinkedIn!")
+        Console.success("Post successfully published to LinkedIn!")
             
-            # Send notification to Discord
-            self.discord.send_post_success(selected_article['title'], quality_score, current_time_str)
+        # Send notification to Discord
+        current_time_str = datetime.fromtimestamp(entry['updated_at']).strftime('%Y-%m-%d %H:%M:%S')
+        self.discord.send_post_success(entry['article_title'], entry['quality_score'], current_time_str)
             
-            # Start monitoring for comments
-            self.monitor_comments_after_posting(selected_article['title'])
+        # Start monitoring for comments
+        self.monitor_comments_after_posting(entry['article_title'], post_id=entry['post_id'])
             
-            return True
-        else:
-            self.analytics.track_failed_post()
-            Console.error("Failed to post to LinkedIn")
+    def _on_post_failed(self, entry):
+        """Report a post the outbox gave up on"""
+        self.analytics.track_failed_post()
+        Console.error(f"Failed to post to LinkedIn: {entry['last_error']}")
+        
+        # It may be live, so keep it out of future rankings like a posted article
+        if entry['status'] == outbox.UNKNOWN:
+            self.posted_articles.add(entry['article_link'])
+            self.history.save_posting_history(self.posted_articles, self.last_post_time, self.analytics.get_data())
             
-            # Send failure notification to Discord
-            self.discord.send_post_failure(selected_article['title'], current_time_str)
+        # Send failure notification to Discord
+        current_time_str = datetime.fromtimestamp(entry['updated_at']).strftime('%Y-%m-%d %H:%M:%S')
+        self.discord.send_post_failure(entry['article_title'], current_time_str)
             
-            return False
-    
-    def monitor_comments_after_posting(self, article_title, duration_hours=24):
+    def monitor_comments_after_posting(self, article_title, duration_hours=24, post_id=None):
         """Start monitoring for comments on LinkedIn posts after posting
         
         Args:
             article_title (str): Title of the article that was shared
             duration_hours (int): How long to monitor for comments (in hours)
+            post_id (str, optional): The post to watch; defaults to the last one created
         """
         Console.section("Comment Monitoring")
         Console.info(f"Setting up comment monitoring for {duration_hours} hours")
         
         # Get the post ID of the most recent post
-        post_id = self.poster.get_last_post_id()
+        post_id = post_id or self.poster.get_last_post_id()
         
         # Initialize the comment responder
         responder = LinkedInCommentResponder(
@@ -226,12 +388,22 @@ class AINewsBot:
         self.discord.send_bot_started(days)
         
         # First authenticate with LinkedIn
-        if not self.auth.access_token:
-            if not self.authenticate():
-                Console.error("Authentication failed. Cannot proceed.")
-                self.discord.send_notification("❌ LinkedIn authentication failed. Bot stopped.")
-                return
-        
+        if not self.authenticate():
+            Console.error("Authentication failed. Cannot proceed.")
+            self.discord.send_notification("❌ LinkedIn authentication failed. Bot stopped.")
+            return
+        
+        # Deliver (or reconcile) posts left in the outbox by an earlier run
+        self.delivery.start()
+        
+        try:
+            self._run_days(days)
+        finally:
+            self.pregenerator.stop()
+            self.delivery.stop()
+    
+    def _run_days(self, days):
+        """Post once per day for the given number of days"""
         day = 0
         while day < days:
             Console.day_header(day+1, days)
@@ -246,6 +418,10 @@ class AINewsBot:
                 else:
                     Console.error(f"Failed to post for day {day+1}")
                 
+                # From now on, prepare each next post in the background while waiting
+                if self.pregeneration_settings['enabled']:
+                    self.pregenerator.start()
+                
                 # Calculate time until tomorrow with a small random buffer
                 seconds_until_tomorrow = self._calculate_seconds_until_tomorrow() + random.randint(0, 3600)
                 next_day_time = datetime.fromtimestamp(time.time() + seconds_until_tomorrow).strftime('%Y-%m-%d %H:%M:%S')
@@ -383,20 +559,215 @@ class AINewsBot:
         # Send to Discord
         self.discord.send_analytics(analytics_data)
 
+class MultiAccountBot:
+    """Runs the bot for several LinkedIn accounts from one process
+    
+    Each cycle fetches and ranks the news once for everyone, then generates
+    and publishes a post for every account whose schedule is due, up to
+    max_concurrent_accounts at a time. Accounts get different articles where
+    the ranking allows it. The news fetcher, ranking, LLM providers and
+    evaluator come from the wrapped AINewsBot and are shared; credentials,
+    styles, schedules, history and outboxes are per account.
+    """
+    
+    def __init__(self, bot, settings):
+        """Initialize with the shared bot and Config.multi_account_settings"""
+        self.bot = bot
+        self.settings = settings
+        self.accounts = load_accounts(settings, bot.content_generator, bot.discord)
+        self.executor = ThreadPoolExecutor(
+            max_workers=settings['max_concurrent_accounts'],
+            thread_name_prefix="account"
+        )
+    
+    def authenticate(self):
+        """Authenticate every account, keeping the ones that succeed
+        
+        Logins run one at a time because browser logins share the callback port.
+        """
+        ready = []
+        for account in self.accounts:
+            Console.section(f"LinkedIn Authentication: {account.label}")
+            if account.auth.authenticate(interactive=not self.bot.headless):
+                ready.append(account)
+            else:
+                Console.error(f"Authentication failed for {account.label}; skipping this account")
+        self.accounts = ready
+        return bool(ready)
+    
+    def select_articles(self):
+        """Fetch and rank the news once for all accounts
+        
+        Returns:
+            list: Ranked articles that at least one account hasn't posted yet
+        """
+        with self.bot._prepare_lock:
+            Console.section("Fetching and Filtering News")
+            Console.info(f"Retrieving and ranking articles for {len(self.accounts)} accounts...")
+            ranked_articles = self.bot.news_filter.filter_news(
+                self.bot.news_fetcher.iter_all_news(),
+                PostedByAllAccounts(self.accounts),
+                max_articles=self.settings['ranked_articles']
+            )
+        
+        if not ranked_articles:
+            Console.error("No suitable articles found after filtering")
+        return ranked_articles
+    
+    def _assign_articles(self, accounts, ranked_articles):
+        """Pick an article for each account, avoiding repeats across accounts when possible
+        
+        Returns:
+            list: (account, article or None, shared) tuples; shared means another
+                account got the same article in this cycle
+        """
+        taken = set()
+        assignments = []
+        for account in accounts:
+            available = [article for article in ranked_articles if article['link'] not in account.posted_articles]
+            if not available:
+                assignments.append((account, None, False))
+                continue
+            
+            fresh = [article for article in available if article['link'] not in taken]
+            article = self.bot.choose_articles(fresh or available)[0]
+            assignments.append((account, article, article['link'] in taken))
+            taken.add(article['link'])
+        return assignments
+    
+    def _post_for_account(self, account, article, shared):
+        """Generate and publish one account's post"""
+        Console.info(f"[{account.label}] Writing about: {article['title']}")
+        
+        # Two accounts posting about the same article must not get the same cached text
+        candidate = self.bot.generate_candidate(article, styles=account.styles, use_cache=not shared)
+        return account.publish(candidate)
+    
+    def run_once(self, force=False):
+        """Run one cycle for every account that is due to post
+        
+        Args:
+            force (bool): Post for every account, ignoring their schedules
+        
+        Returns:
+            dict: Account name -> whether its post was published
+        """
+        now = time.time()
+        due_accounts = []
+        for account in self.accounts:
+            if account.has_undelivered_post():
+                # Even when forced: a second article would be published alongside it
+                Console.info(f"[{account.label}] Previous post is still being delivered; skipping this cycle")
+            elif force or account.is_due(now):
+                due_accounts.append(account)
+        if not due_accounts:
+            Console.info("No account is due to post")
+            return {}
+        
+        ranked_articles = self.select_articles()
+        if not ranked_articles:
+            return {account.name: False for account in due_accounts}
+        
+        futures = {}
+        for account, article, shared in self._assign_articles(due_accounts, ranked_articles):
+            if article is None:
+                Console.warning(f"[{account.label}] Every ranked article was already posted")
+                continue
+            futures[account.name] = self.executor.submit(self._post_for_account, account, article, shared)
+        
+        results = {account.name: False for account in due_accounts}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                Console.error(f"Error posting for {name}: {str(e)}")
+        return results
+    
+    def run_scheduler(self, days=30):
+        """Post for all accounts on their own schedules for a number of days"""
+        Console.header(f"Starting LinkedIn AI News Bot for {len(self.accounts)} accounts, {days} days")
+        self.bot.discord.send_bot_started(days)
+        
+        if not self.authenticate():
+            Console.error("No account could authenticate. Cannot proceed.")
+            self.bot.discord.send_notification("❌ LinkedIn authentication failed for every account. Bot stopped.")
+            return
+        
+        # Deliver (or reconcile) posts left in the outboxes by an earlier run
+        for account in self.accounts:
+            account.delivery.start()
+        
+        end_time = time.time() + days * 86400
+        try:
+            while time.time() < end_time:
+                results = self.run_once()
+                for name, success in results.items():
+                    if success:
+                        Console.success(f"Posted for {name}")
+                    else:
+                        Console.error(f"Failed to post for {name}")
+                
+                time.sleep(max(0, min(self.bot.update_interval_seconds, end_time - time.time())))
+        finally:
+            for account in self.accounts:
+                account.delivery.stop()
+            self.executor.shutdown(wait=False)
+
+def train_engagement_model(path):
+    """Train the engagement model offline and save it where the bot loads it from
+    
+    Args:
+        path (str): JSONL file, one past post per line with its 'content', the
+            article 'title' and 'link', and its 'engagement' number
+    """
+    if not engagement_available():
+        Console.error("NumPy is not installed; it is needed to train the engagement model")
+        return
+    
+    settings = Config().engagement_model
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        records = [json.loads(line) for line in f if line.strip()]
+    
+    if len(records) < 10:
+        Console.error(f"Need at least 10 past posts to train, found {len(records)}")
+        return
+    
+    model = train_from_records(records, quantile=settings['quantile'])
+    model.save(settings['model_file'])
+    Console.success(f"Trained engagement model on {len(records)} posts, saved to {settings['model_file']}")
+    Console.info("Set engagement_model['enabled'] in config.py to score posts with it")
+
 def main():
     """Main entry point for the application"""
     args = parse_arguments()
     verbose = args.verbose
     
+    if args.train_engagement:
+        train_engagement_model(args.train_engagement)
+        return
+    
     # Clear the terminal
     Console.clear()
     Console.app_banner()
     
     # Create the news bot with custom update interval if specified
-    news_bot = AINewsBot(update_interval_minutes=args.update_interval, verbose=verbose)
+    news_bot = AINewsBot(update_interval_minutes=args.update_interval, verbose=verbose, headless=args.headless)
     
     Console.info(f"Update interval set to {args.update_interval} minutes")
     
+    multi_account_settings = news_bot.config.multi_account_settings
+    if multi_account_settings['enabled'] and not args.analytics:
+        # Post for every configured account from this one process
+        multi_bot = MultiAccountBot(news_bot, multi_account_settings)
+        if args.once:
+            Console.header("Single Post Mode")
+            if multi_bot.authenticate():
+                multi_bot.run_once(force=True)
+        else:
+            multi_bot.run_scheduler(days=args.days)
+        return
+    
     # Run based on command line arguments
     if args.once:
         # Run just once for testing
@@ -405,7 +776,7 @@ def main():
         news_bot.run_once(force=True)  # Use force=True to ensure it posts regardless of timing
     elif args.analytics:
         # Show analytics
-        if news_bot.auth.access_token or news_bot.authenticate():
+        if news_bot.authenticate():
             news_bot.display_analytics()
     else:
         # Run scheduler for specified days
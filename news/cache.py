@@ -0,0 +1,112 @@
+"""
+Conditional-GET cache for news sources
+"""
+
+import os
+import json
+import time
+import threading
+
+class FeedCache:
+    """On-disk cache of HTTP validators and parsed articles per news source
+    
+    Stores the ETag / Last-Modified validators returned by each source along
+    with the articles parsed from that response. On the next fetch the
+    validators are sent back as If-None-Match / If-Modified-Since, and a
+    304 Not Modified lets us reuse the cached articles without downloading
+    or parsing the feed again.
+    """
+    
+    def __init__(self, cache_file="news_cache.json", max_age_days=30):
+        """Initialize with cache file path"""
+        self.cache_file = cache_file
+        self.max_age_seconds = max_age_days * 86400
+        self.entries = {}
+        self._lock = threading.Lock()
+        self.load()
+    
+    def load(self):
+        """Load cached entries from file"""
+        try:
+            if os.path.exists(self.cache_file):
+                with open(self.cache_file, 'r') as f:
+                    self.entries = json.load(f)
+        except Exception as e:
+            print(f"Error loading news cache: {str(e)}")
+            self.entries = {}
+    
+    def save(self):
+        """Save cached entries to file, dropping sources not seen recently"""
+        cutoff = time.time() - self.max_age_seconds
+        
+        with self._lock:
+            self.entries = {
+                key: entry for key, entry in self.entries.items()
+                if entry.get('checked_at', 0) >= cutoff
+            }
+            snapshot = dict(self.entries)
+        
+        try:
+            # Write to a temp file first so a crash can't leave a truncated cache
+            tmp_file = f"{self.cache_file}.tmp"
+            with open(tmp_file, 'w') as f:
+                json.dump(snapshot, f)
+            os.replace(tmp_file, self.cache_file)
+        except Exception as e:
+            print(f"Error saving news cache: {str(e)}")
+    
+    @staticmethod
+    def make_key(url, params=None):
+        """Build a cache key from a URL and its query parameters"""
+        if not params:
+            return url
+        
+        # Leave credentials out of the key so rotating a key keeps the cache
+        query = '&'.join(
+            f"{k}={v}" for k, v in sorted(params.items())
+            if k.lower() not in ('apikey', 'api_key')
+        )
+        return f"{url}?{query}"
+    
+    def conditional_headers(self, key):
+        """Return If-None-Match / If-Modified-Since headers for a source"""
+        with self._lock:
+            entry = self.entries.get(key)
+        
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+    
+    def get_articles(self, key):
+        """Return the cached articles for a source after a 304 response"""
+        with self._lock:
+            entry = self.entries.get(key)
+            if not entry:
+                return None
+            entry['checked_at'] = time.time()
+            return [dict(article) for article in entry.get('articles', [])]
+    
+    def store(self, key, response, articles):
+        """Store validators and parsed articles from a 200 response
+        
+        Sources that send neither an ETag nor Last-Modified can't be
+        revalidated, so nothing is cached for them.
+        """
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        
+        with self._lock:
+            if not etag and not last_modified:
+                self.entries.pop(key, None)
+                return
+            
+            self.entries[key] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'articles': [dict(article) for article in articles],
+                'checked_at': time.time()
+            }
\ No newline at end of file
@@ -0,0 +1,61 @@
+"""
+Publication date parsing module for the LinkedIn AI News Bot
+"""
+
+import re
+import calendar
+import functools
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+_ISO_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}')
+
+def _to_epoch(parsed):
+    """Convert a datetime to an epoch float, treating naive values as UTC"""
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+@functools.lru_cache(maxsize=4096)
+def parse_iso_date(value):
+    """Parse an ISO 8601 timestamp (NewsAPI's publishedAt)"""
+    try:
+        return _to_epoch(datetime.fromisoformat(value.replace('Z', '+00:00')))
+    except ValueError:
+        return None
+
+@functools.lru_cache(maxsize=4096)
+def parse_rfc822_date(value):
+    """Parse an RFC 822 date (RSS pubDate)"""
+    try:
+        return _to_epoch(parsedate_to_datetime(value))
+    except (TypeError, ValueError, IndexError):
+        return None
+
+def parse_published(value):
+    """Parse a 'published' value from any source into an epoch float
+    
+    Returns:
+        float: Seconds since the epoch, or None if the date is missing or unreadable
+    """
+    if not value:
+        return None
+    
+    if isinstance(value, (int, float)):
+        return float(value)
+    
+    value = value.strip()
+    if _ISO_PATTERN.match(value):
+        return parse_iso_date(value)
+    return parse_rfc822_date(value) or parse_iso_date(value)
+
+def entry_published_ts(entry):
+    """Epoch timestamp for a feedparser entry
+    
+    feedparser already parses most feed dates into a UTC struct_time, so that
+    is used when available instead of parsing the string again.
+    """
+    parsed = entry.get('published_parsed') or entry.get('updated_parsed')
+    if parsed:
+        return float(calendar.timegm(parsed))
+    return parse_published(entry.get('published', entry.get('pubDate', '')))
\ No newline at end of file
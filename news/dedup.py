@@ -0,0 +1,129 @@
+"""
+Near-duplicate detection module for the LinkedIn AI News Bot
+"""
+
+import re
+import random
+import hashlib
+
+try:
+    import numpy as np # type: ignore
+except ImportError:  # NumPy is optional; signatures fall back to pure Python
+    np = None
+
+_TAG_PATTERN = re.compile(r'<[^>]+>')
+_WORD_PATTERN = re.compile(r'\w+')
+
+class MinHashLSH:
+    """MinHash signatures with LSH banding for near-duplicate stories
+    
+    Each article's title and summary are cut into word shingles and reduced
+    to a fixed-size MinHash signature. Signatures are split into bands and
+    every band is hashed into a bucket, so only articles sharing at least
+    one bucket are ever compared. Indexing N articles is roughly linear in
+    N instead of comparing every pair.
+    """
+    
+    def __init__(self, num_perm=64, bands=16, shingle_size=2, threshold=0.5, max_words=120, seed=42):
+        """Initialize with signature size, banding and similarity threshold
+        
+        Args:
+            num_perm (int): Number of hash permutations in a signature
+            bands (int): Number of LSH bands (num_perm must divide evenly)
+            shingle_size (int): Number of words per shingle
+            threshold (float): Minimum estimated Jaccard similarity for a match
+            max_words (int): Only the first max_words words of each text are used
+            seed (int): Seed for the permutation coefficients
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.threshold = threshold
+        self.max_words = max_words
+        
+        # Each "permutation" XORs the 64-bit shingle hash with a random mask,
+        # which is several times cheaper in pure Python than (a*x + b) mod p
+        rng = random.Random(seed)
+        self.masks = [rng.getrandbits(64) for _ in range(num_perm)]
+        self.mask_array = np.array(self.masks, dtype=np.uint64) if np is not None else None
+        
+        self.buckets = {}
+        self.signatures = {}
+    
+    def _shingles(self, text):
+        """Split text into hashed word shingles"""
+        words = _WORD_PATTERN.findall(_TAG_PATTERN.sub(' ', text or '').lower())[:self.max_words]
+        if len(words) < self.shingle_size:
+            shingles = {' '.join(words)} if words else set()
+        else:
+            shingles = {
+                ' '.join(words[i:i + self.shingle_size])
+                for i in range(len(words) - self.shingle_size + 1)
+            }
+        
+        return [
+            int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'big')
+            for shingle in shingles
+        ]
+    
+    def signature(self, text):
+        """Compute the MinHash signature of a text"""
+        hashes = self._shingles(text)
+        if not hashes:
+            return None
+        
+        if self.mask_array is not None:
+            hash_array = np.array(hashes, dtype=np.uint64)
+            return tuple(np.bitwise_xor.outer(self.mask_array, hash_array).min(axis=1).tolist())
+        
+        return tuple(min([h ^ mask for h in hashes]) for mask in self.masks)
+    
+    def _band_keys(self, signature):
+        """Yield one bucket key per band of the signature"""
+        for band in range(self.bands):
+            start = band * self.rows
+            yield (band, signature[start:start + self.rows])
+    
+    @staticmethod
+    def similarity(signature_a, signature_b):
+        """Estimate Jaccard similarity from two signatures"""
+        matches = sum(1 for a, b in zip(signature_a, signature_b) if a == b)
+        return matches / len(signature_a)
+    
+    def insert(self, key, signature):
+        """Add a signature to the index under the given key"""
+        self.signatures[key] = signature
+        for band_key in self._band_keys(signature):
+            self.buckets.setdefault(band_key, set()).add(key)
+    
+    def remove(self, key):
+        """Remove a key from the index"""
+        signature = self.signatures.pop(key, None)
+        if signature is None:
+            return
+        
+        for band_key in self._band_keys(signature):
+            bucket = self.buckets.get(band_key)
+            if bucket:
+                bucket.discard(key)
+                if not bucket:
+                    del self.buckets[band_key]
+    
+    def query(self, signature):
+        """Return indexed keys whose similarity meets the threshold"""
+        candidates = set()
+        for band_key in self._band_keys(signature):
+            candidates.update(self.buckets.get(band_key, ()))
+        
+        return [
+            key for key in candidates
+            if self.similarity(signature, self.signatures[key]) >= self.threshold
+        ]
+
+def article_text(article):
+    """Text used to compare two articles"""
+    return f"{article.get('title') or ''} {article.get('summary') or ''}"
\ No newline at end of file
@@ -3,45 +3,166 @@ News fetching module for the LinkedIn AI News Bot
 """
 
 import os
+import json
+import time
+import itertools
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 import feedparser # type: ignore
-import requests # type: ignore
+from news.cache import FeedCache
+from news.dates import parse_published, entry_published_ts
+from utils.http_client import get_http_client
 
 class NewsFetcher:
     """Class for fetching news from various sources"""
     
-    def __init__(self, news_sources):
+    def __init__(self, news_sources, fetch_settings=None):
         """Initialize with news sources configuration"""
         self.news_sources = news_sources
+        self.http = get_http_client()
+    
+        # Fetch settings (timeouts and concurrency)
+        fetch_settings = fetch_settings or {}
+        self.concurrent = fetch_settings.get('concurrent', True)
+        self.max_workers = fetch_settings.get('max_workers', 8)
+        self.source_timeout = fetch_settings.get('source_timeout', 10)
+        self.overall_deadline = fetch_settings.get('overall_deadline', 30)
+        
+        # Conditional-GET cache so unchanged sources aren't downloaded again
+        cache_file = fetch_settings.get('cache_file')
+        self.cache = FeedCache(cache_file) if cache_file else None
     
     def fetch_all_news(self):
         """Fetch news from all configured sources"""
-        rss_articles = self.fetch_rss_news()
-        api_articles = self.fetch_api_news()
+        return list(self.iter_all_news())
+        
+    def iter_all_news(self):
+        """Yield articles from all configured sources as they arrive
         
-        all_articles = rss_articles + api_articles
-        print(f"Found {len(all_articles)} articles in total")
+        With concurrent fetching, each source's articles are yielded as soon
+        as that source finishes, so a consumer can rank them while slower
+        sources are still downloading.
+        """
+        self.last_article_count = 0
         
-        return all_articles
+        try:
+            if self.concurrent:
+                articles = self._iter_concurrent()
+            else:
+                articles = itertools.chain(self.fetch_rss_news(), self.fetch_api_news())
+    
+            for article in articles:
+                self.last_article_count += 1
+                yield article
+        finally:
+            if self.cache:
+                self.cache.save()
+            
+            print(f"Found {self.last_article_count} articles in total")
+    
+    def _iter_concurrent(self):
+        """Fetch all RSS feeds and APIs in parallel, yielding per source
+        
+        Each source gets its own timeout, and the whole fetch is bounded by
+        the overall deadline. Sources that haven't finished by then are
+        abandoned; everything that did finish has already been yielded.
+        """
+        tasks = self._source_tasks()
+        if not tasks:
+            return
+        
+        start_time = time.time()
+        executor = ThreadPoolExecutor(max_workers=min(self.max_workers, len(tasks)))
+        
+        try:
+            futures = {executor.submit(fetch): name for name, fetch in tasks}
+            pending = set(futures)
+            
+            while pending:
+                remaining = self.overall_deadline - (time.time() - start_time)
+                if remaining <= 0:
+                    break
+                
+                done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        source_articles = future.result()
+                    except Exception as e:
+                        print(f"Error fetching {futures[future]}: {str(e)}")
+                        continue
+                    
+                    yield from source_articles
+            
+            for future in pending:
+                print(f"Skipping {futures[future]}: no response within {self.overall_deadline}s deadline")
+        finally:
+            # Don't block on stragglers - their own timeouts will end them
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        print(f"Fetched {len(tasks) - len(pending)}/{len(tasks)} sources in {time.time() - start_time:.1f}s")
+    
+    def _source_tasks(self):
+        """Build a (name, callable) pair for every configured source"""
+        tasks = [
+            (feed_url, lambda feed_url=feed_url: self._fetch_rss_feed(feed_url))
+            for feed_url in self.news_sources.get('rss', [])
+        ]
+        
+        if 'newsapi' in self.news_sources.get('apis', {}) and os.environ.get('NEWSAPI_KEY'):
+            tasks.append(('NewsAPI', self.fetch_api_news))
+        
+        return tasks
     
     def fetch_rss_news(self):
         """Fetch news from RSS feeds"""
         articles = []
         
-        # for feed_url in self.news_sources['rss']:
-        #     try:
-        #         feed = feedparser.parse(feed_url)
+        for feed_url in self.news_sources['rss']:
+            try:
+                articles.extend(self._fetch_rss_feed(feed_url))
+            except Exception as e:
+                print(f"Error fetching RSS feed {feed_url}: {str(e)}")
                 
-        #         for entry in feed.entries[:20]:  # Get most recent 10 entries
-        #             article = {
-        #                 'title': entry.title,
-        #                 'link': entry.link,
-        #                 'published': entry.get('published', entry.get('pubDate', '')),
-        #                 'summary': entry.get('summary', ''),
-        #                 'source': feed.feed.title if hasattr(feed, 'feed') and hasattr(feed.feed, 'title') else feed_url
-        #             }
-        #             articles.append(article)
-        #     except Exception as e:
-        #         print(f"Error fetching RSS feed {feed_url}: {str(e)}")
+        return articles
+    
+    def _fetch_rss_feed(self, feed_url):
+        """Fetch and parse a single RSS feed
+        
+        The feed is downloaded through the HTTP client so the source timeout applies;
+        feedparser.parse() on a URL has no timeout of its own. When the feed
+        is cached, the request is conditional and a 304 reuses the cached
+        articles.
+        """
+        headers = {'User-Agent': 'LinkedInAINewsBot/1.0'}
+        conditional_headers = self.cache.conditional_headers(feed_url) if self.cache else {}
+        
+        response = self.http.get(feed_url, headers={**headers, **conditional_headers}, timeout=self.source_timeout)
+        
+        if response.status_code == 304 and self.cache:
+            cached_articles = self.cache.get_articles(feed_url)
+            if cached_articles is not None:
+                return cached_articles
+            
+            # Cache entry vanished - fetch again unconditionally
+            response = self.http.get(feed_url, headers=headers, timeout=self.source_timeout)
+        
+        response.raise_for_status()
+        
+        feed = feedparser.parse(response.content)
+        
+        articles = []
+        for entry in feed.entries[:20]:  # Get most recent 20 entries
+            article = {
+                'title': entry.get('title', ''),
+                'link': entry.get('link', ''),
+                'published': entry.get('published', entry.get('pubDate', '')),
+                'published_ts': entry_published_ts(entry),
+                'summary': entry.get('summary', ''),
+                'source': feed.feed.title if hasattr(feed, 'feed') and hasattr(feed.feed, 'title') else feed_url
+            }
+            articles.append(article)
+        
+        if self.cache:
+            self.cache.store(feed_url, response, articles)
         
         return articles
     
@@ -58,9 +179,21 @@ class NewsFetcher:
                 params = api_config['params'].copy()
                 params['apiKey'] = os.environ.get('NEWSAPI_KEY')
                 
-                response = requests.get(api_config['url'], params=params)
+                cache_key = FeedCache.make_key(api_config['url'], params)
+                headers = self.cache.conditional_headers(cache_key) if self.cache else {}
+                
+                response = self.http.get(api_config['url'], params=params, headers=headers, timeout=self.source_timeout)
                 
-                if response.status_code == 200:
+                cached_articles = None
+                if response.status_code == 304 and self.cache:
+                    cached_articles = self.cache.get_articles(cache_key)
+                    if cached_articles is None:
+                        # Cache entry vanished - fetch again unconditionally
+                        response = self.http.get(api_config['url'], params=params, timeout=self.source_timeout)
+                
+                if cached_articles is not None:
+                    articles.extend(cached_articles)
+                elif response.status_code == 200:
                     data = response.json()
                     
                     for article in data.get('articles', [])[:15]:  # Get top 15 articles
@@ -68,13 +201,38 @@ class NewsFetcher:
                             'title': article.get('title', ''),
                             'link': article.get('url', ''),
                             'published': article.get('publishedAt', ''),
+                            'published_ts': parse_published(article.get('publishedAt')),
                             'summary': article.get('description', ''),
                             'source': article.get('source', {}).get('name', 'NewsAPI')
                         })
+                    
+                    if self.cache:
+                        self.cache.store(cache_key, response, articles)
                 else:
                     print(f"Error fetching from NewsAPI: {response.status_code}")
                     print(f"Response: {response.text}")
             except Exception as e:
                 print(f"Error with NewsAPI: {str(e)}")
         
-        return articles
\ No newline at end of file
+        return articles
+
+def iter_jsonl_articles(path):
+    """Yield articles from a JSON Lines dump, one per line
+    
+    Lets a large backlog be ranked with NewsFilter.rank_stream without
+    loading the whole file into memory.
+    """
+    with open(path, 'r') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            
+            try:
+                article = json.loads(line)
+            except json.JSONDecodeError as e:
+                print(f"Skipping invalid line {line_number} in {path}: {str(e)}")
+                continue
+            
+            if article.get('title') and article.get('link'):
+                yield article
\ No newline at end of file
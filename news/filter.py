@@ -2,10 +2,23 @@
 News filtering module for the LinkedIn AI News Bot
 """
 
+import time
+import heapq
+from news.dedup import MinHashLSH, article_text
+from news.dates import parse_published
+from news.ranking import BM25Ranker, bm25_available
+from news.terms import compile_term_pattern, normalize_term
+from utils.url_index import canonicalize_url
+
+try:
+    import numpy as np # type: ignore
+except ImportError:  # NumPy is optional; only the BM25 mode needs it
+    np = None
+
 class NewsFilter:
     """Class for filtering and ranking news articles"""
     
-    def __init__(self):
+    def __init__(self, ranking_settings=None):
         """Initialize with filtering configuration"""
         # Key terms for relevance scoring
         self.key_terms = [
@@ -22,47 +35,228 @@ class NewsFilter:
             'google', 'gemini', 'ai21', 'groq', 'stability',
            
         ]
+        
+        # Precompile every term into one pattern so an article is scored in a
+        # single scan of its title and a single scan of its summary
+        self.term_weights = self._build_term_weights()
+        self.term_pattern = compile_term_pattern(self.term_weights)
+        
+        # Near-duplicate clustering: the same story from several outlets is
+        # collapsed into one candidate, and wider coverage boosts its score
+        self.cluster_threshold = 0.5  # Estimated Jaccard similarity to treat as the same story
+        self.cluster_bonus = 0.5  # Added per extra source covering the story
+        self.max_cluster_bonus = 2
+        
+        # Recency: a bonus that halves every recency_half_life_hours
+        self.recency_weight = 3  # Bonus for an article published right now
+        self.recency_half_life_hours = 24
+    
+        # Optional vectorized BM25 model in place of keyword counting
+        ranking_settings = ranking_settings or {}
+        self.bm25_scale = ranking_settings.get('bm25_scale', 10)
+        self.bm25_shortlist_margin = ranking_settings.get('bm25_shortlist_margin', 50)
+        self.bm25_ranker = None
+        if ranking_settings.get('mode') == 'bm25':
+            if bm25_available():
+                self.bm25_ranker = BM25Ranker(
+                    ranking_settings.get('topic_profile') or {term: weights[0] for term, weights in self.term_weights.items()},
+                    k1=ranking_settings.get('bm25_k1', 1.5),
+                    b=ranking_settings.get('bm25_b', 0.75)
+                )
+            else:
+                print("BM25 ranking needs numpy and scipy; falling back to keyword scoring")
+    
+    def _build_term_weights(self):
+        """Map each term to its (title weight, summary weight)"""
+        term_weights = {}
+        weighted_lists = [
+            (self.key_terms, 2, 1),
+            (self.companies_models, 1, 0.5)
+        ]
+        
+        for terms, title_weight, summary_weight in weighted_lists:
+            for term in terms:
+                key = normalize_term(term)
+                current_title, current_summary = term_weights.get(key, (0, 0))
+                term_weights[key] = (current_title + title_weight, current_summary + summary_weight)
+        
+        return term_weights
+    
+    def _match_terms(self, text):
+        """Return the set of distinct terms found in the text"""
+        if not text:
+            return set()
+        return {normalize_term(match.group(1)) for match in self.term_pattern.finditer(text)}
     
     def filter_news(self, articles, posted_articles, max_articles=5):
         """Filter news to find the most relevant and recent articles"""
-        # Remove duplicates based on URL
-        unique_articles = {}
-        for article in articles:
-            if article['link'] not in unique_articles and article['link'] not in posted_articles:
-                unique_articles[article['link']] = article
-        
-        filtered_articles = list(unique_articles.values())
-        
-        # Calculate relevance scores
-        for article in filtered_articles:
-            relevance_score = self._calculate_relevance_score(article)
-            article['relevance_score'] = relevance_score
-        
-        # Sort by relevance score and recency
-        sorted_articles = sorted(
-            filtered_articles, 
-            key=lambda x: (x.get('relevance_score', 0), x.get('published', '')), 
-            reverse=True
+        if self.bm25_ranker:
+            return self.rank_bm25(articles, posted_articles, max_articles)
+        return self.rank_stream(articles, posted_articles, max_articles)
+    
+    def rank_bm25(self, articles, posted_articles, k=5):
+        """Rank a batch with the BM25 model instead of keyword counts
+        
+        BM25 needs statistics over the whole batch, so the input is
+        materialized and scored in one vectorized pass. Only the top k plus
+        bm25_shortlist_margin articles by raw score are then picked out with
+        argpartition and sent through the dedup/top-k pipeline of
+        rank_stream, so URL canonicalization and MinHash signatures are
+        computed for the shortlist rather than the whole batch. Coverage is
+        counted within the shortlist only.
+        """
+        articles = list(articles)
+        scores = self.bm25_ranker.score(articles)
+        
+        best = scores.max() if len(scores) else 0
+        if best > 0:
+            scores = scores * (self.bm25_scale / best)
+        
+        shortlist_size = k + self.bm25_shortlist_margin
+        if len(articles) > shortlist_size:
+            # Positions of the highest scores, kept in input order for stable ties
+            shortlist = np.sort(np.argpartition(-scores, shortlist_size - 1)[:shortlist_size])
+            articles = [articles[i] for i in shortlist]
+            scores = scores[shortlist]
+        
+        scores_by_article = {id(article): float(score) for article, score in zip(articles, scores)}
+        return self.rank_stream(articles, posted_articles, k, score_article=lambda article: scores_by_article[id(article)])
+    
+    def rank_stream(self, articles, posted_articles, k=5, score_article=None):
+        """Rank an iterable of articles, keeping only the top k in memory
+        
+        Articles are scored as they arrive (e.g. straight from
+        NewsFetcher.iter_all_news or iter_jsonl_articles) and held in a
+        bounded min-heap, so only k articles are kept however long the input
+        is. Every article's MinHash signature stays in the LSH index with the
+        story cluster it belongs to, so near-duplicates are counted even when
+        their story isn't currently held: a story that gains coverage can
+        still enter the top k later. The held article is the best copy seen
+        since its story last entered the heap.
+        
+        Args:
+            articles (iterable): Articles to rank
+            posted_articles: Set-like collection of already posted URLs
+            k (int): Number of articles to return
+            score_article (callable, optional): Relevance function; defaults to keyword scoring
+        
+        Returns:
+            list: Up to k articles, best first
+        """
+        held = {}  # canonical link -> article
+        arrival = {}  # canonical link -> arrival order, for stable ties
+        held_clusters = {}  # canonical link -> cluster id of a held article
+        clusters = []  # cluster id -> [articles seen, canonical link of the held copy or None]
+        cluster_ids = {}  # arrival order of an indexed article -> its cluster id
+        seen_links = set()
+        heap = []
+        lsh = MinHashLSH(threshold=self.cluster_threshold)
+        now = time.time()
+        score_article = score_article or self._calculate_relevance_score
+        
+        for order, article in enumerate(articles):
+            canonical_link = canonicalize_url(article['link'])
+            if canonical_link in seen_links:
+                continue
+            seen_links.add(canonical_link)
+            if article['link'] in posted_articles or canonical_link in posted_articles:
+                continue
+            
+            # Dates are parsed once here, never inside the heap comparisons
+            if 'published_ts' not in article:
+                article['published_ts'] = parse_published(article.get('published'))
+        
+            article['relevance_score'] = score_article(article)
+        
+            signature = lsh.signature(article_text(article))
+            duplicates = lsh.query(signature) if signature else []
+            if duplicates:
+                cluster_id = cluster_ids[duplicates[0]]
+            else:
+                cluster_id = len(clusters)
+                clusters.append([0, None])
+            if signature:
+                lsh.insert(order, signature)
+                cluster_ids[order] = cluster_id
+        
+            cluster = clusters[cluster_id]
+            cluster[0] += 1
+            article['cluster_size'] = cluster[0]
+            
+            if cluster[1] is not None:
+                # Same story as an article we're holding: keep the better one
+                held_link = cluster[1]
+                current = held[held_link]
+                current['cluster_size'] = cluster[0]
+        
+                if self._is_better_representative(article, current):
+                    del held[held_link]
+                    arrival[canonical_link] = arrival.pop(held_link)
+                    held_clusters[canonical_link] = held_clusters.pop(held_link)
+                    held[canonical_link] = article
+                    cluster[1] = canonical_link
+                
+                heap = [self._heap_entry(link, held[link], arrival[link], now) for link in held]
+                heapq.heapify(heap)
+                continue
+            
+            entry = self._heap_entry(canonical_link, article, order, now)
+            if len(heap) >= k and entry <= heap[0]:
+                continue
+            
+            held[canonical_link] = article
+            arrival[canonical_link] = order
+            held_clusters[canonical_link] = cluster_id
+            cluster[1] = canonical_link
+            heapq.heappush(heap, entry)
+            
+            if len(heap) > k:
+                evicted_link = heapq.heappop(heap)[-1]
+                del held[evicted_link]
+                del arrival[evicted_link]
+                clusters[held_clusters.pop(evicted_link)][1] = None
+        
+        ranked = [held[entry[-1]] for entry in sorted(heap, reverse=True)]
+        for article in ranked:
+            article['relevance_score'] = self._ranking_score(article, now)
+        
+        return ranked
+    
+    def _ranking_score(self, article, now):
+        """Relevance plus coverage and recency bonuses"""
+        cluster_bonus = min(
+            self.cluster_bonus * (article.get('cluster_size', 1) - 1), self.max_cluster_bonus
         )
+        return article.get('relevance_score', 0) + cluster_bonus + self._recency_bonus(article, now)
         
-        return sorted_articles[:max_articles]
+    def _recency_bonus(self, article, now):
+        """Exponential time-decay bonus; articles without a date get none"""
+        published_ts = article.get('published_ts')
+        if published_ts is None:
+            return 0
+        
+        age_hours = max(0, now - published_ts) / 3600
+        return self.recency_weight * 0.5 ** (age_hours / self.recency_half_life_hours)
+    
+    def _heap_entry(self, canonical_link, article, order, now):
+        """Heap ordering key: score, then recency, then earliest arrival"""
+        return (self._ranking_score(article, now), article.get('published_ts') or 0, -order, canonical_link)
+    
+    @staticmethod
+    def _is_better_representative(article, current):
+        """Whether article should replace current as its story's representative"""
+        return (article.get('relevance_score', 0), len(article.get('summary') or '')) > \
+            (current.get('relevance_score', 0), len(current.get('summary') or ''))
     
     def _calculate_relevance_score(self, article):
         """Calculate relevance score for an article"""
         relevance_score = 0
         
-        # Check for key terms in title and summary
-        for term in self.key_terms:
-            if term.lower() in article['title'].lower():
-                relevance_score += 2
-            if 'summary' in article and term.lower() in article['summary'].lower():
-                relevance_score += 1
-        
-        # Check if it mentions popular models or companies
-        for entity in self.companies_models:
-            if entity.lower() in article['title'].lower():
-                relevance_score += 1
-            if 'summary' in article and entity.lower() in article['summary'].lower():
-                relevance_score += 0.5
+        # Each distinct term counts once for the title and once for the summary
+        for term in self._match_terms(article.get('title')):
+            relevance_score += self.term_weights[term][0]
+        
+        for term in self._match_terms(article.get('summary')):
+            relevance_score += self.term_weights[term][1]
         
         return relevance_score
\ No newline at end of file
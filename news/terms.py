@@ -0,0 +1,43 @@
+"""
+Term matching helpers for the LinkedIn AI News Bot
+"""
+
+import re
+
+def normalize_term(term):
+    """Lowercase a term and collapse its whitespace"""
+    return ' '.join(term.lower().split())
+
+def compile_term_pattern(terms):
+    """Compile a list of terms into a single case-insensitive pattern
+    
+    The terms are merged into a prefix trie before being turned into a
+    regex, so matching at any position costs the length of the longest
+    term rather than the number of terms. Terms must start on a word
+    boundary but may continue into a longer word, so 'release' still
+    matches 'released'. The pattern sits in a lookahead so overlapping
+    terms are all found in the same pass; group 1 holds the matched text.
+    """
+    trie = {}
+    for term in terms:
+        node = trie
+        for char in normalize_term(term):
+            node = node.setdefault(char, {})
+        node[''] = True
+    
+    def build(node):
+        branches = [
+            (r'\s+' if char == ' ' else re.escape(char)) + build(child)
+            for char, child in sorted(node.items()) if char
+        ]
+        if not branches:
+            return ''
+        if len(branches) == 1 and '' not in node:
+            return branches[0]
+        group = '(?:' + '|'.join(branches) + ')'
+        return group + '?' if '' in node else group
+    
+    # Checking the first character against a class up front lets the regex
+    # engine skip most positions before trying the lookbehind and trie
+    first_chars = re.escape(''.join(sorted(char for char in trie if char)))
+    return re.compile(rf'(?=[{first_chars}])(?<!\w)(?=({build(trie)}))', re.IGNORECASE)
\ No newline at end of file
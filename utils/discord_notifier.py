@@ -3,7 +3,7 @@ Discord notification module for the LinkedIn AI News Bot
 """
 
 import os
-import requests
+from utils.http_client import get_http_client
 
 class DiscordNotifier:
     """Class for sending notifications to Discord"""
@@ -12,6 +12,7 @@ class DiscordNotifier:
         """Initialize with webhook URL"""
         self.webhook_url = webhook_url or os.environ.get('DISCORD_WEBHOOK_URL')
         self.enabled = bool(self.webhook_url)
+        self.http = get_http_client()
         
         if not self.enabled:
             print("Discord notifications disabled (no webhook URL provided)")
@@ -24,7 +25,7 @@ class DiscordNotifier:
         
         try:
             data = {"content": message}
-            response = requests.post(self.webhook_url, json=data)
+            response = self.http.post(self.webhook_url, json=data)
             if response.status_code == 204:
                 print("Discord notification sent successfully")
                 return True
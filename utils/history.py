@@ -4,6 +4,7 @@ History tracking module for the LinkedIn AI News Bot
 
 import os
 import json
+from utils.url_index import PostedUrlIndex
 
 class PostingHistory:
     """Class for managing posting history"""
@@ -26,6 +27,22 @@ class PostingHistory:
         
         return posted_articles
     
+    def load_posted_index(self, index_file="posted_urls.db", namespace="", capacity=100000, error_rate=0.001):
+        """Open the on-disk posted-URL index, migrating URLs from the JSON history
+        
+        Returns:
+            PostedUrlIndex: Set-like index of posted URLs
+        """
+        posted_index = PostedUrlIndex(index_file, namespace=namespace, capacity=capacity, error_rate=error_rate)
+        
+        # Older history files keep the full URL list; move it into the index once
+        legacy_urls = self.load_posted_articles()
+        if legacy_urls:
+            posted_index.update(legacy_urls)
+        
+        print(f"Posted URL index contains {len(posted_index)} articles")
+        return posted_index
+    
     def get_last_post_time(self):
         """Get the timestamp of the last post"""
         last_post_time = None
@@ -40,13 +57,21 @@ class PostingHistory:
         return last_post_time
     
     def save_posting_history(self, posted_articles, last_post_time, analytics):
-        """Save posted articles to file"""
+        """Save posted articles to file
+        
+        When posted_articles is a PostedUrlIndex the URLs already live on disk
+        in the index, so only the count is written here.
+        """
         try:
             history_data = {
-                "posted_urls": list(posted_articles),
                 "last_post_time": last_post_time,
                 "analytics": analytics
             }
+            if isinstance(posted_articles, PostedUrlIndex):
+                history_data["posted_count"] = len(posted_articles)
+            else:
+                history_data["posted_urls"] = list(posted_articles)
+            
             with open(self.history_file, 'w') as f:
                 json.dump(history_data, f, indent=2)
             print(f"Saved posting history with {len(posted_articles)} articles")
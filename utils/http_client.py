@@ -0,0 +1,102 @@
+"""
+Shared HTTP client module for the LinkedIn AI News Bot
+"""
+
+import threading
+import urllib.parse
+import requests # type: ignore
+from requests.adapters import HTTPAdapter # type: ignore
+from urllib3.util.retry import Retry # type: ignore
+from config import Config
+
+class HttpClient:
+    """Pooled HTTP sessions shared by every outbound client
+    
+    Keeps one requests.Session per host so connections to Groq, LinkedIn,
+    Discord and the news sources are kept alive and reused instead of doing
+    a new TCP+TLS handshake on every call. Each session gets a connection
+    pool, default connect/read timeouts and a retry policy.
+    """
+    
+    def __init__(self, settings=None):
+        """Initialize with HTTP settings (pool sizes, timeouts, retries)"""
+        settings = settings or {}
+        self.pool_connections = settings.get('pool_connections', 4)
+        self.pool_maxsize = settings.get('pool_maxsize', 10)
+        self.timeout = (settings.get('connect_timeout', 5), settings.get('read_timeout', 60))
+        self.max_retries = settings.get('max_retries', 3)
+        self.backoff_factor = settings.get('backoff_factor', 0.5)
+        self.retry_statuses = settings.get('retry_statuses', [502, 503, 504])
+        
+        self.sessions = {}
+        self._lock = threading.Lock()
+    
+    def session_for(self, url):
+        """Get (or create) the pooled session for a URL's host"""
+        parsed = urllib.parse.urlsplit(url)
+        host_key = f"{parsed.scheme}://{parsed.netloc}"
+        
+        with self._lock:
+            session = self.sessions.get(host_key)
+            if session is None:
+                session = self._create_session()
+                self.sessions[host_key] = session
+            return session
+    
+    def _create_session(self):
+        """Create a session with a pooled, retrying adapter"""
+        # Only idempotent methods are retried on bad statuses; POSTs are
+        # retried only when the connection itself failed.
+        retry = Retry(
+            total=self.max_retries,
+            connect=self.max_retries,
+            read=0,  # A timed-out read isn't made faster by asking again
+            status=self.max_retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=self.retry_statuses,
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=retry
+        )
+        
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+    
+    def request(self, method, url, **kwargs):
+        """Send a request through the host's pooled session"""
+        kwargs.setdefault('timeout', self.timeout)
+        return self.session_for(url).request(method, url, **kwargs)
+    
+    def get(self, url, **kwargs):
+        """Send a GET request"""
+        return self.request('GET', url, **kwargs)
+    
+    def post(self, url, **kwargs):
+        """Send a POST request"""
+        return self.request('POST', url, **kwargs)
+    
+    def close(self):
+        """Close all pooled sessions"""
+        with self._lock:
+            for session in self.sessions.values():
+                session.close()
+            self.sessions = {}
+
+_shared_client = None
+_shared_client_lock = threading.Lock()
+
+def get_http_client():
+    """Return the process-wide HttpClient, created from Config on first use"""
+    global _shared_client
+    
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = HttpClient(Config().http_settings)
+        return _shared_client
\ No newline at end of file
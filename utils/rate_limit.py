@@ -0,0 +1,232 @@
+"""
+Rate limiting and retry module for the LinkedIn AI News Bot
+"""
+
+import re
+import time
+import random
+import threading
+import requests # type: ignore
+from config import Config
+from utils.console import Console
+
+_DURATION_PATTERN = re.compile(r'(\d+(?:\.\d+)?)(ms|h|m|s)')
+_DURATION_UNITS = {'ms': 0.001, 's': 1, 'm': 60, 'h': 3600}
+
+class RateLimitTimeout(Exception):
+    """Raised when a call can't be made before its deadline"""
+
+def parse_duration(value):
+    """Parse a rate-limit reset value such as '7.66s', '2m59.56s' or '120ms'
+    
+    Returns:
+        float: Seconds, or None if the value can't be read
+    """
+    if not value:
+        return None
+    
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    
+    parts = _DURATION_PATTERN.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+class TokenBucket:
+    """Token bucket refilled continuously at a fixed rate
+    
+    Reservations may take the level below zero; the caller then waits until
+    the bucket would have refilled that far, which keeps concurrent callers
+    spaced out instead of all retrying at once.
+    """
+    
+    def __init__(self, capacity, refill_per_second):
+        """Initialize a full bucket"""
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+        self.level = self.capacity
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+    
+    def _refill(self, now):
+        """Add the tokens accrued since the last update"""
+        self.level = min(self.capacity, self.level + (now - self.updated_at) * self.refill_per_second)
+        self.updated_at = now
+    
+    def wait_time(self, amount, now):
+        """Seconds until amount tokens are available"""
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        wait = max(0.0, self.blocked_until - now)
+        if self.level < amount:
+            wait = max(wait, (amount - self.level) / self.refill_per_second)
+        return wait
+    
+    def take(self, amount):
+        """Remove tokens (the level may go negative)"""
+        self.level -= min(amount, self.capacity)
+    
+    def sync(self, remaining, reset_seconds, now):
+        """Align the bucket with what the server says is left"""
+        self._refill(now)
+        if remaining is not None:
+            self.level = min(self.level, float(remaining))
+            if remaining <= 0 and reset_seconds:
+                self.blocked_until = max(self.blocked_until, now + reset_seconds)
+
+class RateLimiter:
+    """Request and token budgets for one API, kept in step with its headers"""
+    
+    def __init__(self, requests_per_minute, tokens_per_minute):
+        """Initialize with per-minute budgets"""
+        self.requests = TokenBucket(requests_per_minute, requests_per_minute / 60.0)
+        self.tokens = TokenBucket(tokens_per_minute, tokens_per_minute / 60.0)
+        self._lock = threading.Lock()
+    
+    def reserve(self, estimated_tokens, max_wait):
+        """Reserve one request and its tokens
+        
+        Args:
+            estimated_tokens (int): Prompt plus completion tokens the call may use
+            max_wait (float): Longest acceptable wait in seconds
+        
+        Returns:
+            float: Seconds to wait before sending, or None if that would exceed max_wait
+        """
+        with self._lock:
+            now = time.monotonic()
+            wait = max(self.requests.wait_time(1, now), self.tokens.wait_time(estimated_tokens, now))
+            if wait > max_wait:
+                return None
+            
+            self.requests.take(1)
+            self.tokens.take(estimated_tokens)
+            return wait
+    
+    def update_from_headers(self, headers):
+        """Apply x-ratelimit-remaining-*/x-ratelimit-reset-* response headers"""
+        def number(name):
+            try:
+                return float(headers[name])
+            except (KeyError, TypeError, ValueError):
+                return None
+        
+        with self._lock:
+            now = time.monotonic()
+            self.requests.sync(
+                number('x-ratelimit-remaining-requests'),
+                parse_duration(headers.get('x-ratelimit-reset-requests')),
+                now
+            )
+            self.tokens.sync(
+                number('x-ratelimit-remaining-tokens'),
+                parse_duration(headers.get('x-ratelimit-reset-tokens')),
+                now
+            )
+
+class RetryEngine:
+    """Rate-limited POSTs with bounded, jittered retries and a deadline
+    
+    Every call first waits for room in the shared rate limiter, then is
+    retried on connection errors, timeouts and retryable statuses (429 and
+    5xx) with full-jitter exponential backoff, honouring Retry-After. A call
+    never runs past its deadline: request timeouts are shortened to fit and
+    no retry is scheduled that would end after it.
+    """
+    
+    def __init__(self, settings):
+        """Initialize from rate limit settings"""
+        self.limiter = RateLimiter(settings['requests_per_minute'], settings['tokens_per_minute'])
+        self.max_attempts = settings['max_attempts']
+        self.backoff_base = settings['backoff_base']
+        self.backoff_max = settings['backoff_max']
+        self.call_deadline = settings['call_deadline']
+        self.retry_statuses = set(settings['retry_statuses'])
+    
+    def backoff(self, attempt):
+        """Full-jitter exponential delay before the given retry"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+    
+    @staticmethod
+    def retry_after(response):
+        """Seconds requested by a Retry-After header, if any"""
+        return parse_duration(response.headers.get('retry-after'))
+    
+    def post(self, http, url, estimated_tokens=0, deadline=None, **kwargs):
+        """Send a POST through the rate limiter, retrying transient failures
+        
+        Args:
+            http (HttpClient): Client used to send the request
+            url (str): Endpoint
+            estimated_tokens (int): Tokens the call may use, for the token budget
+            deadline (float, optional): time.monotonic() value the call must finish by
+            **kwargs: Passed on to http.post
+        
+        Returns:
+            requests.Response: The first non-retryable response, or the last one
+        
+        Raises:
+            RateLimitTimeout: If the rate limiter can't fit the call before the deadline
+            requests.RequestException: If the last attempt failed to connect or timed out
+        """
+        if deadline is None:
+            deadline = time.monotonic() + self.call_deadline
+        connect_timeout, read_timeout = http.timeout
+        
+        for attempt in range(1, self.max_attempts + 1):
+            wait = self.limiter.reserve(estimated_tokens, deadline - time.monotonic())
+            if wait is None:
+                raise RateLimitTimeout("Rate limit would delay the call past its deadline")
+            if wait > 0:
+                Console.info(f"Rate limit: waiting {wait:.1f}s before calling the API")
+                time.sleep(wait)
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise RateLimitTimeout("Deadline passed before the call could be made")
+            kwargs['timeout'] = (min(connect_timeout, remaining), min(read_timeout, remaining))
+            
+            response = None
+            try:
+                response = http.post(url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == self.max_attempts:
+                    raise
+                delay = self.backoff(attempt)
+                reason = type(e).__name__
+            else:
+                self.limiter.update_from_headers(response.headers)
+                if response.status_code not in self.retry_statuses or attempt == self.max_attempts:
+                    return response
+                delay = self.retry_after(response)
+                if delay is None:
+                    delay = self.backoff(attempt)
+                reason = f"status {response.status_code}"
+            
+            if time.monotonic() + delay >= deadline:
+                Console.warning(f"Not retrying after {reason}: the retry would pass the deadline")
+                if response is not None:
+                    return response
+                raise RateLimitTimeout(f"Gave up after {reason}")
+            
+            if response is not None:
+                response.close()
+            Console.warning(f"API call failed ({reason}), retrying in {delay:.1f}s "
+                            f"(attempt {attempt + 1}/{self.max_attempts})")
+            time.sleep(delay)
+
+_shared_engines = {}
+_shared_engines_lock = threading.Lock()
+
+def get_retry_engine(name='groq'):
+    """Return the process-wide RetryEngine for an API, created from Config on first use"""
+    with _shared_engines_lock:
+        engine = _shared_engines.get(name)
+        if engine is None:
+            engine = RetryEngine(Config().llm_rate_limits[name])
+            _shared_engines[name] = engine
+        return engine
\ No newline at end of file
@@ -0,0 +1,228 @@
+"""
+Posted URL index module for the LinkedIn AI News Bot
+"""
+
+import re
+import math
+import time
+import base64
+import sqlite3
+import hashlib
+import threading
+import urllib.parse
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'igshid', 'mc_cid', 'mc_eid',
+    'ref', 'ref_src', 'ref_url', 'cmpid', 'ocid', 'oc', 'guccounter',
+    'guce_referrer', 'guce_referrer_sig', '_hsenc', '_hsmi', 'smid', 'sr_share'
+}
+TRACKING_PREFIXES = ('utm_', 'pk_', 'mtm_')
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+_EMBEDDED_URL_PATTERN = re.compile(rb'https?://[\x21-\x7e]+')
+
+def _unwrap_google_news(parsed):
+    """Return the publisher URL wrapped by a Google redirect, if recoverable"""
+    host = parsed.netloc.lower()
+    params = urllib.parse.parse_qs(parsed.query)
+    
+    # https://www.google.com/url?q=<target> and friends
+    if host in ('google.com', 'www.google.com', 'news.google.com') and parsed.path == '/url':
+        for key in ('url', 'q'):
+            if params.get(key):
+                return params[key][0]
+    
+    # https://news.google.com/rss/articles/<base64 protobuf containing the URL>
+    if host == 'news.google.com' and '/articles/' in parsed.path:
+        token = parsed.path.rsplit('/', 1)[-1]
+        try:
+            decoded = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        except (ValueError, TypeError):
+            return None
+        match = _EMBEDDED_URL_PATTERN.search(decoded)
+        if match:
+            return match.group(0).decode('ascii')
+    
+    return None
+
+def _canonicalize(url):
+    """Canonicalize a URL, raising ValueError if it can't be parsed"""
+    parsed = urllib.parse.urlsplit(url.strip())
+    
+    unwrapped = _unwrap_google_news(parsed)
+    if unwrapped:
+        parsed = urllib.parse.urlsplit(unwrapped)
+    
+    scheme = parsed.scheme.lower() or 'https'
+    host = (parsed.hostname or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    
+    netloc = host
+    if parsed.port and parsed.port != DEFAULT_PORTS.get(scheme):
+        netloc = f"{host}:{parsed.port}"
+    
+    path = re.sub(r'/{2,}', '/', parsed.path or '/')
+    if len(path) > 1:
+        path = path.rstrip('/')
+    
+    query = urllib.parse.urlencode(sorted(
+        (key, value)
+        for key, value in urllib.parse.parse_qsl(parsed.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    ))
+    
+    return urllib.parse.urlunsplit((scheme, netloc, path, query, ''))
+
+def canonicalize_url(url):
+    """Normalize a URL so the same article always maps to the same string
+    
+    Unwraps Google News redirect links, lowercases the scheme and host, drops
+    'www.', default ports, fragments and tracking parameters, sorts what's
+    left of the query string and removes trailing slashes.
+    """
+    if not url:
+        return ''
+    
+    # A malformed link (bad port, unclosed IPv6 bracket) is kept as it is
+    # rather than failing the whole ranking or posting cycle
+    try:
+        return _canonicalize(url)
+    except ValueError:
+        return url.strip()
+
+class BloomFilter:
+    """Fixed-size Bloom filter for fast negative membership checks"""
+    
+    def __init__(self, capacity=100000, error_rate=0.001):
+        """Size the filter for the expected number of items and error rate"""
+        capacity = max(capacity, 1)
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+    
+    def _positions(self, item):
+        """Bit positions for an item (double hashing from one digest)"""
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'big')
+        h2 = int.from_bytes(digest[8:], 'big') | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+    
+    def add(self, item):
+        """Add an item to the filter"""
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+    
+    def __contains__(self, item):
+        """False means definitely absent; True means probably present"""
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+class PostedUrlIndex:
+    """On-disk index of posted article URLs with a Bloom filter in front
+    
+    URLs are canonicalized before they are stored or looked up, so tracking
+    parameters and redirect wrappers can't sneak an already-posted article
+    back in. The full list lives in SQLite; only the Bloom filter's bit
+    array is kept in memory, and it answers most lookups (articles we have
+    never posted) without touching the disk.
+    
+    Behaves like the set of posted URLs it replaces: supports 'in', add(),
+    len() and iteration.
+    """
+    
+    def __init__(self, db_file="posted_urls.db", namespace="", capacity=100000, error_rate=0.001):
+        """Open (or create) the index
+        
+        Args:
+            db_file (str): Path to the SQLite database
+            namespace (str): Keeps separate histories in one file (e.g. per account)
+            capacity (int): Expected number of URLs, used to size the Bloom filter
+            error_rate (float): Target Bloom filter false-positive rate
+        """
+        self.db_file = db_file
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        
+        self.conn = sqlite3.connect(db_file, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS posted_urls ("
+            " namespace TEXT NOT NULL,"
+            " canonical_url TEXT NOT NULL,"
+            " url TEXT NOT NULL,"
+            " posted_at REAL NOT NULL,"
+            " PRIMARY KEY (namespace, canonical_url)"
+            ") WITHOUT ROWID"
+        )
+        self.conn.commit()
+        
+        # Leave headroom so the false-positive rate holds as history grows
+        self.bloom = BloomFilter(max(capacity, 2 * len(self)), error_rate)
+        for (canonical_url,) in self.conn.execute(
+            "SELECT canonical_url FROM posted_urls WHERE namespace = ?", (namespace,)
+        ):
+            self.bloom.add(canonical_url)
+    
+    def __contains__(self, url):
+        """Check whether a URL (in any tracking-decorated form) was posted"""
+        canonical_url = canonicalize_url(url)
+        if canonical_url not in self.bloom:
+            return False
+        
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT 1 FROM posted_urls WHERE namespace = ? AND canonical_url = ?",
+                (self.namespace, canonical_url)
+            ).fetchone()
+        return row is not None
+    
+    def add(self, url):
+        """Record a URL as posted"""
+        self.update([url])
+    
+    def update(self, urls):
+        """Record several URLs as posted in one transaction"""
+        now = time.time()
+        rows = [(self.namespace, canonicalize_url(url), url, now) for url in urls if url]
+        
+        with self._lock:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO posted_urls (namespace, canonical_url, url, posted_at) VALUES (?, ?, ?, ?)",
+                rows
+            )
+            self.conn.commit()
+            
+            for _, canonical_url, _, _ in rows:
+                self.bloom.add(canonical_url)
+    
+    def __len__(self):
+        """Number of URLs posted in this namespace"""
+        with self._lock:
+            return self.conn.execute(
+                "SELECT COUNT(*) FROM posted_urls WHERE namespace = ?", (self.namespace,)
+            ).fetchone()[0]
+    
+    def __iter__(self):
+        """Iterate over the original posted URLs, a page at a time"""
+        last_canonical_url = ''
+        while True:
+            with self._lock:
+                rows = self.conn.execute(
+                    "SELECT canonical_url, url FROM posted_urls"
+                    " WHERE namespace = ? AND canonical_url > ?"
+                    " ORDER BY canonical_url LIMIT 1000",
+                    (self.namespace, last_canonical_url)
+                ).fetchall()
+            
+            if not rows:
+                return
+            
+            for _, url in rows:
+                yield url
+            last_canonical_url = rows[-1][0]
+    
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self.conn.close()
\ No newline at end of file